@@ -9,7 +9,16 @@
 #   WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
 #   See the License for the specific language governing permissions and
 #   limitations under the License.
-from ensembl.database import DBConnection
+import hashlib
+import threading
+from collections import namedtuple
+from concurrent import futures
+from functools import lru_cache
+
+import sqlalchemy as db
+from ensembl.production.metadata.api.models import EnsemblRelease, GenomeRelease, GenomeDataset
+from ensembl.production.metadata.grpc.adaptors.indexes.dimensions import DimensionTables
+from ensembl.production.metadata.grpc.adaptors.replicas import ReplicatedDB
 from ensembl.production.metadata.grpc.config import MetadataConfig as config
 
 
@@ -19,8 +28,54 @@ from ensembl.production.metadata.grpc.config import MetadataConfig as config
 
 
 class BaseAdaptor:
-    def __init__(self, metadata_uri):
-        self.metadata_db = DBConnection(metadata_uri, pool_size=config.pool_size, pool_recycle=config.pool_recycle)
+    def __init__(self, metadata_uri, metadata_replica_uris=()):
+        self.metadata_db = ReplicatedDB.shared(metadata_uri, metadata_replica_uris)
+        self.dimensions = DimensionTables.shared(metadata_uri, self.metadata_db)
+
+    def fetch_release_fingerprint(self):
+        """
+        Digest of the release state of the metadata DB.
+
+        The fingerprint changes whenever a release is created or updated (e.g. a new current release), or when
+        genomes or datasets are attached to a release, i.e. whenever previously computed responses may be
+        stale.
+
+        Returns:
+            str: Hexadecimal SHA1 digest.
+        """
+        releases_select = db.select(
+            EnsemblRelease.release_id,
+            EnsemblRelease.version,
+            EnsemblRelease.is_current,
+            EnsemblRelease.release_date,
+            EnsemblRelease.site_id,
+        ).order_by(EnsemblRelease.release_id)
+        genome_releases_select = db.select(
+            db.func.count(GenomeRelease.genome_release_id),
+            db.func.max(GenomeRelease.genome_release_id),
+            db.func.sum(GenomeRelease.is_current),
+        )
+        genome_datasets_select = db.select(
+            db.func.count(GenomeDataset.genome_dataset_id),
+            db.func.max(GenomeDataset.genome_dataset_id),
+            db.func.count(GenomeDataset.release_id),
+        )
+        with self.metadata_db.release_scope() as session:
+            state = (
+                [tuple(release) for release in session.execute(releases_select).all()],
+                tuple(session.execute(genome_releases_select).one()),
+                tuple(session.execute(genome_datasets_select).one()),
+            )
+        return hashlib.sha1(repr(state).encode()).hexdigest()
+
+
+@lru_cache(maxsize=None)
+def row_type(*fields):
+    """
+    Named tuple class for result rows assembled in Python, giving access to the entities by class name like
+    the rows returned by SQLAlchemy (e.g. row.Genome).
+    """
+    return namedtuple("Row", fields)
 
 
 def check_parameter(param):
@@ -29,3 +84,86 @@ def check_parameter(param):
     if param is not None and not isinstance(param, list):
         param = [param]
     return param
+
+
+_chunk_executor = None
+_chunk_executor_lock = threading.Lock()
+
+
+def chunk_executor():
+    """The bounded thread pool the chunks of big IN filters are fetched on, shared by all the adaptors."""
+    global _chunk_executor
+    with _chunk_executor_lock:
+        if _chunk_executor is None:
+            _chunk_executor = futures.ThreadPoolExecutor(
+                max_workers=config.in_chunk_workers, thread_name_prefix="in-chunks"
+            )
+        return _chunk_executor
+
+
+def fetch_in_chunks(values, fetch, key=None):
+    """
+    Fetch the rows of a query filtering on a list of values, in chunks of at most config.in_chunk_size values
+    so that big filters do not produce huge IN lists.
+
+    A single chunk is fetched in the calling thread. Several chunks are fetched in parallel on the chunk
+    executor, each in a session of its own (the sessions of a unit of work are not shared with the pool
+    threads), and their rows are concatenated in chunk order.
+
+    Args:
+        values (list or None): Values of the filter, as returned by check_parameter().
+        fetch (Callable[[list or None], list]): Fetches the rows of the query filtered on some of the values.
+        key (Callable or None): Sort key of the rows matching the ORDER BY of the query, to restore the order
+            of the rows across chunks. Rows the query orders equally keep the order of their chunks.
+
+    Returns:
+        list: The rows, as a single query with all the values would return them.
+    """
+    chunks = _chunks(values)
+    if len(chunks) == 1:
+        return fetch(chunks[0])
+    rows = []
+    for chunk_rows in chunk_executor().map(fetch, chunks):
+        rows += chunk_rows
+    if key is not None:
+        rows.sort(key=key)
+    return rows
+
+
+def stream_in_chunks(values, stream, key=None):
+    """
+    Stream the rows of a query filtering on a list of values, in the chunks of fetch_in_chunks() streamed one
+    after the other. Ordered rows spread over several chunks cannot be merged as they come, they are fetched
+    with fetch_in_chunks() first.
+
+    Args:
+        values (list or None): Values of the filter, as returned by check_parameter().
+        stream (Callable[[list or None], Iterator]): Streams the rows of the query filtered on some of the
+            values.
+        key (Callable or None): Sort key of the rows matching the ORDER BY of the query, None if it is
+            unordered.
+
+    Yields:
+        The rows.
+    """
+    chunks = _chunks(values)
+    if key is not None and len(chunks) > 1:
+        yield from fetch_in_chunks(values, lambda chunk: list(stream(chunk)), key)
+        return
+    for chunk in chunks:
+        yield from stream(chunk)
+
+
+def _chunks(values):
+    """Chunks of at most config.in_chunk_size values, a single chunk (possibly None) for small filters."""
+    size = config.in_chunk_size
+    if values is None or len(values) <= size:
+        return [values]
+    # A value repeated in two chunks would return its rows twice
+    values = list(dict.fromkeys(values))
+    return [values[start:start + size] for start in range(0, len(values), size)]
+
+
+def collation_key(value):
+    """Sort key of a string column ordered like the case-insensitive MySQL collations, NULL first."""
+    return (value is not None, value.lower() if isinstance(value, str) else value)
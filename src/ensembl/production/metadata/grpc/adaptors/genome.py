@@ -10,25 +10,133 @@
 #   See the License for the specific language governing permissions and
 #   limitations under the License.
 
+from functools import lru_cache
+
 import sqlalchemy as db
-from sqlalchemy.orm import aliased
-from ensembl.database import DBConnection
 from ensembl.ncbi_taxonomy.models import NCBITaxaName
-from ensembl.production.metadata.grpc.adaptors.base import BaseAdaptor, check_parameter
-from ensembl.production.metadata.api.models import Genome, Organism, Assembly, OrganismGroup, OrganismGroupMember, \
-    GenomeRelease, EnsemblRelease, EnsemblSite, AssemblySequence, GenomeDataset, Dataset, DatasetType, DatasetSource, \
-    Attribute, DatasetAttribute
+from ensembl.production.metadata.grpc.adaptors.base import check_parameter, row_type, fetch_in_chunks, \
+    stream_in_chunks, collation_key
+from ensembl.production.metadata.grpc.adaptors.indexes.intervals import ReleaseIntervals
+from ensembl.production.metadata.grpc.adaptors.records import Projection, projected_columns, \
+    projected_values, record_projection
+from ensembl.production.metadata.grpc.adaptors.replicas import ReplicatedDB
+from ensembl.production.metadata.grpc.adaptors.search import GenomeSearchAdaptor
+from ensembl.production.metadata.api.models import Genome, Organism, Assembly, OrganismGroup, \
+    OrganismGroupMember, GenomeRelease, AssemblySequence, GenomeDataset, Dataset, DatasetAttribute
 import logging
 
 from ensembl.production.metadata.grpc.config import MetadataConfig
 
 logger = logging.getLogger(__name__)
 
-
-class GenomeAdaptor(BaseAdaptor):
-    def __init__(self, metadata_uri: str, taxonomy_uri: str):
-        super().__init__(metadata_uri)
-        self.taxonomy_db = DBConnection(taxonomy_uri, pool_size=MetadataConfig.pool_size, pool_recycle=MetadataConfig.pool_recycle)
+# Columns read from the genome rows by the protobuf builders and the adaptor itself, selected in lean mode
+GENOME_PROJECTIONS = (
+    Projection(Genome, "genome_id", "genome_uuid", "assembly_id", "organism_id", "created"),
+    Projection(Organism, "organism_id", "organism_uuid", "taxonomy_id", "species_taxonomy_id", "common_name",
+               "strain", "strain_type", "scientific_name", "scientific_parlance_name", "ensembl_name"),
+    Projection(Assembly, "assembly_id", "assembly_uuid", "accession", "level", "name", "ensembl_name",
+               "is_reference", "tol_id", "ucsc_name", "url_name"),
+)
+# Columns read from the sequence rows by the protobuf builders, selected in lean mode
+SEQUENCE_PROJECTIONS = (
+    Projection(Genome, "genome_id", "genome_uuid"),
+    Projection(Assembly, "assembly_id", "assembly_uuid", "accession", "level", "name"),
+    Projection(AssemblySequence, "assembly_sequence_id", "accession", "name", "chromosomal",
+               "chromosome_rank", "length", "sequence_location", "md5", "sha512t24u"),
+)
+
+
+# Filters of fetch_genomes, each testing a column against the expanding bound parameter of the same name
+GENOME_FILTERS = {
+    "genome_id": lambda param: Genome.genome_id.in_(param),
+    "genome_uuid": lambda param: Genome.genome_uuid.in_(param),
+    # genome_tag value is either in Assembly.url_name or tol_id
+    "genome_tag": lambda param: db.or_(Assembly.url_name.in_(param), Assembly.tol_id.in_(param)),
+    "organism_uuid": lambda param: Organism.organism_uuid.in_(param),
+    "assembly_uuid": lambda param: Assembly.assembly_uuid.in_(param),
+    "assembly_accession": lambda param: Assembly.accession.in_(param),
+    "assembly_name": lambda param: db.func.lower(Assembly.name).in_(param),
+    "assembly_default": lambda param: db.func.lower(Assembly.assembly_default).in_(param),
+    "ensembl_name": lambda param: Organism.ensembl_name.in_(param),
+    "taxonomy_id": lambda param: Organism.taxonomy_id.in_(param),
+    "organism_group_id": lambda param: OrganismGroupMember.organism_group_id.in_(param),
+}
+# Filters testing a single column, whose values can be split into chunks without fetching a genome twice
+CHUNKED_GENOME_FILTERS = set(GENOME_FILTERS) - {"genome_tag"}
+# Orders of fetch_genomes: the column of each, given whether the organism group members are selected
+GENOME_ORDERS = {
+    # Same order as the former order_by("ensembl_name"), which SQLAlchemy resolved to the assembly name,
+    # or to the organism name when the organism group entities were selected
+    "ensembl_name": lambda group: Organism.ensembl_name if group else Assembly.ensembl_name,
+    # Primary key, read in the order of its index without sorting
+    "genome_id": lambda group: Genome.genome_id,
+}
+
+
+@lru_cache(maxsize=256)
+def genomes_statement(filters, lean=False, releases=None, probe=False, order_by="ensembl_name"):
+    """
+    The fetch_genomes query of a shape, built once and reused with the values of its bound parameters, so that
+    it is neither assembled nor compiled again (SQLAlchemy caches the compiled SQL of each statement).
+
+    Args:
+        filters (Tuple[str]): Names of the GENOME_FILTERS applied.
+        lean (bool): Select the GENOME_PROJECTIONS columns instead of the Genome, Organism and Assembly
+            entities, and the records of the OrganismGroupMember and GenomeRelease entities.
+        releases (str or None): "unreleased" for the genomes without release, "all" or "current" to select
+            their GenomeRelease of the releases given by the release_id parameter, any or the current one.
+        probe (bool): Query of whether any of the genomes has a released dataset instead.
+        order_by (str or None): One of GENOME_ORDERS, None for unordered rows.
+
+    Returns:
+        Select: The statement.
+    """
+    group = "organism_group_id" in filters
+    if probe:
+        entities = [Genome.genome_id]
+    else:
+        entities = projected_columns(GENOME_PROJECTIONS) if lean else [Genome, Organism, Assembly]
+    genome_select = db.select(*entities).select_from(Genome) \
+        .join(Organism, Organism.organism_id == Genome.organism_id) \
+        .join(Assembly, Assembly.assembly_id == Genome.assembly_id)
+    if group:
+        if not probe:
+            genome_select = genome_select.add_columns(
+                *(record_projection(OrganismGroupMember).columns if lean else [OrganismGroupMember])
+            )
+        genome_select = genome_select.join(
+            OrganismGroupMember, Organism.organism_id == OrganismGroupMember.organism_id
+        )
+    for name in filters:
+        genome_select = genome_select.filter(GENOME_FILTERS[name](db.bindparam(name, expanding=True)))
+
+    if probe:
+        # copy genome_select as we don't want to include GenomeDataset
+        # because it results in multiple row for a given genome (genome can have many datasets)
+        return genome_select.join(GenomeDataset, Genome.genome_id == GenomeDataset.genome_id) \
+            .filter(GenomeDataset.release_id.isnot(None)) \
+            .limit(1)
+    if releases == "unreleased":
+        # the tilde (~) symbol is used for negation.
+        genome_select = genome_select.filter(~Genome.genome_releases.any())
+    elif releases is not None:
+        genome_select = genome_select.add_columns(
+            *(record_projection(GenomeRelease).columns if lean else [GenomeRelease])
+        ).join(GenomeRelease, Genome.genome_id == GenomeRelease.genome_id) \
+            .filter(GenomeRelease.release_id.in_(db.bindparam("release_id", expanding=True)))
+        if releases == "current":
+            genome_select = genome_select.filter(GenomeRelease.is_current == 1)
+    if order_by is not None:
+        genome_select = genome_select.order_by(GENOME_ORDERS[order_by](group))
+    return genome_select
+
+
+class GenomeAdaptor(GenomeSearchAdaptor):
+    def __init__(self, metadata_uri: str, taxonomy_uri: str, metadata_replica_uris=(),
+                 taxonomy_replica_uris=()):
+        super().__init__(metadata_uri, metadata_replica_uris)
+        self.intervals = ReleaseIntervals.shared(metadata_uri, self.metadata_db)
+        self.taxonomy_db = ReplicatedDB.shared(taxonomy_uri, taxonomy_replica_uris)
 
     def fetch_taxonomy_names(self, taxonomy_ids, synonyms=None):
 
@@ -43,25 +151,29 @@ class GenomeAdaptor(BaseAdaptor):
         ] if len(check_parameter(synonyms)) == 0 else synonyms
         required_class_name = ["genbank common name", "scientific name"]
         taxons = {}
-        with self.taxonomy_db.session_scope() as session:
-            for tid in taxonomy_ids:
-                taxons[tid] = {"scientific_name": None, "genbank_common_name": None, "synonym": []}
-
-                taxonomyname_query = db.select(
-                    NCBITaxaName.name,
-                    NCBITaxaName.name_class,
-                ).filter(
-                    NCBITaxaName.taxon_id == tid,
-                    NCBITaxaName.name_class.in_(required_class_name + synonyms),
-                )
+        for tid in taxonomy_ids:
+            taxons[tid] = {"scientific_name": None, "genbank_common_name": None, "synonym": []}
+
+        # The names of all the taxa are fetched at once
+        def fetch(taxon_ids):
+            taxonomyname_query = db.select(
+                NCBITaxaName.taxon_id,
+                NCBITaxaName.name,
+                NCBITaxaName.name_class,
+            ).filter(
+                NCBITaxaName.taxon_id.in_(taxon_ids),
+                NCBITaxaName.name_class.in_(required_class_name + synonyms),
+            )
+            with self.taxonomy_db.session_scope() as session:
+                return session.execute(taxonomyname_query).all()
 
-                for taxon_name in session.execute(taxonomyname_query).all():
-                    if taxon_name[1] in synonyms:
-                        taxons[tid]['synonym'].append(taxon_name[0])
-                    if taxon_name[1] in required_class_name:
-                        taxon_format_name = "_".join(taxon_name[1].split(' '))
-                        taxons[tid][taxon_format_name] = taxon_name[0]
-            return taxons
+        for tid, name, name_class in fetch_in_chunks(list(taxons), fetch):
+            if name_class in synonyms:
+                taxons[tid]['synonym'].append(name)
+            if name_class in required_class_name:
+                taxon_format_name = "_".join(name_class.split(' '))
+                taxons[tid][taxon_format_name] = name
+        return taxons
 
     def fetch_taxonomy_ids(self, taxonomy_names):
         taxids = []
@@ -78,10 +190,12 @@ class GenomeAdaptor(BaseAdaptor):
                 taxids.append(taxid[0])
         return taxids
 
-    def fetch_genomes(self, genome_id=None, genome_uuid=None, genome_tag=None, organism_uuid=None, assembly_uuid=None,
-                      assembly_accession=None, assembly_name=None, use_default_assembly=False, ensembl_name=None,
-                      taxonomy_id=None, group=None, group_type=None, allow_unreleased=False, unreleased_only=False,
-                      site_name=None, release_type=None, release_version=None, current_only=True):
+    def fetch_genomes(self, genome_id=None, genome_uuid=None, genome_tag=None, organism_uuid=None,
+                      assembly_uuid=None, assembly_accession=None, assembly_name=None,
+                      use_default_assembly=False, ensembl_name=None, taxonomy_id=None, group=None,
+                      group_type=None, allow_unreleased=False, unreleased_only=False, site_name=None,
+                      release_type=None, release_version=None, current_only=True, lean=False,
+                      order_by="ensembl_name", stream=False):
         """
         Fetches genome information based on the specified parameters.
 
@@ -99,16 +213,27 @@ class GenomeAdaptor(BaseAdaptor):
             group (Union[str, List[str]]): The name(s) of the organism group(s) to filter by.
             group_type (Union[str, List[str]]): The type(s) of the organism group(s) to filter by.
             allow_unreleased (bool): Whether to fetch unreleased genomes too or not (default: False).
-            unreleased_only (bool): Fetch only unreleased genomes (default: False). allow_unreleased is used by gRPC
+            unreleased_only (bool): Fetch only unreleased genomes (default: False). allow_unreleased is used
+                by gRPC
                                      to fetch both released and unreleased genomes, while unreleased_only
                                      is used in production pipelines (fetches only unreleased genomes)
             site_name (str): The name of the Ensembl site to filter by.
             release_type (str): The type of the Ensembl release to filter by.
-            release_version (int): The maximum version of the Ensembl release to filter by.
+            release_version (int): The maximum version of the Ensembl release to filter by. Each genome is
+                returned once, with its latest release up to that version.
             current_only (bool): Whether to fetch only current genomes.
+            lean (bool): Select only the Genome, Organism and Assembly columns listed in GENOME_PROJECTIONS,
+                returned as named tuples instead of ORM instances.
+            order_by (str or None): Order of the genomes, one of GENOME_ORDERS: "ensembl_name" (default), or
+                "genome_id" to read them in the order of the genome primary key. None for unordered genomes,
+                which spares the DB a sort of the whole result.
+            stream (bool): Return an iterator fetching the genomes incrementally, with a server-side cursor on
+                a session of its own, instead of a list. Best unordered, as the DB then returns the first rows
+                without sorting them all.
 
         Returns:
-            List[Tuple[Genome, Organism, Assembly, EnsemblRelease]]: A list of tuples containing the fetched genome information.
+            List[Tuple[Genome, Organism, Assembly, EnsemblRelease]]: A list of tuples containing the fetched
+                genome information.
             Each tuple contains the following elements:
                 - Genome: An instance of the Genome class.
                 - Organism: An instance of the Organism class.
@@ -118,12 +243,14 @@ class GenomeAdaptor(BaseAdaptor):
         Notes:
             - The parameters are not mutually exclusive, meaning more than one of them can be provided at a time.
             - The function uses a database session to execute the query and returns the results as a list of tuples.
-            - The results are ordered by the Ensembl name.
+            - The results are ordered by the Ensembl name, unless another order_by is given.
 
         Example usage:
             genome_info = fetch_genomes(genome_id=12345)
         """
         # Parameter validation
+        if order_by is not None and order_by not in GENOME_ORDERS:
+            raise ValueError(f"Unknown genome order: {order_by}")
         genome_id = check_parameter(genome_id)
         genome_uuid = check_parameter(genome_uuid)
         genome_tag = check_parameter(genome_tag)
@@ -136,114 +263,198 @@ class GenomeAdaptor(BaseAdaptor):
         group = check_parameter(group)
         group_type = check_parameter(group_type)
 
-        # Construct the initial database query
-        genome_select = db.select(
-            Genome, Organism, Assembly
-        ).select_from(Genome) \
-            .join(Organism, Organism.organism_id == Genome.organism_id) \
-            .join(Assembly, Assembly.assembly_id == Genome.assembly_id)
-
+        # Bound parameter values of the filters in use. The query of each combination of filters (its shape)
+        # is built once by genomes_statement() and then reused, only the parameter values change.
+        params = {
+            "genome_id": genome_id,
+            "genome_uuid": genome_uuid,
+            "genome_tag": genome_tag,
+            "organism_uuid": organism_uuid,
+            "assembly_uuid": assembly_uuid,
+            "assembly_accession": assembly_accession,
+            "ensembl_name": ensembl_name,
+            "taxonomy_id": taxonomy_id,
+        }
+        if assembly_name is not None:
+            lowered_assemblies = [name.lower() for name in assembly_name]
+            params["assembly_default" if use_default_assembly else "assembly_name"] = lowered_assemblies
         # Apply group filtering if group parameter is provided
+        # OrganismGroup comes from the in-memory dimension tables, only the members are fetched
         if group:
             group_type = group_type if group_type else ['Division']
-            genome_select = db.select(
-                Genome, Organism, Assembly, OrganismGroup, OrganismGroupMember
-            ).join(Genome.assembly).join(Genome.organism) \
-                .join(Organism.organism_group_members) \
-                .join(OrganismGroupMember.organism_group) \
-                .filter(OrganismGroup.type.in_(group_type)).filter(OrganismGroup.name.in_(group))
-
-        # Apply additional filters based on the provided parameters
-        if genome_id is not None:
-            genome_select = genome_select.filter(Genome.genome_id.in_(genome_id))
-
-        if genome_uuid is not None:
-            genome_select = genome_select.filter(Genome.genome_uuid.in_(genome_uuid))
-
-        if genome_tag is not None:
-            genome_select = genome_select.filter(
-                db.or_(
-                    Assembly.url_name.in_(genome_tag),
-                    Assembly.tol_id.in_(genome_tag)
-                )
-            )
-
-        if organism_uuid is not None:
-            genome_select = genome_select.filter(Organism.organism_uuid.in_(organism_uuid))
-
-        if assembly_uuid is not None:
-            genome_select = genome_select.filter(Assembly.assembly_uuid.in_(assembly_uuid))
-
-        if assembly_accession is not None:
-            genome_select = genome_select.filter(Assembly.accession.in_(assembly_accession))
+            params["organism_group_id"] = self.dimensions.organism_group_ids(group, group_type)
+        filters = tuple(name for name in GENOME_FILTERS if params.get(name) is not None)
+        params = {name: params[name] for name in filters}
+        # The biggest filter is sent in chunks of values if it is too big for a single IN list
+        chunked = max(
+            (name for name in filters if name in CHUNKED_GENOME_FILTERS), key=lambda name: len(params[name]),
+            default=None
+        )
 
-        if assembly_name is not None:
-            # case() function is used to conditionally select between columns, sql equivalent is:
-            # CASE
-            #     WHEN :use_default_assembly = 1 THEN assembly.assembly_default
-            #     ELSE assembly.name
-            # END
-            conditional_column = db.case(
-                # literal is used to prevent evaluating use_default_assembly to a boolean (True or False)
-                [(db.literal(use_default_assembly) == 1, Assembly.assembly_default)],
-                else_=Assembly.name
-            )
-            lowered_assemblies = [name.lower() for name in assembly_name]
-            genome_select = genome_select.filter(db.func.lower(conditional_column).in_(lowered_assemblies))
+        def chunk_params(values):
+            return params if chunked is None else dict(params, **{chunked: values})
 
-        if ensembl_name is not None:
-            genome_select = genome_select.filter(Organism.ensembl_name.in_(ensembl_name))
+        def execute(statement, key=None):
+            def fetch(values):
+                with self.metadata_db.session_scope() as session:
+                    session.expire_on_commit = False
+                    return session.execute(statement, chunk_params(values)).all()
 
-        if taxonomy_id is not None:
-            genome_select = genome_select.filter(Organism.taxonomy_id.in_(taxonomy_id))
+            return fetch_in_chunks(params.get(chunked), fetch, key)
 
+        is_genome_released = False
+        max_version = None
+        release_ids = None
+        releases = None
         if allow_unreleased:
             # fetch everything (released + unreleased)
             pass
         elif unreleased_only:
             # fetch unreleased only
             # this filter will get all Genome entries where there's no associated GenomeRelease
-            # the tilde (~) symbol is used for negation.
-            genome_select = genome_select.filter(~Genome.genome_releases.any())
+            releases = "unreleased"
         else:
             # fetch released only
             # Check if genome is released
             # TODO: why did I add this check?! -> removing this breaks the test_update tests
-            with self.metadata_db.session_scope() as session:
-                session.expire_on_commit = False
-                # copy genome_select as we don't want to include GenomeDataset
-                # because it results in multiple row for a given genome (genome can have many datasets)
-                check_query = genome_select
-                prep_query = check_query.add_columns(GenomeDataset) \
-                    .join(GenomeDataset, Genome.genome_id == GenomeDataset.genome_id) \
-                    .filter(GenomeDataset.release_id.isnot(None))
-                is_genome_released = session.execute(prep_query).first()
+            is_genome_released = bool(execute(genomes_statement(filters, probe=True)))
 
             if is_genome_released:
                 # Include release related info if released_only is True
-                genome_select = genome_select.add_columns(GenomeRelease, EnsemblRelease, EnsemblSite) \
-                    .join(GenomeRelease, Genome.genome_id == GenomeRelease.genome_id) \
-                    .join(EnsemblRelease, GenomeRelease.release_id == EnsemblRelease.release_id) \
-                    .join(EnsemblSite, EnsemblSite.site_id == EnsemblRelease.site_id)
-
+                # EnsemblRelease and EnsemblSite come from the in-memory dimension tables: the release filters
+                # are resolved to release IDs
                 if release_version is not None and release_version > 0:
-                    # if release is specified
-                    genome_select = genome_select.filter(EnsemblRelease.version <= release_version)
+                    # if release is specified, the genomes are fetched as of that release: their latest genome
+                    # release up to it is looked up in the release interval index instead of joining
+                    # GenomeRelease
+                    max_version = float(release_version)
                     current_only = False
 
-                if current_only:
-                    genome_select = genome_select.filter(GenomeRelease.is_current == 1)
+                release_ids = self.dimensions.release_ids(
+                    max_version=max_version,
+                    release_type=check_parameter(release_type),
+                    site_name=check_parameter(site_name)
+                )
+                if max_version is None:
+                    releases = "current" if current_only else "all"
+                    params["release_id"] = release_ids
+                else:
+                    release_ids = set(release_ids)
+
+        # Selected entities, in order: Genome, Organism, Assembly, then OrganismGroupMember and GenomeRelease
+        # if joined
+        projections = list(GENOME_PROJECTIONS)
+        if group:
+            projections.append(record_projection(OrganismGroupMember))
+        if releases in ("all", "current"):
+            projections.append(record_projection(GenomeRelease))
+
+        def order_key(result):
+            # Value of the column genomes_statement() orders by, in the Genome, Organism or Assembly entity
+            column = GENOME_ORDERS[order_by](group)
+            entities = projected_values(result, projections) if lean else result
+            entity = entities[(Genome, Organism, Assembly).index(column.class_)]
+            return collation_key(getattr(entity, column.key))
+
+        statement = genomes_statement(filters, lean=lean, releases=releases, order_by=order_by)
+        key = order_key if order_by is not None else None
+        if stream:
+            def stream_results(values):
+                with self.metadata_db.stream_scope() as session:
+                    session.expire_on_commit = False
+                    yield from session.execute(
+                        statement, chunk_params(values),
+                        execution_options={"yield_per": MetadataConfig.stream_batch_size}
+                    )
+
+            return self._genome_rows(
+                stream_in_chunks(params.get(chunked), stream_results, key), lean, projections, group,
+                is_genome_released, max_version, release_ids
+            )
+        return list(self._genome_rows(
+            execute(statement, key=key), lean, projections, group, is_genome_released, max_version,
+            release_ids
+        ))
+
+    def _genome_rows(self, results, lean, projections, group, is_genome_released, max_version, release_ids):
+        """
+        Rows of fetch_genomes, built from the rows of its query as they come.
+        """
+        fields = ["Genome", "Organism", "Assembly"]
+        if group:
+            fields += ["OrganismGroup", "OrganismGroupMember"]
+        if is_genome_released:
+            fields += ["GenomeRelease", "EnsemblRelease", "EnsemblSite"]
+        row = row_type(*fields)
+        for result in results:
+            entities = projected_values(result, projections) if lean else list(result)
+            values = entities[:3]
+            if group:
+                values += [self.dimensions.organism_group(entities[3].organism_group_id), entities[3]]
+            if is_genome_released:
+                if max_version is None:
+                    genome_release = entities[-1]
+                else:
+                    genome_release = self.intervals.genome_release_as_of(
+                        values[0].genome_id, max_version, release_ids
+                    )
+                    if genome_release is None:
+                        continue
+                release = self.dimensions.release(genome_release.release_id)
+                values += [genome_release, release, self.dimensions.site(release.site_id)]
+            yield row(*values)
+
+    def fetch_genomes_by_uuids(self, genome_uuids, release_version=None, allow_unreleased=False):
+        """
+        Fetch several genomes by UUID with a few set-based queries, as fetch_genomes would fetch each of them.
+
+        Args:
+            genome_uuids (List[str]): The UUIDs of the genomes.
+            release_version (float or None): The maximum version of the Ensembl release to filter by.
+            allow_unreleased (bool): Whether to fetch unreleased genomes too or not (default: False).
 
-                if site_name is not None:
-                    genome_select = genome_select.add_columns(EnsemblSite).filter(EnsemblSite.name == site_name)
+        Returns:
+            Dict[str, list]: The lean rows fetch_genomes(genome_uuid=...) returns for each genome, keyed by
+                genome_uuid. Unknown genomes have no entry.
+        """
+        genome_uuids = check_parameter(genome_uuids)
+        if allow_unreleased:
+            batches = [(genome_uuids, True)]
+        else:
+            # fetch_genomes only applies the release filters to genomes with a released dataset, which must
+            # then be fetched apart from the others
+            released = self.fetch_released_genome_uuids(genome_uuids)
+            batches = [
+                ([genome_uuid for genome_uuid in genome_uuids if genome_uuid in released], False),
+                ([genome_uuid for genome_uuid in genome_uuids if genome_uuid not in released], True),
+            ]
+        genomes = {}
+        for uuids, unreleased in batches:
+            if not uuids:
+                continue
+            for genome in self.fetch_genomes(genome_uuid=uuids, release_version=release_version,
+                                             allow_unreleased=unreleased, lean=True, order_by=None):
+                genomes.setdefault(genome.Genome.genome_uuid, []).append(genome)
+        return genomes
+
+    def fetch_released_genome_uuids(self, genome_uuids):
+        """
+        The genomes having a dataset attached to a release, among the given ones.
 
-                if release_type is not None:
-                    genome_select = genome_select.filter(EnsemblRelease.release_type == release_type)
+        Args:
+            genome_uuids (List[str]): The UUIDs of the genomes.
 
-        # print(f"genome_select query ====> {str(genome_select)}")
-        with self.metadata_db.session_scope() as session:
-            session.expire_on_commit = False
-            return session.execute(genome_select.order_by("ensembl_name")).all()
+        Returns:
+            Set[str]: The UUIDs of the released genomes.
+        """
+        def fetch(uuids):
+            released_select = db.select(Genome.genome_uuid).distinct() \
+                .join(GenomeDataset, Genome.genome_id == GenomeDataset.genome_id) \
+                .filter(Genome.genome_uuid.in_(uuids), GenomeDataset.release_id.isnot(None))
+            with self.metadata_db.session_scope() as session:
+                return session.execute(released_select).scalars().all()
+
+        return set(fetch_in_chunks(check_parameter(genome_uuids), fetch))
 
     def fetch_genomes_by_genome_uuid(self, genome_uuid, allow_unreleased=False, site_name=None, release_type=None,
                                      release_version=None, current_only=True):
@@ -309,48 +520,9 @@ class GenomeAdaptor(BaseAdaptor):
             current_only=current_only,
         )
 
-    def fetch_genome_by_keyword(self, keyword=None, release_version=None):
-        """
-        Fetches genomes based on a keyword and release version.
-
-        Args:
-            keyword (str or None): Keyword to search for in various attributes of genomes, assemblies, and organisms.
-            release_version (int or None): Release version to filter by. If set to 0 or None, fetches only current genomes.
-
-        Returns:
-            list: A list of fetched genomes matching the keyword and release version.
-        """
-        genome_query = db.select(
-            Genome, GenomeRelease, EnsemblRelease, Assembly, Organism, EnsemblSite
-        ).select_from(Genome) \
-            .outerjoin(Organism, Organism.organism_id == Genome.organism_id) \
-            .outerjoin(Assembly, Assembly.assembly_id == Genome.assembly_id) \
-            .outerjoin(GenomeRelease, Genome.genome_id == GenomeRelease.genome_id) \
-            .outerjoin(EnsemblRelease, GenomeRelease.release_id == EnsemblRelease.release_id) \
-            .outerjoin(EnsemblSite, EnsemblSite.site_id == EnsemblRelease.site_id)
-
-        if keyword is not None:
-            genome_query = genome_query.where(db.or_(db.func.lower(Assembly.tol_id) == keyword.lower(),
-                                                     db.func.lower(Assembly.accession) == keyword.lower(),
-                                                     db.func.lower(Assembly.name) == keyword.lower(),
-                                                     db.func.lower(Assembly.ensembl_name) == keyword.lower(),
-                                                     db.func.lower(Organism.common_name) == keyword.lower(),
-                                                     db.func.lower(Organism.scientific_name) == keyword.lower(),
-                                                     db.func.lower(
-                                                         Organism.scientific_parlance_name) == keyword.lower(),
-                                                     db.func.lower(Organism.species_taxonomy_id) == keyword.lower()))
-
-        if release_version == 0 or release_version is None:
-            genome_query = genome_query.where(EnsemblRelease.is_current == 1)
-        else:
-            genome_query = genome_query.where(EnsemblRelease.version <= release_version)
-
-        with self.metadata_db.session_scope() as session:
-            session.expire_on_commit = False
-            return session.execute(genome_query).all()
-
     def fetch_sequences(self, genome_id=None, genome_uuid=None, assembly_uuid=None, assembly_accession=None,
-                        assembly_sequence_accession=None, assembly_sequence_name=None, chromosomal_only=False):
+                        assembly_sequence_accession=None, assembly_sequence_name=None, chromosomal_only=False,
+                        lean=False, after_sequence_id=None, limit=None):
         """
         Fetches sequences based on the provided parameters.
 
@@ -362,9 +534,15 @@ class GenomeAdaptor(BaseAdaptor):
             assembly_sequence_accession (str or None): Assembly Sequence accession to filter by.
             assembly_sequence_name (str or None): Assembly Sequence name to filter by.
             chromosomal_only (bool): Flag indicating whether to fetch only chromosomal sequences.
+            lean (bool): Select only the columns listed in SEQUENCE_PROJECTIONS, returned as named tuples
+                instead of ORM instances.
+            after_sequence_id (int or None): Only the sequences past this assembly_sequence_id, to fetch the
+                next page of a listing (keyset pagination).
+            limit (int or None): Maximum number of sequences to fetch.
 
         Returns:
-            list: A list of fetched sequences.
+            list: A list of fetched sequences, by assembly_sequence_id when paged (after_sequence_id or limit
+                given).
         """
         genome_id = check_parameter(genome_id)
         genome_uuid = check_parameter(genome_uuid)
@@ -374,7 +552,7 @@ class GenomeAdaptor(BaseAdaptor):
         assembly_sequence_name = check_parameter(assembly_sequence_name)
 
         seq_select = db.select(
-            Genome, Assembly, AssemblySequence
+            *(projected_columns(SEQUENCE_PROJECTIONS) if lean else (Genome, Assembly, AssemblySequence))
         ).select_from(Genome) \
             .join(Assembly, Assembly.assembly_id == Genome.assembly_id) \
             .join(AssemblySequence, AssemblySequence.assembly_id == Assembly.assembly_id)
@@ -402,9 +580,21 @@ class GenomeAdaptor(BaseAdaptor):
         if assembly_sequence_name is not None:
             seq_select = seq_select.filter(AssemblySequence.name == assembly_sequence_name)
 
+        if after_sequence_id is not None or limit is not None:
+            # Pages are read by seeking past the primary key of the last sequence, not with OFFSET
+            seq_select = seq_select.order_by(AssemblySequence.assembly_sequence_id)
+            if after_sequence_id is not None:
+                seq_select = seq_select.filter(AssemblySequence.assembly_sequence_id > after_sequence_id)
+            if limit is not None:
+                seq_select = seq_select.limit(limit)
+
         with self.metadata_db.session_scope() as session:
             session.expire_on_commit = False
-            return session.execute(seq_select).all()
+            results = session.execute(seq_select).all()
+        if not lean:
+            return results
+        row = row_type("Genome", "Assembly", "AssemblySequence")
+        return [row(*projected_values(result, SEQUENCE_PROJECTIONS)) for result in results]
 
     def fetch_sequences_by_genome_uuid(self, genome_uuid, chromosomal_only=False):
         return self.fetch_sequences(
@@ -418,9 +608,143 @@ class GenomeAdaptor(BaseAdaptor):
             assembly_accession=assembly_accession, chromosomal_only=chromosomal_only
         )
 
-    def fetch_genome_datasets(self, genome_id=None, genome_uuid=None, organism_uuid=None, allow_unreleased=False,
-                              unreleased_only=False, dataset_uuid=None, dataset_name=None, dataset_source=None,
-                              dataset_type=None, release_version=None, dataset_attributes=None):
+    @staticmethod
+    def _dataset_projections(dataset_attributes):
+        """Record projections of the entities selected by a lean _genome_datasets_select."""
+        entities = [Genome, GenomeDataset, Dataset] + ([DatasetAttribute] if dataset_attributes else [])
+        return [record_projection(entity) for entity in entities]
+
+    def _read_dataset_results(self, session, genome_select, dataset_attributes, lean):
+        """
+        Execute a _genome_datasets_select, and return its rows as records if it is lean.
+        """
+        results = session.execute(genome_select).all()
+        if not lean:
+            return results
+        projections = self._dataset_projections(dataset_attributes)
+        row = row_type(*[projection.name for projection in projections])
+        return [row(*projected_values(result, projections)) for result in results]
+
+    def _genome_datasets_select(self, genome_id=None, genome_uuid=None, organism_uuid=None, dataset_uuid=None,
+                                dataset_name=None, dataset_source=None, dataset_type=None,
+                                dataset_attributes=None, lean=False):
+        """
+        Query of the datasets of genomes, with all the filters of fetch_genome_datasets but the release ones.
+        If lean, the columns of the records of the entities are selected instead, rows to be read with
+        _read_dataset_results.
+        """
+        # DatasetType, DatasetSource, Attribute and EnsemblRelease come from the in-memory dimension tables:
+        # filters on them are resolved to IDs and they are attached to the fetched rows
+        entities = projected_columns(self._dataset_projections(False)) if lean \
+            else [Genome, GenomeDataset, Dataset]
+        genome_select = db.select(*entities).select_from(Genome) \
+            .join(GenomeDataset, Genome.genome_id == GenomeDataset.genome_id) \
+            .join(Dataset, GenomeDataset.dataset_id == Dataset.dataset_id).order_by(
+            Genome.genome_uuid, Dataset.dataset_uuid)
+
+        # set default group topic as 'assembly' to fetch unique datasource
+        if not dataset_name:
+            dataset_name = "assembly"
+
+        genome_id = check_parameter(genome_id)
+        genome_uuid = check_parameter(genome_uuid)
+        organism_uuid = check_parameter(organism_uuid)
+        dataset_uuid = check_parameter(dataset_uuid)
+        dataset_name = check_parameter(dataset_name)
+        dataset_source = check_parameter(dataset_source)
+        dataset_type = check_parameter(dataset_type)
+
+        if genome_id is not None:
+            genome_select = genome_select.filter(Genome.genome_id.in_(genome_id))
+
+        if genome_uuid is not None:
+            genome_select = genome_select.filter(Genome.genome_uuid.in_(genome_uuid))
+
+        if organism_uuid is not None:
+            genome_select = genome_select.join(Organism, Organism.organism_id == Genome.organism_id) \
+                .filter(Organism.organism_uuid.in_(organism_uuid))
+
+        if dataset_uuid is not None:
+            genome_select = genome_select.filter(Dataset.dataset_uuid.in_(dataset_uuid))
+
+        if "all" in dataset_name:
+            # TODO: fetch the list dynamically from the DB
+            # TODO: you can as well simply remove the filter, if you want them all.
+            dataset_type_names = [
+                'assembly', 'genebuild', 'variation', 'evidence',
+                'regulation_build', 'homologies', 'regulatory_features'
+            ]
+            genome_select = genome_select.filter(
+                Dataset.dataset_type_id.in_(self.dimensions.dataset_type_ids(dataset_type_names))
+            )
+        else:
+            genome_select = genome_select.filter(
+                Dataset.dataset_type_id.in_(self.dimensions.dataset_type_ids(dataset_name))
+            )
+
+        if dataset_source is not None:
+            genome_select = genome_select.filter(
+                Dataset.dataset_source_id.in_(self.dimensions.dataset_source_ids(dataset_source))
+            )
+
+        if dataset_type is not None:
+            genome_select = genome_select.filter(
+                Dataset.dataset_type_id.in_(self.dimensions.dataset_type_ids(dataset_type))
+            )
+
+        if dataset_attributes:
+            genome_select = genome_select \
+                .add_columns(*(record_projection(DatasetAttribute).columns if lean else [DatasetAttribute])) \
+                .join(DatasetAttribute, DatasetAttribute.dataset_id == Dataset.dataset_id)
+        return genome_select
+
+    def _dataset_rows(self, results, dataset_attributes, is_dataset_released):
+        """
+        Attach the dimension rows (DatasetType, DatasetSource, Attribute, EnsemblRelease) to the fetched
+        datasets.
+        """
+        dimensions = self.dimensions
+        fields = ["Genome", "GenomeDataset", "Dataset", "DatasetType", "DatasetSource"]
+        if dataset_attributes:
+            fields += ["DatasetAttribute", "Attribute"]
+            # Within each dataset, order the attributes by name as the DB would
+            dataset_ranks = {}
+            for result in results:
+                dataset_ranks.setdefault(
+                    (result.Genome.genome_id, result.Dataset.dataset_id), len(dataset_ranks)
+                )
+            results.sort(key=lambda r: (
+                dataset_ranks[(r.Genome.genome_id, r.Dataset.dataset_id)],
+                dimensions.attribute_rank(r.DatasetAttribute.attribute_id)
+            ))
+        if is_dataset_released:
+            fields.append("EnsemblRelease")
+        row = row_type(*fields)
+        datasets = []
+        for result in results:
+            values = [
+                result.Genome,
+                result.GenomeDataset,
+                result.Dataset,
+                dimensions.dataset_type(result.Dataset.dataset_type_id),
+                dimensions.dataset_source(result.Dataset.dataset_source_id),
+            ]
+            if dataset_attributes:
+                values += [
+                    result.DatasetAttribute, dimensions.attribute(result.DatasetAttribute.attribute_id)
+                ]
+            if is_dataset_released:
+                values.append(dimensions.release(result.GenomeDataset.release_id))
+            if None in values:
+                # Dangling reference to a dimension row, which an inner join would have left out
+                continue
+            datasets.append(row(*values))
+        return datasets
+
+    def fetch_genome_datasets(self, genome_id=None, genome_uuid=None, organism_uuid=None,
+                              allow_unreleased=False, unreleased_only=False, dataset_uuid=None,
+                              dataset_name=None, dataset_source=None, dataset_type=None, release_version=None,
+                              dataset_attributes=None, lean=False):
         """
         Fetches genome datasets based on the provided parameters.
 
@@ -438,6 +762,8 @@ class GenomeAdaptor(BaseAdaptor):
             dataset_type (str or None): Dataset type to filter by.
             release_version (float or None): EnsemblRelease version to filter by.
             dataset_attributes (bool): Flag to include dataset attributes
+            lean (bool): Return the Genome, GenomeDataset, Dataset and DatasetAttribute as detached records
+                (named tuples of their columns) instead of ORM instances.
 
         Returns:
             List[Tuple[
@@ -460,104 +786,131 @@ class GenomeAdaptor(BaseAdaptor):
 
         """
         try:
-            genome_select = db.select(
-                Genome,
-                GenomeDataset,
-                Dataset,
-                DatasetType,
-                DatasetSource,
-            ).select_from(Genome) \
-                .join(GenomeDataset, Genome.genome_id == GenomeDataset.genome_id) \
-                .join(Dataset, GenomeDataset.dataset_id == Dataset.dataset_id) \
-                .join(DatasetType, Dataset.dataset_type_id == DatasetType.dataset_type_id) \
-                .join(DatasetSource, Dataset.dataset_source_id == DatasetSource.dataset_source_id).order_by(
-                Genome.genome_uuid, Dataset.dataset_uuid)
-
-            # set default group topic as 'assembly' to fetch unique datasource
-            if not dataset_name:
-                dataset_name = "assembly"
-
-            genome_id = check_parameter(genome_id)
-            genome_uuid = check_parameter(genome_uuid)
-            organism_uuid = check_parameter(organism_uuid)
-            dataset_uuid = check_parameter(dataset_uuid)
-            dataset_name = check_parameter(dataset_name)
-            dataset_source = check_parameter(dataset_source)
-            dataset_type = check_parameter(dataset_type)
-
-            if genome_id is not None:
-                genome_select = genome_select.filter(Genome.genome_id.in_(genome_id))
-
-            if genome_uuid is not None:
-                genome_select = genome_select.filter(Genome.genome_uuid.in_(genome_uuid))
-
-            if organism_uuid is not None:
-                genome_select = genome_select.join(Organism, Organism.organism_id == Genome.organism_id) \
-                    .filter(Organism.organism_uuid.in_(organism_uuid))
-
-            if dataset_uuid is not None:
-                genome_select = genome_select.filter(Dataset.dataset_uuid.in_(dataset_uuid))
-
-            if "all" in dataset_name:
-                # TODO: fetch the list dynamically from the DB
-                # TODO: you can as well simply remove the filter, if you want them all.
-                dataset_type_names = [
-                    'assembly', 'genebuild', 'variation', 'evidence',
-                    'regulation_build', 'homologies', 'regulatory_features'
-                ]
-                genome_select = genome_select.filter(DatasetType.name.in_(dataset_type_names))
-            else:
-                genome_select = genome_select.filter(DatasetType.name.in_(dataset_name))
-
-            if dataset_source is not None:
-                genome_select = genome_select.filter(DatasetSource.name.in_(dataset_source))
-
-            if dataset_type is not None:
-                genome_select = genome_select.filter(DatasetType.name.in_(dataset_type))
-
-            if dataset_attributes:
-                genome_select = genome_select.add_columns(DatasetAttribute, Attribute) \
-                    .join(DatasetAttribute, DatasetAttribute.dataset_id == Dataset.dataset_id) \
-                    .join(Attribute, Attribute.attribute_id == DatasetAttribute.attribute_id).order_by(Attribute.name)
+            filters = {
+                "genome_id": check_parameter(genome_id),
+                "genome_uuid": check_parameter(genome_uuid),
+                "organism_uuid": check_parameter(organism_uuid),
+                "dataset_uuid": check_parameter(dataset_uuid),
+            }
+            # The biggest filter is sent in chunks of values if it is too big for a single IN list
+            chunked = max(
+                (name for name, values in filters.items() if values is not None),
+                key=lambda name: len(filters[name]), default=None
+            )
 
+            def execute(*criteria, probe=False):
+                def fetch(values):
+                    chunk_filters = filters if chunked is None else dict(filters, **{chunked: values})
+                    genome_select = self._genome_datasets_select(
+                        **chunk_filters,
+                        dataset_name=dataset_name,
+                        dataset_source=dataset_source,
+                        dataset_type=dataset_type,
+                        dataset_attributes=dataset_attributes,
+                        lean=lean,
+                    ).filter(*criteria)
+                    if probe:
+                        genome_select = genome_select.limit(1)
+                    logger.debug(genome_select)
+                    with self.metadata_db.session_scope() as session:
+                        # This is needed in order to ovoid tests throwing:
+                        # sqlalchemy.orm.exc.DetachedInstanceError: Instance <DatasetType at 0x7fc5c05a13d0>
+                        # is not bound to a Session; attribute refresh operation cannot proceed
+                        # (Background on this error at: https://sqlalche.me/e/14/bhk3)
+                        session.expire_on_commit = False
+                        return self._read_dataset_results(session, genome_select, dataset_attributes, lean)
+
+                # Same order as the ORDER BY of _genome_datasets_select()
+                return fetch_in_chunks(filters.get(chunked), fetch, key=lambda result: (
+                    collation_key(result.Genome.genome_uuid), collation_key(result.Dataset.dataset_uuid)
+                ))
+
+            criteria = []
+            is_dataset_released = False
             if allow_unreleased:
                 # Get everything
                 pass
             elif unreleased_only:
                 # Get only unreleased datasets
-                # this filter will get all Datasets entries where there's no associated GenomeDataset
-                # the tilde (~) symbol is used for negation.
-                genome_select = genome_select.filter(~GenomeDataset.ensembl_release.has())
+                # i.e. GenomeDataset entries which are not attached to a release
+                criteria.append(GenomeDataset.release_id.is_(None))
             else:
                 # Get released datasets only
-                # Check if dataset is released
-                with self.metadata_db.session_scope() as session:
-                    # This is needed in order to ovoid tests throwing:
-                    # sqlalchemy.orm.exc.DetachedInstanceError: Instance <DatasetType at 0x7fc5c05a13d0>
-                    # is not bound to a Session; attribute refresh operation cannot proceed
-                    # (Background on this error at: https://sqlalche.me/e/14/bhk3)
-                    session.expire_on_commit = False
-                    # Check if GenomeDataset HAS an ensembl_release
-                    prep_query = genome_select.filter(GenomeDataset.ensembl_release.has())
-                    is_dataset_released = session.execute(prep_query).first()
+                # Check if GenomeDataset HAS an ensembl_release
+                is_dataset_released = bool(execute(GenomeDataset.release_id.isnot(None), probe=True))
 
                 if is_dataset_released:
                     # Include release related info
-                    genome_select = genome_select.add_columns(EnsemblRelease) \
-                        .join(EnsemblRelease, GenomeDataset.release_id == EnsemblRelease.release_id)
+                    criteria.append(GenomeDataset.release_id.isnot(None))
 
                     if release_version:
-                        genome_select = genome_select.filter(EnsemblRelease.version <= release_version)
+                        criteria.append(GenomeDataset.release_id.in_(
+                            self.dimensions.release_ids(max_version=release_version)
+                        ))
 
-            # print(f"genome_select str ====> {str(genome_select)}")
-            logger.debug(genome_select)
-            with self.metadata_db.session_scope() as session:
-                session.expire_on_commit = False
-                return session.execute(genome_select).all()
+            results = execute(*criteria)
+            return self._dataset_rows(results, dataset_attributes, is_dataset_released)
 
         except Exception as e:
             raise ValueError(str(e))
 
+    def fetch_datasets_by_genome(self, genome_ids, allow_unreleased=False, dataset_name=None,
+                                 dataset_source=None, dataset_attributes=None, release_version=None,
+                                 lean=False):
+        """
+        Fetch the datasets of several genomes with a single query, as fetch_genome_datasets would for each of
+        them.
+
+        Args:
+            genome_ids (list): IDs of the genomes.
+            allow_unreleased (bool): Include the unreleased datasets. Otherwise, only the released datasets of
+                a genome are returned if it has any, and all its datasets if it has none.
+            dataset_name (str or None): Dataset name to filter by, default is 'assembly'.
+            dataset_source (str or None): Dataset source to filter by.
+            dataset_attributes (bool): Flag to include dataset attributes
+            release_version (float or None): EnsemblRelease version to filter the released datasets by.
+            lean (bool): Return detached records instead of ORM instances, as fetch_genome_datasets does.
+
+        Returns:
+            Dict[int, list]: The dataset rows of each genome, keyed by genome_id.
+        """
+        def fetch(chunk_ids):
+            genome_select = self._genome_datasets_select(
+                genome_id=chunk_ids,
+                dataset_name=dataset_name,
+                dataset_source=dataset_source,
+                dataset_attributes=dataset_attributes,
+                lean=lean,
+            )
+            logger.debug(genome_select)
+            with self.metadata_db.session_scope() as session:
+                session.expire_on_commit = False
+                return self._read_dataset_results(session, genome_select, dataset_attributes, lean)
+
+        # The rows are grouped by genome below, their order across chunks does not matter
+        results = fetch_in_chunks(genome_ids, fetch)
+
+        results_by_genome = {}
+        for result in results:
+            results_by_genome.setdefault(result.Genome.genome_id, []).append(result)
+
+        release_ids = set(self.dimensions.release_ids(max_version=release_version)) \
+            if release_version else None
+        datasets = {}
+        for genome_id, genome_results in results_by_genome.items():
+            released_results = [] if allow_unreleased else \
+                [result for result in genome_results if result.GenomeDataset.release_id is not None]
+            if released_results:
+                if release_ids is not None:
+                    released_results = [
+                        result for result in released_results
+                        if result.GenomeDataset.release_id in release_ids
+                    ]
+                datasets[genome_id] = self._dataset_rows(released_results, dataset_attributes, True)
+            else:
+                datasets[genome_id] = self._dataset_rows(genome_results, dataset_attributes, False)
+        return datasets
+
     def fetch_genomes_info(
             self,
             genome_id=None,
@@ -598,77 +951,34 @@ class GenomeAdaptor(BaseAdaptor):
                 group_type=group_type,
             )
 
-            for genome in genomes:
-                dataset = self.fetch_genome_datasets(
-                    genome_uuid=genome[0].genome_uuid,
+            # load the datasets of a chunk of genomes at a time, rather than one query per genome
+            chunk_size = MetadataConfig.dataset_chunk_size
+            for start in range(0, len(genomes), chunk_size):
+                chunk = genomes[start:start + chunk_size]
+                datasets = self.fetch_datasets_by_genome(
+                    genome_ids=[genome[0].genome_id for genome in chunk],
                     allow_unreleased=allow_unreleased_datasets,
                     dataset_name=dataset_name,
                     dataset_source=dataset_source,
                     dataset_attributes=dataset_attributes
                 )
-                res = [{'genome': genome, 'datasets': dataset}]
-                yield res
+                for genome in chunk:
+                    res = [{'genome': genome, 'datasets': datasets.get(genome[0].genome_id, [])}]
+                    yield res
         except Exception as e:
             raise ValueError(str(e))
 
-    def fetch_organisms_group_counts(self, release_version=None, group_code='popular'):
-        o_species = aliased(Organism)
-        o = aliased(Organism)
-        if not release_version:
-            # Get latest released organisms
-            query = db.select(
-                o_species.species_taxonomy_id,
-                o_species.ensembl_name,
-                o_species.common_name,
-                o_species.scientific_name,
-                OrganismGroupMember.order.label('order'),
-                db.func.count().label('count')
-            )
-
-            query = query.join(o, o_species.species_taxonomy_id == o.species_taxonomy_id)
-            query = query.join(Genome, o.organism_id == Genome.organism_id)
-            query = query.join(Assembly, Genome.assembly_id == Assembly.assembly_id)
-            query = query.join(OrganismGroupMember, o_species.organism_id == OrganismGroupMember.organism_id)
-            query = query.join(OrganismGroup,
-                               OrganismGroupMember.organism_group_id == OrganismGroup.organism_group_id)
-            query = query.filter(OrganismGroup.code == group_code)
-
-            query = query.group_by(
-                o_species.species_taxonomy_id,
-                o_species.ensembl_name,
-                o_species.common_name,
-                o_species.scientific_name,
-                OrganismGroupMember.order
-            )
-            query = query.order_by(OrganismGroupMember.order)
-        else:
-            # change group to release_version_state and related genomes
-            raise NotImplementedError('Not implemented yet')
-            pass
-
-        with self.metadata_db.session_scope() as session:
-            # TODO check if we should return a dictionary instead
-            return session.execute(query).all()
-
-    def fetch_related_assemblies_count(self, organism_uuid, release_version=None):
+    def fetch_group_genome_uuids(self, group_code='popular'):
         """
-        Fetch all related assemblies for the same organism and all the ones sharing the same species_taxon_id
-        release_version is to return only the ones which were available unitl this release_version (not implemented yet)
+        Fetch the UUIDs of the current genomes of the organisms in an organism group, in the group order.
         """
-        o_species = aliased(Organism)
-        o = aliased(Organism)
-        if not release_version:
-            # Get latest released organisms
-            query = db.select(db.func.count(o_species.ensembl_name))
-            query = query.join(o, o_species.species_taxonomy_id == o.species_taxonomy_id)
-            query = query.join(Genome, o.organism_id == Genome.organism_id)
-            query = query.join(Assembly, Genome.assembly_id == Assembly.assembly_id)
-            query = query.filter(o_species.organism_uuid == organism_uuid)
-        else:
-            # change group to release_version_state and related genomes
-            raise NotImplementedError('Not implemented yet')
-            pass
-
-        # print(f"query ---> {query}")
+        query = db.select(Genome.genome_uuid) \
+            .join(Genome.organism) \
+            .join(OrganismGroupMember, Organism.organism_id == OrganismGroupMember.organism_id) \
+            .join(OrganismGroup, OrganismGroupMember.organism_group_id == OrganismGroup.organism_group_id) \
+            .join(GenomeRelease, Genome.genome_id == GenomeRelease.genome_id) \
+            .filter(OrganismGroup.code == group_code) \
+            .filter(GenomeRelease.is_current == 1) \
+            .order_by(OrganismGroupMember.order, Genome.genome_id)
         with self.metadata_db.session_scope() as session:
-            return session.execute(query).scalar()
+            return list(dict.fromkeys(session.execute(query).scalars()))
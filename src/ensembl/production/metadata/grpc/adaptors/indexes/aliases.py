@@ -0,0 +1,78 @@
+# See the NOTICE file distributed with this work for additional information
+#   regarding copyright ownership.
+#   Licensed under the Apache License, Version 2.0 (the "License");
+#   you may not use this file except in compliance with the License.
+#   You may obtain a copy of the License at
+#       http://www.apache.org/licenses/LICENSE-2.0
+#   Unless required by applicable law or agreed to in writing, software
+#   distributed under the License is distributed on an "AS IS" BASIS,
+#   WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+#   See the License for the specific language governing permissions and
+#   limitations under the License.
+from collections import namedtuple
+
+from ensembl.production.metadata.grpc.adaptors.indexes.base import DerivedIndex
+from ensembl.production.metadata.grpc.adaptors.indexes.dimensions import normalise
+from ensembl.production.metadata.grpc.adaptors.indexes.genomes import GenomeCatalogue
+
+
+# A genome with its releases, and whether it has a dataset attached to a release
+AliasTarget = namedtuple("AliasTarget", ["genome", "genome_releases", "released"])
+
+
+class Aliases:
+    """
+    Content of the alias index. Each map gives the AliasTarget of the genomes having a name, by genome_id.
+
+    Attributes:
+        assembly_names (Dict[tuple, List[AliasTarget]]): Keyed by (Ensembl name, assembly name).
+        default_assemblies (Dict[tuple, List[AliasTarget]]): Keyed by (Ensembl name, assembly default name).
+        defaults_only (Dict[str, List[AliasTarget]]): Keyed by assembly default name.
+        tags (Dict[str, List[AliasTarget]]): Keyed by genome tag (assembly URL name or ToL ID).
+    """
+
+    def __init__(self):
+        self.assembly_names = {}
+        self.default_assemblies = {}
+        self.defaults_only = {}
+        self.tags = {}
+
+
+class AliasIndex(DerivedIndex):
+    """
+    Resolution of the names the genomes are known by (Ensembl name with assembly name or default, genome tag)
+    to genomes. Names are matched case-insensitively, like the MySQL collations the adaptors used to rely on.
+    """
+    source_class = GenomeCatalogue
+
+    def build_from(self, catalogue):
+        aliases = Aliases()
+        for genome_id, (genome, organism, assembly) in catalogue.genomes.items():
+            target = AliasTarget(
+                genome, catalogue.genome_releases.get(genome_id, []), genome_id in catalogue.released_genomes
+            )
+            ensembl_name = normalise(organism.ensembl_name)
+            if assembly.name is not None:
+                aliases.assembly_names.setdefault((ensembl_name, normalise(assembly.name)), []).append(target)
+            if assembly.assembly_default is not None:
+                default = normalise(assembly.assembly_default)
+                aliases.default_assemblies.setdefault((ensembl_name, default), []).append(target)
+                aliases.defaults_only.setdefault(default, []).append(target)
+            tags = {normalise(value) for value in (assembly.url_name, assembly.tol_id) if value is not None}
+            for tag in tags:
+                aliases.tags.setdefault(tag, []).append(target)
+        return aliases
+
+    def by_assembly(self, ensembl_name, assembly_name, use_default_assembly=False):
+        """The genomes of an organism with an assembly name, or assembly default name."""
+        content = self.content
+        index = content.default_assemblies if use_default_assembly else content.assembly_names
+        return index.get((normalise(ensembl_name), normalise(assembly_name)), [])
+
+    def by_default_assembly(self, assembly_name):
+        """The genomes with an assembly default name, whatever the organism."""
+        return self.content.defaults_only.get(normalise(assembly_name), [])
+
+    def by_tag(self, genome_tag):
+        """The genomes with an assembly URL name or ToL ID."""
+        return self.content.tags.get(normalise(genome_tag), [])
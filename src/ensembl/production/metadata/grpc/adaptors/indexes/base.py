@@ -0,0 +1,155 @@
+# See the NOTICE file distributed with this work for additional information
+#   regarding copyright ownership.
+#   Licensed under the Apache License, Version 2.0 (the "License");
+#   you may not use this file except in compliance with the License.
+#   You may obtain a copy of the License at
+#       http://www.apache.org/licenses/LICENSE-2.0
+#   Unless required by applicable law or agreed to in writing, software
+#   distributed under the License is distributed on an "AS IS" BASIS,
+#   WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+#   See the License for the specific language governing permissions and
+#   limitations under the License.
+import logging
+import threading
+import time
+
+logger = logging.getLogger(__name__)
+
+
+class ReleaseIndex:
+    """
+    In-memory data built from the metadata DB, shared by all the adaptors connected to the same DB.
+
+    The content is loaded lazily on first use, and rebuilt when the releases change (see refresh_indexes()). A
+    rebuild swaps in a complete new content, so readers never see a partially built index. Subclasses
+    implement build(), which returns the content from a DB session.
+
+    Args:
+        metadata_uri (str): URI of the metadata DB, identifies the shared instances.
+        metadata_db (ReplicatedDB): Connection to the metadata DB, the content is built from release_scope()
+            sessions.
+    """
+
+    # Minimum number of seconds between two reloads triggered by a missing key
+    MISS_RELOAD_INTERVAL = 30
+
+    _shared = {}
+    # Reentrant, as derived indexes get their source index while being created
+    _shared_lock = threading.RLock()
+
+    def __init__(self, metadata_uri, metadata_db):
+        self.metadata_uri = metadata_uri
+        self.metadata_db = metadata_db
+        self.generation = 0
+        self.loaded_at = 0
+        self._content = None
+        self._lock = threading.Lock()
+
+    @classmethod
+    def shared(cls, metadata_uri, metadata_db):
+        """Return the index of this class for the given DB, created with metadata_db on first call."""
+        key = (cls, str(metadata_uri))
+        with cls._shared_lock:
+            index = cls._shared.get(key)
+            if index is None:
+                index = cls._shared[key] = cls(metadata_uri, metadata_db)
+            return index
+
+    @classmethod
+    def all_shared(cls):
+        with cls._shared_lock:
+            return list(cls._shared.values())
+
+    def build(self, session):
+        raise NotImplementedError
+
+    def _load(self):
+        start = time.time()
+        with self.metadata_db.release_scope() as session:
+            session.expire_on_commit = False
+            content = self.build(session)
+        self._content = content
+        self.generation += 1
+        self.loaded_at = time.time()
+        logger.debug("Built %s (generation %s) in %.3fs",
+                     type(self).__name__, self.generation, self.loaded_at - start)
+
+    def _stale(self):
+        return self._content is None
+
+    @property
+    def content(self):
+        if self._stale():
+            with self._lock:
+                if self._stale():
+                    self._load()
+        return self._content
+
+    @property
+    def loaded(self):
+        return self._content is not None
+
+    def refresh(self):
+        """Rebuild the content now, if it has been loaded already."""
+        with self._lock:
+            if self._content is not None:
+                self._load()
+
+    def reload_on_miss(self):
+        """
+        Rebuild the content because a key expected to be there was not found, e.g. a row added since the last
+        build.
+
+        Returns:
+            bool: Whether the content has been rebuilt, reloads are throttled to one every
+                MISS_RELOAD_INTERVAL.
+        """
+        with self._lock:
+            if time.time() - self.loaded_at < self.MISS_RELOAD_INTERVAL:
+                return False
+            self._load()
+            return True
+
+
+class DerivedIndex(ReleaseIndex):
+    """
+    Index built from the content of another shared index (source_class) rather than from the DB. It is rebuilt
+    whenever its source has been rebuilt. Subclasses implement build_from(), which returns the content from
+    the content of the source.
+    """
+    source_class = None
+
+    def __init__(self, metadata_uri, metadata_db):
+        super().__init__(metadata_uri, metadata_db)
+        self.source = self.source_class.shared(metadata_uri, metadata_db)
+        self._source_generation = None
+
+    def build_from(self, source_content):
+        raise NotImplementedError
+
+    def _stale(self):
+        return self._content is None or self._source_generation != self.source.generation
+
+    def _load(self):
+        start = time.time()
+        source_content = self.source.content
+        self._source_generation = self.source.generation
+        self._content = self.build_from(source_content)
+        self.generation += 1
+        self.loaded_at = time.time()
+        logger.debug("Built %s (generation %s) in %.3fs",
+                     type(self).__name__, self.generation, self.loaded_at - start)
+
+    def refresh(self):
+        # Rebuilt lazily on next access once the source has been refreshed
+        pass
+
+    def reload_on_miss(self):
+        return self.source.reload_on_miss()
+
+
+def refresh_indexes():
+    """Rebuild all the shared indexes which have been loaded, after a release change."""
+    for index in ReleaseIndex.all_shared():
+        if index.loaded:
+            index.refresh()
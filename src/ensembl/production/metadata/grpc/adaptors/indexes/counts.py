@@ -0,0 +1,220 @@
+# See the NOTICE file distributed with this work for additional information
+#   regarding copyright ownership.
+#   Licensed under the Apache License, Version 2.0 (the "License");
+#   you may not use this file except in compliance with the License.
+#   You may obtain a copy of the License at
+#       http://www.apache.org/licenses/LICENSE-2.0
+#   Unless required by applicable law or agreed to in writing, software
+#   distributed under the License is distributed on an "AS IS" BASIS,
+#   WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+#   See the License for the specific language governing permissions and
+#   limitations under the License.
+import threading
+from bisect import bisect_right
+from collections import namedtuple, OrderedDict
+from itertools import accumulate
+
+import sqlalchemy as db
+from ensembl.production.metadata.api.models import Genome, Organism, Assembly, GenomeRelease, \
+    EnsemblRelease, OrganismGroup, OrganismGroupMember
+
+from ensembl.production.metadata.grpc.adaptors.indexes.base import ReleaseIndex
+
+
+def species_genome_counts():
+    """Query of the number of genomes of each species."""
+    return db.select(Organism.species_taxonomy_id, db.func.count(Genome.genome_id)) \
+        .join(Genome, Genome.organism_id == Organism.organism_id) \
+        .join(Assembly, Assembly.assembly_id == Genome.assembly_id) \
+        .group_by(Organism.species_taxonomy_id)
+
+
+def species_first_releases():
+    """Query of the number of genomes of each species by version of their first release, ordered."""
+    first_release = db.select(
+        Organism.species_taxonomy_id.label("species_taxonomy_id"),
+        db.func.min(EnsemblRelease.version).label("version"),
+    ).select_from(Genome) \
+        .join(Organism, Organism.organism_id == Genome.organism_id) \
+        .join(Assembly, Assembly.assembly_id == Genome.assembly_id) \
+        .join(GenomeRelease, GenomeRelease.genome_id == Genome.genome_id) \
+        .join(EnsemblRelease, EnsemblRelease.release_id == GenomeRelease.release_id) \
+        .group_by(Genome.genome_id, Organism.species_taxonomy_id) \
+        .subquery()
+    return db.select(
+        first_release.c.species_taxonomy_id, first_release.c.version, db.func.count()
+    ).group_by(first_release.c.species_taxonomy_id, first_release.c.version) \
+        .order_by(first_release.c.species_taxonomy_id, first_release.c.version)
+
+
+class SpeciesCounts:
+    """
+    Number of genomes of each species, overall and up to each release version.
+
+    Attributes:
+        current (Dict[int, int]): Number of genomes of each species, keyed by species_taxonomy_id.
+        versions (Dict[int, List[Decimal]]): Versions in which new genomes of each species were first
+            released, ascending.
+        released (Dict[int, List[int]]): Number of genomes of each species released up to each of these
+            versions.
+    """
+
+    def __init__(self, current, first_releases):
+        self.current = dict(current)
+        self.versions = {}
+        new_genomes = {}
+        for species_taxonomy_id, version, count in first_releases:
+            self.versions.setdefault(species_taxonomy_id, []).append(version)
+            new_genomes.setdefault(species_taxonomy_id, []).append(count)
+        self.released = {species_taxonomy_id: list(accumulate(counts))
+                         for species_taxonomy_id, counts in new_genomes.items()}
+
+    def count(self, species_taxonomy_id, release_version=None):
+        """Number of genomes of a species, released up to release_version if given."""
+        if not release_version:
+            return self.current.get(species_taxonomy_id, 0)
+        position = bisect_right(self.versions.get(species_taxonomy_id, []), release_version)
+        return self.released[species_taxonomy_id][position - 1] if position else 0
+
+
+class AssemblyCounts(SpeciesCounts):
+    """
+    Content of the related assembly counts index.
+
+    Attributes:
+        species (Dict[str, int]): species_taxonomy_id of each organism, keyed by organism_uuid.
+    """
+
+    def __init__(self, species, current, first_releases):
+        super().__init__(current, first_releases)
+        self.species = dict(species)
+
+
+class RelatedAssemblyCounts(ReleaseIndex):
+    """
+    Number of genomes (assemblies) of each species, overall and up to each release version, computed with
+    grouped queries when the releases change rather than with a self-join of Organism per request.
+    """
+
+    def build(self, session):
+        species_select = db.select(Organism.organism_uuid, Organism.species_taxonomy_id)
+        return AssemblyCounts(
+            species=session.execute(species_select).all(),
+            current=session.execute(species_genome_counts()).all(),
+            first_releases=session.execute(species_first_releases()).all(),
+        )
+
+    def _species(self, organism_uuid):
+        content = self.content
+        if organism_uuid not in content.species and self.reload_on_miss():
+            content = self.content
+        return content, content.species.get(organism_uuid)
+
+    def count(self, organism_uuid, release_version=None):
+        """
+        Number of genomes of the species of an organism.
+
+        Args:
+            organism_uuid (str): The organism.
+            release_version (float or None): Only count the genomes released up to this version. All the
+                genomes, released or not, if None or 0.
+
+        Returns:
+            int: The number of genomes, 0 for an unknown organism.
+        """
+        content, species_taxonomy_id = self._species(organism_uuid)
+        if species_taxonomy_id is None:
+            return 0
+        return content.count(species_taxonomy_id, release_version)
+
+
+# Number of genomes of the species of an organism group member, in the column order of the former group count
+# query
+GroupCount = namedtuple(
+    "GroupCount", ["species_taxonomy_id", "ensembl_name", "common_name", "scientific_name", "order", "count"]
+)
+
+
+class GroupCounts(SpeciesCounts):
+    """
+    Content of the organism group counts index.
+
+    Attributes:
+        members (Dict[str, List[tuple]]): (species_taxonomy_id, ensembl_name, common_name, scientific_name,
+            order) of the members of each group, keyed by group code, in the group order.
+        release_versions (List[Decimal]): Versions in which new genomes of any species were first released,
+            ascending.
+        aggregates (Dict[tuple, List[GroupCount]]): Counts of each group, keyed by (group code, release
+            version), materialised on first use.
+    """
+
+    def __init__(self, members, current, first_releases):
+        super().__init__(current, first_releases)
+        self.members = {}
+        for code, *member in members:
+            self.members.setdefault(code, []).append(tuple(member))
+        self.release_versions = sorted(
+            {version for versions in self.versions.values() for version in versions}
+        )
+        self.aggregates = {}
+        self._lock = threading.Lock()
+
+    def aggregate(self, group_code, release_version=None):
+        if release_version:
+            # The counts only change in the versions new genomes were released in: any version is mapped to
+            # the latest of them up to it, so that there is at most one aggregate per group and release
+            position = bisect_right(self.release_versions, release_version)
+            if not position:
+                return []
+            release_version = self.release_versions[position - 1]
+        key = (group_code, release_version or None)
+        with self._lock:
+            if key not in self.aggregates:
+                counts = OrderedDict()
+                for member in self.members.get(group_code, []):
+                    count = self.count(member[0], release_version)
+                    # Members with no genome are dropped, and identical members merged, as with the grouped
+                    # join
+                    if count:
+                        counts[member] = counts.get(member, 0) + count
+                self.aggregates[key] = [GroupCount(*member, count) for member, count in counts.items()]
+            return self.aggregates[key]
+
+
+class OrganismGroupCounts(ReleaseIndex):
+    """
+    Number of genomes of the species of each organism group member, overall and up to each release version.
+    The per species counts are computed with grouped queries when the releases change, and the counts of a
+    group are then aggregated once per group code and release version.
+    """
+
+    def build(self, session):
+        members_select = db.select(
+            OrganismGroup.code,
+            Organism.species_taxonomy_id,
+            Organism.ensembl_name,
+            Organism.common_name,
+            Organism.scientific_name,
+            OrganismGroupMember.order,
+        ).join(OrganismGroupMember, OrganismGroupMember.organism_id == Organism.organism_id) \
+            .join(OrganismGroup, OrganismGroup.organism_group_id == OrganismGroupMember.organism_group_id) \
+            .order_by(OrganismGroup.code, OrganismGroupMember.order, Organism.organism_id)
+        return GroupCounts(
+            members=session.execute(members_select).all(),
+            current=session.execute(species_genome_counts()).all(),
+            first_releases=session.execute(species_first_releases()).all(),
+        )
+
+    def counts(self, group_code, release_version=None):
+        """
+        Number of genomes of the species of the members of an organism group.
+
+        Args:
+            group_code (str): The organism group.
+            release_version (float or None): Only count the genomes released up to this version. All the
+                genomes, released or not, if None or 0.
+
+        Returns:
+            List[GroupCount]: One row per member with genomes, in the group order.
+        """
+        return self.content.aggregate(group_code, release_version)
@@ -0,0 +1,153 @@
+# See the NOTICE file distributed with this work for additional information
+#   regarding copyright ownership.
+#   Licensed under the Apache License, Version 2.0 (the "License");
+#   you may not use this file except in compliance with the License.
+#   You may obtain a copy of the License at
+#       http://www.apache.org/licenses/LICENSE-2.0
+#   Unless required by applicable law or agreed to in writing, software
+#   distributed under the License is distributed on an "AS IS" BASIS,
+#   WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+#   See the License for the specific language governing permissions and
+#   limitations under the License.
+from ensembl.production.metadata.api.models import EnsemblSite, EnsemblRelease, DatasetType, DatasetSource, \
+    Attribute, OrganismGroup
+
+from ensembl.production.metadata.grpc.adaptors.indexes.base import ReleaseIndex
+from ensembl.production.metadata.grpc.adaptors.records import records_select, read_records
+
+
+def normalise(value):
+    """Normalise a string value the way the case insensitive collation of the metadata DB compares them."""
+    return str(value).lower()
+
+
+class Dimensions:
+    """Content of the small, rarely changing tables, as records keyed by primary key."""
+
+    def __init__(self, sites, releases, dataset_types, dataset_sources, attributes, organism_groups):
+        self.sites = {site.site_id: site for site in sites}
+        self.releases = {release.release_id: release for release in releases}
+        self.dataset_types = {dataset_type.dataset_type_id: dataset_type for dataset_type in dataset_types}
+        self.dataset_sources = {source.dataset_source_id: source for source in dataset_sources}
+        # Attributes are loaded ordered by name in the DB collation, their rank is used to sort results by
+        # name
+        self.attributes = {attribute.attribute_id: attribute for attribute in attributes}
+        self.attribute_ranks = {attribute.attribute_id: rank for rank, attribute in enumerate(attributes)}
+        self.organism_groups = {group.organism_group_id: group for group in organism_groups}
+
+
+class DimensionTables(ReleaseIndex):
+    """
+    In-memory copy of the dimension tables: EnsemblSite, EnsemblRelease, DatasetType, DatasetSource, Attribute
+    and OrganismGroup. The rows are kept as records (named tuples), which the threads can share safely.
+
+    The adaptors query the fact tables only, filtering on the IDs resolved here, and attach the dimension rows
+    to the results. Lookups of an ID read from a fact row which is not loaded (a row added since the last
+    build) trigger a reload. Names and IDs given by clients which are not loaded match nothing instead, so
+    that unknown values cannot force reloads.
+    """
+
+    def build(self, session):
+        def records(entity, *order_by):
+            return read_records(session.execute(records_select(entity).order_by(*order_by)), entity)
+
+        return Dimensions(
+            sites=records(EnsemblSite),
+            releases=records(EnsemblRelease, EnsemblRelease.release_id),
+            dataset_types=records(DatasetType),
+            dataset_sources=records(DatasetSource),
+            attributes=records(Attribute, Attribute.name, Attribute.attribute_id),
+            organism_groups=records(OrganismGroup),
+        )
+
+    def _get(self, table, key):
+        value = getattr(self.content, table).get(key)
+        if value is None and key is not None and self.reload_on_miss():
+            value = getattr(self.content, table).get(key)
+        return value
+
+    def site(self, site_id):
+        return self._get("sites", site_id)
+
+    def release(self, release_id):
+        return self._get("releases", release_id)
+
+    def dataset_type(self, dataset_type_id):
+        return self._get("dataset_types", dataset_type_id)
+
+    def dataset_source(self, dataset_source_id):
+        return self._get("dataset_sources", dataset_source_id)
+
+    def attribute(self, attribute_id):
+        return self._get("attributes", attribute_id)
+
+    def attribute_rank(self, attribute_id):
+        return self.content.attribute_ranks.get(attribute_id, -1)
+
+    def organism_group(self, organism_group_id):
+        return self._get("organism_groups", organism_group_id)
+
+    def _find(self, table, names, name_of, match=None):
+        """IDs of the rows whose name_of(row) is one of names (and for which match(row) is true)."""
+        names = {normalise(name) for name in names}
+        return [key for key, row in getattr(self.content, table).items()
+                if normalise(name_of(row)) in names and (match is None or match(row))]
+
+    def released_releases(self, release_id=None, release_version=None, max_version=None, current_only=False,
+                          release_type=None, site_name=None):
+        """
+        Releases attached to a site, filtered as the adaptors do in SQL.
+
+        Args:
+            release_id (list or None): Release IDs to filter by.
+            release_version (list or None): Release versions to filter by.
+            max_version (float or None): Only releases up to this version.
+            current_only (bool): Only current releases.
+            release_type (list or None): Release types to filter by.
+            site_name (list or None): Names of the Ensembl site to filter by.
+
+        Returns:
+            List[Tuple[EnsemblRelease, EnsemblSite]]: Releases with their site, by release ID.
+        """
+        content = self.content
+        release_ids = {int(rid) for rid in release_id} if release_id is not None else None
+        versions = {float(version) for version in release_version} if release_version is not None else None
+        release_types = {normalise(name) for name in release_type} if release_type is not None else None
+        site_names = {normalise(name) for name in site_name} if site_name is not None else None
+        results = []
+        for release in content.releases.values():
+            site = content.sites.get(release.site_id)
+            if site is None:
+                continue
+            if release_ids is not None and release.release_id not in release_ids:
+                continue
+            if versions is not None and float(release.version) not in versions:
+                continue
+            if max_version is not None and release.version > max_version:
+                continue
+            if current_only and not release.is_current:
+                continue
+            if release_types is not None and normalise(release.release_type) not in release_types:
+                continue
+            if site_names is not None and normalise(site.name) not in site_names:
+                continue
+            results.append((release, site))
+        return results
+
+    def release_ids(self, max_version=None, release_type=None, site_name=None):
+        """IDs of the releases attached to a site, up to max_version and of the given type and site."""
+        return [release.release_id for release, _ in self.released_releases(
+            max_version=max_version, release_type=release_type, site_name=site_name
+        )]
+
+    def dataset_type_ids(self, names):
+        return self._find("dataset_types", names, lambda row: row.name)
+
+    def dataset_source_ids(self, names):
+        return self._find("dataset_sources", names, lambda row: row.name)
+
+    def organism_group_ids(self, names, group_types):
+        group_types = {normalise(group_type) for group_type in group_types}
+        return self._find(
+            "organism_groups", names, lambda row: row.name, lambda row: normalise(row.type) in group_types
+        )
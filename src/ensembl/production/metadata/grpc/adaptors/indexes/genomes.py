@@ -0,0 +1,69 @@
+# See the NOTICE file distributed with this work for additional information
+#   regarding copyright ownership.
+#   Licensed under the Apache License, Version 2.0 (the "License");
+#   you may not use this file except in compliance with the License.
+#   You may obtain a copy of the License at
+#       http://www.apache.org/licenses/LICENSE-2.0
+#   Unless required by applicable law or agreed to in writing, software
+#   distributed under the License is distributed on an "AS IS" BASIS,
+#   WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+#   See the License for the specific language governing permissions and
+#   limitations under the License.
+from collections import OrderedDict
+
+import sqlalchemy as db
+from ensembl.production.metadata.api.models import Genome, Organism, Assembly, GenomeRelease, OrganismGroup, \
+    OrganismGroupMember, GenomeDataset
+
+from ensembl.production.metadata.grpc.adaptors.indexes.base import ReleaseIndex
+from ensembl.production.metadata.grpc.adaptors.records import records_select, read_records
+
+
+class Catalogue:
+    """
+    Genomes with their organism, assembly and releases, and the organism groups. The rows are records (named
+    tuples).
+
+    Attributes:
+        genomes (OrderedDict): (Genome, Organism, Assembly) tuples keyed by genome_id, by genome_id.
+        genome_releases (Dict[int, List[GenomeRelease]]): Releases of each genome, by genome_release_id.
+        groups (Dict[str, Dict[int, int]]): Order of the member organisms keyed by organism_id, for each group
+            code.
+        released_genomes (Set[int]): genome_id of the genomes with a dataset attached to a release.
+    """
+
+    def __init__(self, genomes, genome_releases, group_members=(), released_genomes=()):
+        self.genomes = OrderedDict((genome.genome_id, (genome, organism, assembly))
+                                   for genome, organism, assembly in genomes)
+        self.genome_releases = {}
+        for genome_release in genome_releases:
+            self.genome_releases.setdefault(genome_release.genome_id, []).append(genome_release)
+        self.groups = {}
+        for code, organism_id, order in group_members:
+            self.groups.setdefault(code, {})[organism_id] = order
+        self.released_genomes = set(released_genomes)
+
+
+class GenomeCatalogue(ReleaseIndex):
+    """In-memory copy of the genome catalogue, the source of the genome search indexes."""
+
+    def build(self, session):
+        genomes_select = records_select(Genome, Organism, Assembly).select_from(Genome) \
+            .join(Organism, Organism.organism_id == Genome.organism_id) \
+            .join(Assembly, Assembly.assembly_id == Genome.assembly_id) \
+            .order_by(Genome.genome_id)
+        genome_releases_select = records_select(GenomeRelease) \
+            .order_by(GenomeRelease.genome_id, GenomeRelease.genome_release_id)
+        group_members_select = db.select(
+            OrganismGroup.code, OrganismGroupMember.organism_id, OrganismGroupMember.order
+        ) \
+            .join(OrganismGroup, OrganismGroup.organism_group_id == OrganismGroupMember.organism_group_id)
+        released_genomes_select = db.select(GenomeDataset.genome_id) \
+            .filter(GenomeDataset.release_id.isnot(None)) \
+            .distinct()
+        return Catalogue(
+            genomes=read_records(session.execute(genomes_select), Genome, Organism, Assembly),
+            genome_releases=read_records(session.execute(genome_releases_select), GenomeRelease),
+            group_members=session.execute(group_members_select).all(),
+            released_genomes=session.execute(released_genomes_select).scalars().all(),
+        )
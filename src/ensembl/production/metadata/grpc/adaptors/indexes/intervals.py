@@ -0,0 +1,100 @@
+# See the NOTICE file distributed with this work for additional information
+#   regarding copyright ownership.
+#   Licensed under the Apache License, Version 2.0 (the "License");
+#   you may not use this file except in compliance with the License.
+#   You may obtain a copy of the License at
+#       http://www.apache.org/licenses/LICENSE-2.0
+#   Unless required by applicable law or agreed to in writing, software
+#   distributed under the License is distributed on an "AS IS" BASIS,
+#   WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+#   See the License for the specific language governing permissions and
+#   limitations under the License.
+from bisect import bisect_right
+
+from ensembl.production.metadata.api.models import EnsemblRelease, GenomeRelease
+
+from ensembl.production.metadata.grpc.adaptors.indexes.base import ReleaseIndex
+from ensembl.production.metadata.grpc.adaptors.records import records_select, read_records
+
+
+class Interval:
+    """
+    Releases something belongs to, by version.
+
+    Attributes:
+        versions (List[Decimal]): Versions of the releases, ascending.
+        items (list): What belongs to each release, in the same order (e.g. the GenomeRelease rows).
+    """
+
+    def __init__(self):
+        self.versions = []
+        self.items = []
+
+    def add(self, version, item):
+        self.versions.append(version)
+        self.items.append(item)
+
+    @property
+    def first(self):
+        """Version of the first release."""
+        return self.versions[0]
+
+    @property
+    def last(self):
+        """Version of the last release."""
+        return self.versions[-1]
+
+    def up_to(self, version):
+        """Items of the releases up to version, latest first."""
+        return reversed(self.items[:bisect_right(self.versions, version)])
+
+
+class Intervals:
+    """
+    Content of the release interval index.
+
+    Attributes:
+        genomes (Dict[int, Interval]): GenomeRelease records of each genome, keyed by genome_id.
+    """
+
+    def __init__(self, genome_releases):
+        self.genomes = {}
+        for genome_release, version in genome_releases:
+            self.genomes.setdefault(genome_release.genome_id, Interval()).add(version, genome_release)
+
+
+class ReleaseIntervals(ReleaseIndex):
+    """
+    First and last release of each genome, to answer "as of release X" genome queries by interval lookup
+    rather than by joining the release tables and keeping one row per historical release.
+    """
+
+    def build(self, session):
+        genome_releases_select = records_select(GenomeRelease).add_columns(EnsemblRelease.version) \
+            .join(EnsemblRelease, EnsemblRelease.release_id == GenomeRelease.release_id) \
+            .order_by(GenomeRelease.genome_id, EnsemblRelease.version, GenomeRelease.genome_release_id)
+        return Intervals(read_records(session.execute(genome_releases_select), GenomeRelease))
+
+    def genome(self, genome_id):
+        """Interval of the releases of a genome, None if it is not released."""
+        return self.content.genomes.get(genome_id)
+
+    def genome_release_as_of(self, genome_id, version, release_ids=None):
+        """
+        The latest GenomeRelease of a genome up to a release version.
+
+        Args:
+            genome_id (int): The genome.
+            version (float): Maximum release version.
+            release_ids (set or None): Only consider these releases (e.g. the releases of a site).
+
+        Returns:
+            GenomeRelease or None: None if the genome was not released up to that version.
+        """
+        interval = self.content.genomes.get(genome_id)
+        if interval is None:
+            return None
+        for genome_release in interval.up_to(version):
+            if release_ids is None or genome_release.release_id in release_ids:
+                return genome_release
+        return None
@@ -0,0 +1,120 @@
+# See the NOTICE file distributed with this work for additional information
+#   regarding copyright ownership.
+#   Licensed under the Apache License, Version 2.0 (the "License");
+#   you may not use this file except in compliance with the License.
+#   You may obtain a copy of the License at
+#       http://www.apache.org/licenses/LICENSE-2.0
+#   Unless required by applicable law or agreed to in writing, software
+#   distributed under the License is distributed on an "AS IS" BASIS,
+#   WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+#   See the License for the specific language governing permissions and
+#   limitations under the License.
+from bisect import bisect_right
+from collections import OrderedDict
+
+from ensembl.production.metadata.grpc.adaptors.indexes.base import DerivedIndex
+from ensembl.production.metadata.grpc.adaptors.indexes.dimensions import normalise
+from ensembl.production.metadata.grpc.adaptors.indexes.genomes import GenomeCatalogue
+
+
+def genome_keywords(organism, assembly):
+    """Normalised values a genome can be found by with a keyword search."""
+    values = (
+        assembly.tol_id,
+        assembly.accession,
+        assembly.name,
+        assembly.ensembl_name,
+        organism.common_name,
+        organism.scientific_name,
+        organism.scientific_parlance_name,
+        organism.species_taxonomy_id,
+    )
+    return {normalise(value) for value in values if value is not None}
+
+
+def group_by_accession(rows):
+    """(Genome, GenomeRelease, Assembly, Organism) rows grouped by assembly accession, by first appearance."""
+    groups = OrderedDict()
+    for row in rows:
+        groups.setdefault(row[2].accession, []).append(row)
+    return list(groups.values())
+
+
+class AccessionGroups:
+    """
+    Rows grouped by assembly accession, ordered by accession, so that a listing can be resumed past an
+    accession.
+
+    Args:
+        groups (List[list]): The groups, as returned by group_by_accession().
+    """
+
+    def __init__(self, groups):
+        self.groups = sorted(groups, key=lambda rows: rows[0][2].accession)
+        self.accessions = [rows[0][2].accession for rows in self.groups]
+
+    def after(self, accession=None):
+        """The groups of the accessions sorting after accession (matched or not), all if None."""
+        start = bisect_right(self.accessions, accession) if accession is not None else 0
+        for position in range(start, len(self.groups)):
+            yield self.groups[position]
+
+
+class Keywords:
+    """
+    Content of the keyword index.
+
+    Attributes:
+        rows (Dict[str, list]): Rows of the genomes having each keyword, by genome_id and genome_release_id.
+        accessions (Dict[str, List[list]]): The same rows, grouped by assembly accession.
+        sorted_accessions (Dict[str, AccessionGroups]): The same groups, ordered by accession.
+    """
+
+    def __init__(self, rows):
+        self.rows = rows
+        self.accessions = {
+            keyword: group_by_accession(keyword_rows) for keyword, keyword_rows in rows.items()
+        }
+        self.sorted_accessions = {
+            keyword: AccessionGroups(groups) for keyword, groups in self.accessions.items()
+        }
+
+
+class KeywordIndex(DerivedIndex):
+    """
+    Inverted index from normalised keyword to the (Genome, GenomeRelease, Assembly, Organism) rows of the
+    genomes having that keyword as tol_id, accession, assembly name or Ensembl name, organism common,
+    scientific or parlance name, or species taxonomy ID.
+    """
+    source_class = GenomeCatalogue
+
+    def build_from(self, catalogue):
+        index = {}
+        for genome_id, (genome, organism, assembly) in catalogue.genomes.items():
+            rows = [(genome, genome_release, assembly, organism)
+                    for genome_release in catalogue.genome_releases.get(genome_id, ())]
+            if not rows:
+                continue
+            for keyword in genome_keywords(organism, assembly):
+                index.setdefault(keyword, []).extend(rows)
+        return Keywords(index)
+
+    def lookup(self, keyword):
+        """Rows of the genomes matching keyword, by genome_id and genome_release_id."""
+        return self.content.rows.get(normalise(keyword), ())
+
+    def lookup_by_accession(self, keyword):
+        """Rows of the genomes matching keyword grouped by assembly accession, by first appearance."""
+        return self.content.accessions.get(normalise(keyword), ())
+
+    def lookup_accessions_after(self, keyword, accession=None):
+        """Rows of the genomes matching keyword grouped by accession, in accession order, past accession."""
+        groups = self.content.sorted_accessions.get(normalise(keyword))
+        return groups.after(accession) if groups is not None else iter(())
+
+    def all(self):
+        """Rows of all the genomes, by genome_id and genome_release_id."""
+        catalogue = self.source.content
+        return [(genome, genome_release, assembly, organism)
+                for genome_id, (genome, organism, assembly) in catalogue.genomes.items()
+                for genome_release in catalogue.genome_releases.get(genome_id, ())]
@@ -0,0 +1,113 @@
+# See the NOTICE file distributed with this work for additional information
+#   regarding copyright ownership.
+#   Licensed under the Apache License, Version 2.0 (the "License");
+#   you may not use this file except in compliance with the License.
+#   You may obtain a copy of the License at
+#       http://www.apache.org/licenses/LICENSE-2.0
+#   Unless required by applicable law or agreed to in writing, software
+#   distributed under the License is distributed on an "AS IS" BASIS,
+#   WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+#   See the License for the specific language governing permissions and
+#   limitations under the License.
+from bisect import bisect_left
+
+from ensembl.production.metadata.grpc.adaptors.indexes.base import DerivedIndex
+from ensembl.production.metadata.grpc.adaptors.indexes.dimensions import normalise
+from ensembl.production.metadata.grpc.adaptors.indexes.genomes import GenomeCatalogue
+
+
+def genome_names(organism, assembly):
+    """Normalised organism and assembly names a genome can be suggested for."""
+    values = (
+        organism.scientific_name,
+        organism.common_name,
+        organism.scientific_parlance_name,
+        assembly.name,
+        assembly.accession,
+    )
+    return {normalise(value) for value in values if value}
+
+
+class SortedNames:
+    """
+    Sorted array of (name, rank, genome_id) entries, searched by prefix with a binary search.
+    """
+
+    def __init__(self, entries):
+        self.entries = sorted(entries)
+        self.names = [name for name, _, _ in self.entries]
+
+    def starting_with(self, prefix):
+        """Entries whose name starts with prefix, by name."""
+        position = bisect_left(self.names, prefix)
+        while position < len(self.names) and self.names[position].startswith(prefix):
+            yield self.entries[position]
+            position += 1
+
+
+class Suggestions:
+    """
+    Content of the prefix index.
+
+    Attributes:
+        catalogue (Catalogue): The genome catalogue the index has been built from.
+        ranked (SortedNames): Names of the genomes of the ranking group members, ranked by the group order.
+        others (SortedNames): Names of the other genomes.
+    """
+
+    def __init__(self, catalogue, ranked, others):
+        self.catalogue = catalogue
+        self.ranked = ranked
+        self.others = others
+
+
+class PrefixIndex(DerivedIndex):
+    """
+    Sorted index of the organism and assembly names (scientific, common and parlance names, assembly name and
+    accession) of the genomes, for type-ahead search. Genomes of the organisms in the ranking group
+    (RANKING_GROUP) are suggested first.
+    """
+    source_class = GenomeCatalogue
+
+    RANKING_GROUP = "popular"
+
+    def build_from(self, catalogue):
+        ranking = catalogue.groups.get(self.RANKING_GROUP, {})
+        ranked = []
+        others = []
+        for genome_id, (_, organism, assembly) in catalogue.genomes.items():
+            if genome_id not in catalogue.genome_releases:
+                continue
+            order = ranking.get(organism.organism_id)
+            for name in genome_names(organism, assembly):
+                if order is None:
+                    others.append((name, 0, genome_id))
+                else:
+                    ranked.append((name, order or 0, genome_id))
+        return Suggestions(catalogue, SortedNames(ranked), SortedNames(others))
+
+    def suggest(self, prefix):
+        """
+        Genomes with a name starting with prefix, case-insensitively. Genomes of the ranking group members
+        come first, by group order, then the other genomes by name. Matches are produced lazily so callers
+        only pay for what they consume.
+
+        Args:
+            prefix (str): Beginning of an organism or assembly name.
+
+        Yields:
+            tuple: (Genome, Organism, Assembly, List[GenomeRelease]) for each distinct genome.
+        """
+        content = self.content
+        prefix = normalise(prefix)
+        seen = set()
+        # Ranking group members are few, so all their matches can be sorted by rank
+        ranked = sorted((rank, genome_id) for _, rank, genome_id in content.ranked.starting_with(prefix))
+        others = ((rank, genome_id) for _, rank, genome_id in content.others.starting_with(prefix))
+        for matches in (ranked, others):
+            for _, genome_id in matches:
+                if genome_id in seen:
+                    continue
+                seen.add(genome_id)
+                genome, organism, assembly = content.catalogue.genomes[genome_id]
+                yield genome, organism, assembly, content.catalogue.genome_releases[genome_id]
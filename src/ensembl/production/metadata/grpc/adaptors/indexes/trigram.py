@@ -0,0 +1,110 @@
+# See the NOTICE file distributed with this work for additional information
+#   regarding copyright ownership.
+#   Licensed under the Apache License, Version 2.0 (the "License");
+#   you may not use this file except in compliance with the License.
+#   You may obtain a copy of the License at
+#       http://www.apache.org/licenses/LICENSE-2.0
+#   Unless required by applicable law or agreed to in writing, software
+#   distributed under the License is distributed on an "AS IS" BASIS,
+#   WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+#   See the License for the specific language governing permissions and
+#   limitations under the License.
+from collections import Counter
+
+from ensembl.production.metadata.grpc.adaptors.indexes.base import DerivedIndex
+from ensembl.production.metadata.grpc.adaptors.indexes.dimensions import normalise
+from ensembl.production.metadata.grpc.adaptors.indexes.genomes import GenomeCatalogue
+from ensembl.production.metadata.grpc.adaptors.indexes.keyword import genome_keywords
+
+
+def trigrams(value):
+    """Distinct character trigrams of a normalised value, padded so that its beginning and end weigh more."""
+    padded = f"  {value} "
+    return {padded[i:i + 3] for i in range(len(padded) - 2)}
+
+
+class FuzzyNames:
+    """
+    Content of the trigram index.
+
+    Attributes:
+        names (List[str]): Distinct normalised names.
+        name_trigrams (List[int]): Number of trigrams of each name.
+        name_genomes (List[List[int]]): genome_id of the genomes having each name.
+        postings (Dict[str, List[int]]): Positions in names of the names containing each trigram.
+        rows (Dict[int, list]): (Genome, GenomeRelease, Assembly, Organism) rows of each genome, by
+            genome_release_id.
+    """
+
+    def __init__(self):
+        self.names = []
+        self.name_trigrams = []
+        self.name_genomes = []
+        self.postings = {}
+        self.rows = {}
+
+
+class TrigramIndex(DerivedIndex):
+    """
+    Character trigram index over the names a genome can be found by with a keyword search, for typo-tolerant
+    search. Names are scored against the searched keyword by the Jaccard similarity of their trigram sets.
+    """
+    source_class = GenomeCatalogue
+
+    # Minimum similarity of a name to the keyword for its genomes to match
+    MIN_SIMILARITY = 0.35
+    # Maximum number of best scoring names considered, bounds the size of the result
+    MAX_CANDIDATES = 20
+
+    def build_from(self, catalogue):
+        content = FuzzyNames()
+        positions = {}
+        for genome_id, (genome, organism, assembly) in catalogue.genomes.items():
+            rows = [(genome, genome_release, assembly, organism)
+                    for genome_release in catalogue.genome_releases.get(genome_id, ())]
+            if not rows:
+                continue
+            content.rows[genome_id] = rows
+            for name in genome_keywords(organism, assembly):
+                position = positions.get(name)
+                if position is None:
+                    position = positions[name] = len(content.names)
+                    name_trigrams = trigrams(name)
+                    content.names.append(name)
+                    content.name_trigrams.append(len(name_trigrams))
+                    content.name_genomes.append([])
+                    for trigram in name_trigrams:
+                        content.postings.setdefault(trigram, []).append(position)
+                content.name_genomes[position].append(genome_id)
+        return content
+
+    def search(self, keyword):
+        """
+        Rows of the genomes having a name similar to keyword.
+
+        Args:
+            keyword (str): Searched keyword, possibly misspelt.
+
+        Returns:
+            list: (Genome, GenomeRelease, Assembly, Organism) rows, best scoring genomes first, then by
+                genome_id and genome_release_id.
+        """
+        content = self.content
+        keyword_trigrams = trigrams(normalise(keyword))
+        shared = Counter()
+        for trigram in keyword_trigrams:
+            shared.update(content.postings.get(trigram, ()))
+        scores = {}
+        for position, count in shared.items():
+            similarity = count / (len(keyword_trigrams) + content.name_trigrams[position] - count)
+            if similarity >= self.MIN_SIMILARITY:
+                scores[position] = similarity
+        best = sorted(scores, key=lambda position: (-scores[position], position))[:self.MAX_CANDIDATES]
+        genome_scores = {}
+        for position in best:
+            for genome_id in content.name_genomes[position]:
+                genome_scores[genome_id] = max(genome_scores.get(genome_id, 0), scores[position])
+        rows = []
+        for genome_id in sorted(genome_scores, key=lambda genome_id: (-genome_scores[genome_id], genome_id)):
+            rows.extend(content.rows[genome_id])
+        return rows
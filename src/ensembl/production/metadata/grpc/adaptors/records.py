@@ -0,0 +1,78 @@
+# See the NOTICE file distributed with this work for additional information
+#   regarding copyright ownership.
+#   Licensed under the Apache License, Version 2.0 (the "License");
+#   you may not use this file except in compliance with the License.
+#   You may obtain a copy of the License at
+#       http://www.apache.org/licenses/LICENSE-2.0
+#   Unless required by applicable law or agreed to in writing, software
+#   distributed under the License is distributed on an "AS IS" BASIS,
+#   WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+#   See the License for the specific language governing permissions and
+#   limitations under the License.
+from collections import namedtuple
+from functools import lru_cache
+
+import sqlalchemy as db
+
+
+class Projection:
+    """
+    Subset of the columns of an ORM entity, selected in place of the entity and returned as a named tuple
+    named after it, so that the protobuf builders reading e.g. row.Assembly.name work with either, without the
+    cost of hydrating ORM instances.
+
+    Args:
+        entity: The ORM class.
+        *columns (str): Names of the columns to select.
+    """
+
+    def __init__(self, entity, *columns):
+        self.name = entity.__name__
+        self.columns = [getattr(entity, column) for column in columns]
+        self.type = namedtuple(self.name, columns)
+
+
+def projected_columns(projections):
+    """The columns to select for the projections, in order."""
+    return [column for projection in projections for column in projection.columns]
+
+
+def projected_values(result, projections):
+    """
+    Split a result row selected with projected_columns() into a named tuple per projection.
+
+    Returns:
+        list: The named tuples, followed by the values of any column selected after the projections.
+    """
+    values = []
+    start = 0
+    for projection in projections:
+        end = start + len(projection.columns)
+        values.append(projection.type._make(result[start:end]))
+        start = end
+    values += result[start:]
+    return values
+
+
+@lru_cache(maxsize=None)
+def record_projection(entity):
+    """Projection of all the columns of an entity: its record type."""
+    return Projection(entity, *[column.key for column in db.inspect(entity).column_attrs])
+
+
+def records_select(*entities):
+    """Select of the records of the entities (all their columns), rows to be read with read_records()."""
+    return db.select(*projected_columns([record_projection(entity) for entity in entities]))
+
+
+def read_records(results, *entities):
+    """
+    Records of the rows of a records_select() of the same entities.
+
+    Returns:
+        list: The record of each row if it has a single entity and no other column, else a tuple per row of
+            the records followed by the values of the other columns.
+    """
+    projections = [record_projection(entity) for entity in entities]
+    rows = [projected_values(result, projections) for result in results]
+    return [values[0] if len(values) == 1 else tuple(values) for values in rows]
@@ -13,7 +13,7 @@ import logging
 
 import sqlalchemy as db
 
-from ensembl.production.metadata.grpc.adaptors.base import check_parameter, BaseAdaptor
+from ensembl.production.metadata.grpc.adaptors.base import check_parameter, row_type, BaseAdaptor
 from ensembl.production.metadata.api.models import EnsemblRelease, EnsemblSite, GenomeRelease, Genome, GenomeDataset, \
     Dataset
 
@@ -29,6 +29,8 @@ class ReleaseAdaptor(BaseAdaptor):
             current_only=True,
             release_type=None,
             site_name=None,
+            after_release_id=None,
+            limit=None,
     ):
         """
         Fetches releases based on the provided parameters.
@@ -39,50 +41,36 @@ class ReleaseAdaptor(BaseAdaptor):
             current_only (bool): Flag indicating whether to fetch only current releases.
             release_type (str or list or None): Release type(s) to filter by.
             site_name (str or list or None): Name(s) of the Ensembl site to filter by.
+            after_release_id (int or None): Only the releases past this release ID, to fetch the next page of
+                a listing (keyset pagination).
+            limit (int or None): Maximum number of releases to fetch.
 
         Returns:
-            list: A list of fetched releases.
+            list: A list of fetched releases, by release ID.
         """
         release_id = check_parameter(release_id)
         release_version = check_parameter(release_version)
         release_type = check_parameter(release_type)
         site_name = check_parameter(site_name)
 
-        release_select = db.select(
-            EnsemblRelease, EnsemblSite
-        ).join(EnsemblRelease.ensembl_site)
-
-        # WHERE ensembl_release.release_id = :release_id_1
-        if release_id is not None:
-            release_select = release_select.filter(
-                EnsemblRelease.release_id.in_(release_id)
-            )
-        # WHERE ensembl_release.version = :version_1
-        elif release_version is not None:
-            release_select = release_select.filter(
-                EnsemblRelease.version.in_(release_version)
-            )
-        # WHERE ensembl_release.is_current =:is_current_1
-        elif current_only:
-            release_select = release_select.filter(
-                EnsemblRelease.is_current == 1
-            )
-
-        # WHERE ensembl_release.release_type = :release_type_1
-        if release_type is not None:
-            release_select = release_select.filter(
-                EnsemblRelease.release_type.in_(release_type)
-            )
-
-        # WHERE ensembl_site.name = :name_1
-        if site_name is not None:
-            release_select = release_select.filter(
-                EnsemblSite.name.in_(site_name)
-            )
-        logger.debug(f"Query: {release_select}")
-        with self.metadata_db.session_scope() as session:
-            session.expire_on_commit = False
-            return session.execute(release_select).all()
+        # Releases and sites are served from the in-memory dimension tables.
+        # The filters are applied in the same order of precedence as the former SQL query:
+        # release_id, else release_version, else current_only
+        releases = self.dimensions.released_releases(
+            release_id=release_id,
+            release_version=release_version if release_id is None else None,
+            current_only=current_only and release_id is None and release_version is None,
+            release_type=release_type,
+            site_name=site_name,
+        )
+        if after_release_id is not None:
+            releases = [
+                (release, site) for release, site in releases if release.release_id > after_release_id
+            ]
+        if limit is not None:
+            releases = releases[:limit]
+        row = row_type("EnsemblRelease", "EnsemblSite")
+        return [row(release, site) for release, site in releases]
 
     def fetch_releases_for_genome(self, genome_uuid, site_name=None):
 
@@ -99,7 +87,7 @@ class ReleaseAdaptor(BaseAdaptor):
         )
 
         release_ids = []
-        with self.metadata_db.session_scope() as session:
+        with self.metadata_db.release_scope() as session:
             release_objects = session.execute(release_id_select).all()
             for rid in release_objects:
                 release_ids.append(rid[0])
@@ -121,7 +109,7 @@ class ReleaseAdaptor(BaseAdaptor):
         )
 
         release_ids = []
-        with self.metadata_db.session_scope() as session:
+        with self.metadata_db.release_scope() as session:
             release_objects = session.execute(release_id_select).all()
             for rid in release_objects:
                 release_ids.append(rid[0])
@@ -134,7 +122,7 @@ class NewReleaseAdaptor(BaseAdaptor):
     def __init__(self, metadata_uri=None):
         super().__init__(metadata_uri)
         # Get current release ID from ensembl_release
-        with self.metadata_db.session_scope() as session:
+        with self.metadata_db.release_scope() as session:
             self.current_release_id = (
                 session.execute(db.select(EnsemblRelease.release_id).filter(EnsemblRelease.is_current == 1)).one()[0])
         if self.current_release_id == "":
@@ -142,7 +130,7 @@ class NewReleaseAdaptor(BaseAdaptor):
         logger.debug(f'Release ID: {self.current_release_id}')
 
         # Get last release ID from ensembl_release
-        with self.metadata_db.session_scope() as session:
+        with self.metadata_db.release_scope() as session:
             ############### Refactor this once done. It is messy.
             current_version = int(session.execute(
                 db.select(EnsemblRelease.version).filter(EnsemblRelease.release_id == self.current_release_id)).one()[
@@ -162,7 +150,7 @@ class NewReleaseAdaptor(BaseAdaptor):
     #     new_genomes (list of new genomes in the new release)
     def fetch_new_genomes(self):
         # TODO: this code must be never called yet, because it would never work!!!!
-        with self.metadata_db.session_scope() as session:
+        with self.metadata_db.release_scope() as session:
             genome_selector = db.select(
                 EnsemblRelease, EnsemblSite
             ).join(EnsemblRelease.ensembl_site)
@@ -0,0 +1,174 @@
+# See the NOTICE file distributed with this work for additional information
+#   regarding copyright ownership.
+#   Licensed under the Apache License, Version 2.0 (the "License");
+#   you may not use this file except in compliance with the License.
+#   You may obtain a copy of the License at
+#       http://www.apache.org/licenses/LICENSE-2.0
+#   Unless required by applicable law or agreed to in writing, software
+#   distributed under the License is distributed on an "AS IS" BASIS,
+#   WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+#   See the License for the specific language governing permissions and
+#   limitations under the License.
+import contextvars
+import itertools
+import logging
+import threading
+import time
+from contextlib import contextmanager, ExitStack
+
+import sqlalchemy as db
+from ensembl.database import DBConnection
+
+from ensembl.production.metadata.grpc.config import MetadataConfig as config
+
+logger = logging.getLogger(__name__)
+
+# Sessions of the current unit of work (exit stack, and sessions by DB and routing), None outside of one
+_unit_sessions = contextvars.ContextVar("unit_sessions", default=None)
+
+
+@contextmanager
+def unit_of_work():
+    """
+    Share one session per DB between the adaptor calls made within the block (e.g. by one RPC): each DB is
+    read with a single connection checkout and transaction, so from one consistent snapshot. The sessions are
+    opened on first use, and closed when the block exits. Nested units of work join the outer one.
+    """
+    if _unit_sessions.get() is not None:
+        yield
+        return
+    with ExitStack() as stack:
+        token = _unit_sessions.set((stack, {}))
+        try:
+            yield
+        finally:
+            _unit_sessions.reset(token)
+
+
+class ReplicatedDB:
+    """
+    Connection to a primary DB and its read replicas, used in place of a DBConnection.
+
+    Sessions are opened on the healthy replicas in turn, and on the primary when there is no replica or none
+    is healthy. A replica is ejected for eject_seconds when a session on it fails to connect, or fails with a
+    database error (the failing session still raises).
+
+    Each instance holds the engines and connection pools of its DBs: use shared() to get the one of a DB.
+
+    Args:
+        primary_uri (str): URI of the primary DB.
+        replica_uris (List[str]): URIs of the read replicas, none to always use the primary.
+        eject_seconds (int): Number of seconds an unhealthy replica is left out.
+        pin_releases (bool): Open the sessions of release_scope() on the primary, so that reads depending on
+            the release state are never behind it (e.g. a replica lagging after a new release).
+    """
+
+    # Instances shared by the adaptors, keyed by primary and replica URIs
+    _shared = {}
+    _shared_lock = threading.Lock()
+
+    def __init__(self, primary_uri, replica_uris=(), eject_seconds=None, pin_releases=None):
+        self.primary = self._connect(primary_uri)
+        self.replicas = [self._connect(uri) for uri in replica_uris]
+        self.eject_seconds = config.replica_eject_seconds if eject_seconds is None else eject_seconds
+        self.pin_releases = config.replica_pin_releases if pin_releases is None else pin_releases
+        self._ejected_until = [0.0] * len(self.replicas)
+        self._turns = itertools.count()
+        self._lock = threading.Lock()
+
+    @classmethod
+    def shared(cls, primary_uri, replica_uris=()):
+        """Return the connection to the given DB and replicas, created on first call."""
+        key = (str(primary_uri), tuple(str(uri) for uri in replica_uris))
+        with cls._shared_lock:
+            replicated_db = cls._shared.get(key)
+            if replicated_db is None:
+                replicated_db = cls._shared[key] = cls(primary_uri, replica_uris)
+            return replicated_db
+
+    @staticmethod
+    def _connect(uri):
+        return DBConnection(uri, pool_size=config.pool_size, pool_recycle=config.pool_recycle)
+
+    def healthy_replicas(self):
+        """Indexes of the replicas currently in use, in the order they are tried for the next session."""
+        now = time.time()
+        with self._lock:
+            start = next(self._turns)
+            healthy = [index for index, until in enumerate(self._ejected_until) if until <= now]
+        if not healthy:
+            return []
+        start %= len(healthy)
+        return healthy[start:] + healthy[:start]
+
+    def eject(self, index):
+        """Leave a replica out for eject_seconds."""
+        with self._lock:
+            self._ejected_until[index] = time.time() + self.eject_seconds
+        logger.warning("Ejected read replica %s for %ss", index, self.eject_seconds)
+
+    def _route(self, primary):
+        """The replica to open a session on (index and connection), or the primary (None and connection)."""
+        if not primary:
+            healthy = self.healthy_replicas()
+            if healthy:
+                return healthy[0], self.replicas[healthy[0]]
+        return None, self.primary
+
+    @contextmanager
+    def session_scope(self, primary=False):
+        """
+        Session on a healthy replica, or on the primary. Within a unit of work, the session of the unit for
+        this DB.
+
+        Args:
+            primary (bool): Open the session on the primary whatever the replicas.
+        """
+        # Without replicas, every session is on the primary
+        primary = primary or not self.replicas
+        unit = _unit_sessions.get()
+        if unit is None:
+            with self._session_scope(primary) as session:
+                yield session
+            return
+        stack, sessions = unit
+        session = sessions.get((self, primary))
+        if session is None:
+            session = sessions[(self, primary)] = stack.enter_context(self._session_scope(primary))
+            # The rows are used after the unit of work ends
+            session.expire_on_commit = False
+        try:
+            yield session
+        except db.exc.SQLAlchemyError as e:
+            self._check_failure(session.info.get("replica"), e)
+            # Keep the session usable by the next adaptor calls of the unit
+            session.rollback()
+            raise
+
+    @contextmanager
+    def _session_scope(self, primary):
+        index, connection = self._route(primary)
+        try:
+            with connection.session_scope() as session:
+                session.info["replica"] = index
+                yield session
+        except db.exc.SQLAlchemyError as e:
+            self._check_failure(index, e)
+            raise
+
+    def _check_failure(self, index, error):
+        """Eject the replica a session failed on (index, None for the primary) on a database error."""
+        if index is not None and isinstance(error, db.exc.DBAPIError) \
+                and (error.connection_invalidated or isinstance(error, db.exc.OperationalError)):
+            self.eject(index)
+
+    def stream_scope(self):
+        """
+        Session of its own, outside of any unit of work, for a result streamed with a server-side cursor: its
+        connection cannot run other queries until the result is consumed.
+        """
+        return self._session_scope(not self.replicas)
+
+    def release_scope(self):
+        """Session for reads depending on the release state, on the primary if pin_releases is set."""
+        return self.session_scope(primary=self.pin_releases)
@@ -0,0 +1,243 @@
+# See the NOTICE file distributed with this work for additional information
+#   regarding copyright ownership.
+#   Licensed under the Apache License, Version 2.0 (the "License");
+#   you may not use this file except in compliance with the License.
+#   You may obtain a copy of the License at
+#       http://www.apache.org/licenses/LICENSE-2.0
+#   Unless required by applicable law or agreed to in writing, software
+#   distributed under the License is distributed on an "AS IS" BASIS,
+#   WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+#   See the License for the specific language governing permissions and
+#   limitations under the License.
+from ensembl.production.metadata.grpc.adaptors.base import BaseAdaptor, row_type
+from ensembl.production.metadata.grpc.adaptors.indexes.aliases import AliasIndex
+from ensembl.production.metadata.grpc.adaptors.indexes.counts import RelatedAssemblyCounts, \
+    OrganismGroupCounts
+from ensembl.production.metadata.grpc.adaptors.indexes.keyword import KeywordIndex, AccessionGroups, \
+    group_by_accession
+from ensembl.production.metadata.grpc.adaptors.indexes.prefix import PrefixIndex
+from ensembl.production.metadata.grpc.adaptors.indexes.trigram import TrigramIndex
+
+
+class GenomeSearchAdaptor(BaseAdaptor):
+    """
+    Genome lookups served from the in-memory indexes: alias resolution of genome names and tags to genome
+    UUIDs, keyword search, type-ahead suggestions and genome counts.
+    """
+
+    def __init__(self, metadata_uri, metadata_replica_uris=()):
+        super().__init__(metadata_uri, metadata_replica_uris)
+        self.aliases = AliasIndex.shared(metadata_uri, self.metadata_db)
+        self.keywords = KeywordIndex.shared(metadata_uri, self.metadata_db)
+        self.prefixes = PrefixIndex.shared(metadata_uri, self.metadata_db)
+        self.trigrams = TrigramIndex.shared(metadata_uri, self.metadata_db)
+        self.related_counts = RelatedAssemblyCounts.shared(metadata_uri, self.metadata_db)
+        self.group_counts = OrganismGroupCounts.shared(metadata_uri, self.metadata_db)
+
+    def _alias_rows(self, targets, allow_unreleased):
+        """
+        UUIDs of the rows fetch_genomes() returns for the given genomes with its default release filters: all
+        the genomes if unreleased ones are allowed or none is released, else one row per current genome
+        release.
+        """
+        if allow_unreleased or not any(target.released for target in targets):
+            return [target.genome.genome_uuid for target in targets]
+        rows = []
+        for target in targets:
+            for genome_release in target.genome_releases:
+                release = self.dimensions.release(genome_release.release_id)
+                if genome_release.is_current == 1 and release is not None \
+                        and self.dimensions.site(release.site_id):
+                    rows.append(target.genome.genome_uuid)
+        return rows
+
+    def fetch_genome_uuid(self, ensembl_name, assembly_name, use_default_assembly=False,
+                          allow_unreleased=False):
+        """
+        Resolves an organism Ensembl name and assembly name to a genome UUID, from the in-memory alias index.
+
+        When no genome matches, the assembly default name alone is tried (see EA-1112).
+
+        Args:
+            ensembl_name (str): Ensembl name of the organism.
+            assembly_name (str): Assembly name, or assembly default name if use_default_assembly is set.
+            use_default_assembly (bool): Whether assembly_name is the assembly default name.
+            allow_unreleased (bool): Whether unreleased genomes can be returned too.
+
+        Returns:
+            str or None: The genome UUID, None unless exactly one genome matches.
+        """
+        rows = self._alias_rows(
+            self.aliases.by_assembly(ensembl_name, assembly_name, use_default_assembly), allow_unreleased
+        )
+        if not rows:
+            # PATCH: This is a special case, see EA-1112 for more details
+            rows = self._alias_rows(self.aliases.by_default_assembly(assembly_name), allow_unreleased)
+        return rows[0] if len(rows) == 1 else None
+
+    def fetch_genome_uuid_by_tag(self, genome_tag, allow_unreleased=False):
+        """
+        Resolves a genome tag (assembly URL name or ToL ID) to a genome UUID, from the in-memory alias index.
+
+        Returns:
+            str or None: The genome UUID, None unless exactly one genome matches.
+        """
+        rows = self._alias_rows(self.aliases.by_tag(genome_tag), allow_unreleased)
+        return rows[0] if len(rows) == 1 else None
+
+    def _keyword_release(self, genome_release, release_version):
+        """
+        The release of a genome release row if it passes the release filter of the keyword searches: a current
+        release if release_version is 0 or None, else a release up to release_version. None otherwise.
+        """
+        release = self.dimensions.release(genome_release.release_id)
+        if release is None:
+            return None
+        if release_version == 0 or release_version is None:
+            return release if release.is_current == 1 else None
+        return release if release.version <= release_version else None
+
+    def _keyword_candidates(self, keyword, fuzzy):
+        # Served from the in-memory keyword index: a keyword matches a genome if it is equal,
+        # case-insensitively, to its tol_id, accession, assembly name or Ensembl name, organism common,
+        # scientific or parlance name, or species taxonomy ID. In fuzzy mode, the trigram index matches values
+        # similar to the keyword instead.
+        if keyword is not None and fuzzy:
+            return self.trigrams.search(keyword)
+        if keyword is not None:
+            return self.keywords.lookup(keyword)
+        return self.keywords.all()
+
+    def fetch_genome_by_keyword(self, keyword=None, release_version=None, fuzzy=False):
+        """
+        Fetches genomes based on a keyword and release version.
+
+        Args:
+            keyword (str or None): Keyword to search for in various attributes of genomes, assemblies, and
+                organisms.
+            release_version (int or None): Release version to filter by. If set to 0 or None, fetches only
+                current genomes.
+            fuzzy (bool): Whether to also match values similar to the keyword (e.g. misspelt), best matches
+                first.
+
+        Returns:
+            list: A list of fetched genomes matching the keyword and release version.
+        """
+        row = row_type("Genome", "GenomeRelease", "EnsemblRelease", "Assembly", "Organism", "EnsemblSite")
+        genomes = []
+        for genome, genome_release, assembly, organism in self._keyword_candidates(keyword, fuzzy):
+            release = self._keyword_release(genome_release, release_version)
+            if release is None:
+                continue
+            site = self.dimensions.site(release.site_id)
+            genomes.append(row(genome, genome_release, release, assembly, organism, site))
+        return genomes
+
+    def fetch_latest_genomes_by_keyword(self, keyword=None, release_version=None, fuzzy=False, paged=False,
+                                        after_accession=None):
+        """
+        Fetches the most recent genome of each assembly accession matching a keyword.
+
+        Same search as fetch_genome_by_keyword(), but only the row of the latest release passing the release
+        filter is produced for each assembly accession, so that the result size does not grow with the number
+        of past releases. For exact keywords, the rows are grouped by accession when the keyword index is
+        built.
+
+        Args:
+            keyword (str or None): Keyword to search for in various attributes of genomes, assemblies, and
+                organisms.
+            release_version (int or None): Release version to filter by. If set to 0 or None, fetches only
+                current genomes.
+            fuzzy (bool): Whether to also match values similar to the keyword (e.g. misspelt), best matches
+                first.
+            paged (bool): Order the accessions by accession instead, for keyset pagination.
+            after_accession (str or None): If paged, only the accessions sorting after this one (matched or
+                not), to fetch the next page of a listing.
+
+        Yields:
+            Row: Genome, GenomeRelease, EnsemblRelease, Assembly, Organism and EnsemblSite, one per accession,
+                in the order the accessions are first matched, or by accession if paged.
+        """
+        if paged and keyword is not None and not fuzzy:
+            groups = self.keywords.lookup_accessions_after(keyword, after_accession)
+        elif paged:
+            groups = AccessionGroups(group_by_accession(self._keyword_candidates(keyword, fuzzy)))
+            groups = groups.after(after_accession)
+        elif keyword is not None and not fuzzy:
+            groups = self.keywords.lookup_by_accession(keyword)
+        else:
+            groups = group_by_accession(self._keyword_candidates(keyword, fuzzy))
+        row = row_type("Genome", "GenomeRelease", "EnsemblRelease", "Assembly", "Organism", "EnsemblSite")
+        for rows in groups:
+            latest = None
+            for genome, genome_release, assembly, organism in rows:
+                release = self._keyword_release(genome_release, release_version)
+                # First row of the most recent release wins
+                if release is not None and (latest is None or release.version > latest[2].version):
+                    latest = (genome, genome_release, release, assembly, organism)
+            if latest is not None:
+                yield row(*latest, self.dimensions.site(latest[2].site_id))
+
+    def fetch_genome_suggestions(self, prefix, limit=10, release_version=None):
+        """
+        Fetches genomes for type-ahead search, from the in-memory prefix index.
+
+        Args:
+            prefix (str): Beginning of an organism name (scientific, common or parlance name), assembly name
+                or assembly accession, case-insensitive.
+            limit (int): Maximum number of genomes to return.
+            release_version (float or None): Only genomes released up to this version, in their latest release
+                up to it. Genomes in the current release if None or 0.
+
+        Returns:
+            list: Rows with Genome, GenomeRelease, EnsemblRelease, Assembly, Organism and EnsemblSite, popular
+                group members first, by group order, then the other genomes by name.
+        """
+        row = row_type("Genome", "GenomeRelease", "EnsemblRelease", "Assembly", "Organism", "EnsemblSite")
+        genomes = []
+        if not prefix or limit <= 0:
+            return genomes
+        for genome, organism, assembly, genome_releases in self.prefixes.suggest(prefix):
+            selected = None
+            for genome_release in genome_releases:
+                release = self._keyword_release(genome_release, release_version)
+                if release is not None and (selected is None or release.version > selected[1].version):
+                    selected = (genome_release, release)
+            if selected is None:
+                continue
+            genome_release, release = selected
+            site = self.dimensions.site(release.site_id)
+            genomes.append(row(genome, genome_release, release, assembly, organism, site))
+            if len(genomes) >= limit:
+                break
+        return genomes
+
+    def fetch_organisms_group_counts(self, release_version=None, group_code='popular'):
+        """
+        Fetch the number of genomes of the species of each organism in an organism group.
+
+        Args:
+            release_version (float or None): Only count the genomes released up to this version. All the
+                genomes if None or 0.
+            group_code (str): The organism group.
+
+        Returns:
+            List[GroupCount]: (species_taxonomy_id, ensembl_name, common_name, scientific_name, order, count)
+                of each member of the group with genomes, in the group order.
+        """
+        return self.group_counts.counts(group_code, release_version)
+
+    def fetch_related_assemblies_count(self, organism_uuid, release_version=None):
+        """
+        Fetch the number of assemblies (genomes) of all the organisms sharing the species_taxonomy_id of an
+        organism, from the precomputed counts.
+
+        Args:
+            organism_uuid (str): UUID of the organism.
+            release_version (float or None): Only count the genomes released up to this version. All the
+                genomes if None or 0.
+
+        Returns:
+            int: The number of related assemblies.
+        """
+        return self.related_counts.count(organism_uuid, release_version)
@@ -0,0 +1,59 @@
+#  See the NOTICE file distributed with this work for additional information
+#  regarding copyright ownership.
+#  Licensed under the Apache License, Version 2.0 (the "License");
+#  you may not use this file except in compliance with the License.
+#  You may obtain a copy of the License at
+#      http://www.apache.org/licenses/LICENSE-2.0
+#  Unless required by applicable law or agreed to in writing, software
+#  distributed under the License is distributed on an "AS IS" BASIS,
+#  WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+#  See the License for the specific language governing permissions and
+#  limitations under the License.
+import logging
+
+from ensembl.production.metadata.grpc import ensembl_metadata_pb2, ensembl_metadata_pb2_grpc
+from ensembl.production.metadata.grpc.cache_warmup import rebuild
+
+logger = logging.getLogger(__name__)
+
+
+class EnsemblMetadataAdminServicer(ensembl_metadata_pb2_grpc.EnsemblMetadataAdminServicer):
+    """
+    Cache introspection and invalidation for the metadata servicer.
+
+    Args:
+        servicer (EnsemblMetadataServicer): The servicer whose caches are managed.
+        access_log (AccessLog): Access log used to pre-warm the caches after a rebuild, if any.
+        prewarm_top_n (int): Number of most requested keys replayed per RPC after a rebuild.
+    """
+
+    def __init__(self, servicer, access_log=None, prewarm_top_n=0):
+        self.servicer = servicer
+        self.access_log = access_log
+        self.prewarm_top_n = prewarm_top_n
+
+    def ListCaches(self, request, context):
+        return ensembl_metadata_pb2.CacheList(
+            caches=[ensembl_metadata_pb2.CacheStatistics(**stats) for stats in self.servicer.caches.stats()]
+        )
+
+    def InvalidateCache(self, request, context):
+        # Only the cached responses are dropped, the in-memory indexes they are computed from are reloaded by
+        # RebuildCaches
+        criteria = {}
+        if request.genome_uuid:
+            criteria["genome_uuid"] = request.genome_uuid
+        if request.release_version:
+            criteria["release_version"] = request.release_version
+        if request.site_name:
+            criteria["site_name"] = request.site_name
+        if not criteria:
+            # Nothing to match on, use RebuildCaches to drop everything
+            return ensembl_metadata_pb2.InvalidateCacheResult(invalidated=0)
+        invalidated = self.servicer.caches.invalidate(list(request.cache_name), **criteria)
+        logger.info("Invalidated %s cache entries matching %s", invalidated, criteria)
+        return ensembl_metadata_pb2.InvalidateCacheResult(invalidated=invalidated)
+
+    def RebuildCaches(self, request, context):
+        prewarmed = rebuild(self.servicer, self.access_log, 0 if request.skip_prewarm else self.prewarm_top_n)
+        return ensembl_metadata_pb2.RebuildCachesResult(prewarmed=prewarmed)
@@ -0,0 +1,441 @@
+#  See the NOTICE file distributed with this work for additional information
+#  regarding copyright ownership.
+#  Licensed under the Apache License, Version 2.0 (the "License");
+#  you may not use this file except in compliance with the License.
+#  You may obtain a copy of the License at
+#      http://www.apache.org/licenses/LICENSE-2.0
+#  Unless required by applicable law or agreed to in writing, software
+#  distributed under the License is distributed on an "AS IS" BASIS,
+#  WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+#  See the License for the specific language governing permissions and
+#  limitations under the License.
+"""
+In-memory caches for gRPC responses.
+
+Each cache holds the responses of a single RPC, keyed by the fields of its request message. Entries are
+weighed by the serialised size of the protobuf messages they hold (``ByteSize()``) so the memory budget of a
+cache is expressed in bytes rather than in number of entries. Eviction follows LRU order, but a new entry is
+only admitted if it is requested more often than the entries it would evict (TinyLFU admission), which keeps
+one-off lookups such as keyword searches from flushing the frequently requested genomes.
+"""
+import logging
+import threading
+import time
+from collections import OrderedDict
+from contextlib import contextmanager
+
+from google.protobuf.field_mask_pb2 import FieldMask
+
+from ensembl.production.metadata.grpc.pagination import PAGE_FIELDS
+
+logger = logging.getLogger(__name__)
+
+_MISSING = object()
+
+
+def message_size(value):
+    """Size in bytes of a protobuf message, or of a sequence of messages for streaming responses."""
+    if hasattr(value, "ByteSize"):
+        return value.ByteSize()
+    return sum(message.ByteSize() for message in value)
+
+
+def key_size(key):
+    """Approximate size in bytes of a cache key: strings and bytes by length, scalars as 8 bytes."""
+    if isinstance(key, (str, bytes)):
+        return len(key)
+    if isinstance(key, tuple):
+        return sum(key_size(value) for value in key)
+    return 8
+
+
+class FrequencySketch:
+    """
+    Approximate access counts of cache keys (count-min sketch).
+
+    Counters saturate at 15 and are all halved once ``sample_size`` increments have been recorded, so the
+    sketch forgets keys which used to be popular but are not anymore.
+    """
+    MAX_COUNT = 15
+    SEEDS = (0x9E3779B9, 0x85EBCA6B, 0xC2B2AE35, 0x27D4EB2F)
+
+    def __init__(self, width=4096, sample_size=None):
+        # Round the width up to a power of two so that indexes can be computed with a mask
+        self.width = 1 << max(width - 1, 1).bit_length()
+        self._mask = self.width - 1
+        self._tables = [bytearray(self.width) for _ in self.SEEDS]
+        self.sample_size = sample_size or 10 * self.width
+        self._additions = 0
+
+    def _indexes(self, key):
+        key_hash = hash(key)
+        return [hash((seed, key_hash)) & self._mask for seed in self.SEEDS]
+
+    def increment(self, key):
+        for table, index in zip(self._tables, self._indexes(key)):
+            if table[index] < self.MAX_COUNT:
+                table[index] += 1
+        self._additions += 1
+        if self._additions >= self.sample_size:
+            self._age()
+
+    def frequency(self, key):
+        return min(table[index] for table, index in zip(self._tables, self._indexes(key)))
+
+    def _age(self):
+        for table in self._tables:
+            for index, count in enumerate(table):
+                if count:
+                    table[index] = count >> 1
+        self._additions //= 2
+
+    def clear(self):
+        for table in self._tables:
+            table[:] = bytes(self.width)
+        self._additions = 0
+
+
+class MessageCache:
+    """
+    Byte-budgeted LRU cache of protobuf responses with TinyLFU admission.
+
+    Args:
+        name (str): Name of the cache, by convention the name of the RPC it serves.
+        max_bytes (int): Memory budget of the cache, each entry being accounted with ``ByteSize()`` of its
+            messages, the size of its key and ENTRY_OVERHEAD_BYTES.
+        key_fields (Tuple[str]): Request fields making up the cache key, in order.
+        streaming (bool): Whether cached values are sequences of messages (server streaming RPC).
+        message_class (type): Protobuf class of the cached messages.
+        request_class (type): Protobuf class of the request messages.
+
+    Attributes:
+        generation (int): Incremented whenever entries are dropped by clear() or invalidate(), so that a value
+            loaded from data read before then is not stored afterwards.
+    """
+
+    # Expected average size of an entry, only used to size the frequency sketch
+    AVERAGE_ENTRY_BYTES = 1024
+    # Size accounted for each entry on top of its messages and key, so that empty responses (e.g. for an
+    # unknown UUID) are not free to cache
+    ENTRY_OVERHEAD_BYTES = 128
+
+    def __init__(self, name, max_bytes, key_fields=(), streaming=False, message_class=None,
+                 request_class=None):
+        self.name = name
+        self.max_bytes = max_bytes
+        self.key_fields = tuple(key_fields)
+        self.streaming = streaming
+        self.message_class = message_class
+        self.request_class = request_class
+        self._entries = OrderedDict()
+        self._bytes = 0
+        self.generation = 0
+        self._lock = threading.Lock()
+        self._sketch = FrequencySketch(width=min(max(max_bytes // self.AVERAGE_ENTRY_BYTES, 256), 1 << 16))
+        self._reset_counters()
+
+    def _reset_counters(self):
+        self.hits = 0
+        self.misses = 0
+        self.admitted = 0
+        self.rejected = 0
+        self.evicted = 0
+        self.created = time.time()
+
+    def __len__(self):
+        return len(self._entries)
+
+    def __contains__(self, key):
+        return key in self._entries
+
+    @property
+    def size_bytes(self):
+        return self._bytes
+
+    def request_for(self, key):
+        """Rebuild the request message a cache key was built from."""
+        fields = dict(zip(self.key_fields, key))
+        for field, value in fields.items():
+            if self.request_class.DESCRIPTOR.fields_by_name[field].message_type is FieldMask.DESCRIPTOR:
+                fields[field] = FieldMask(paths=value)
+        return self.request_class(**fields)
+
+    def key_for(self, request):
+        """
+        Build the cache key of a request message, repeated fields are turned into tuples, and field masks into
+        the tuple of their paths in canonical form (so that equivalent masks share the entry).
+        """
+        key = []
+        for field in self.key_fields:
+            value = getattr(request, field)
+            if isinstance(value, FieldMask):
+                canonical = FieldMask()
+                canonical.CanonicalFormFromMask(value)
+                value = canonical.paths
+            if not isinstance(value, (str, bytes, int, float, bool)):
+                value = tuple(value)
+            key.append(value)
+        return tuple(key)
+
+    @classmethod
+    def entry_size(cls, key, value):
+        """Size in bytes accounted for an entry against the budget of the cache."""
+        return cls.ENTRY_OVERHEAD_BYTES + key_size(key) + message_size(value)
+
+    def get(self, key, default=None):
+        with self._lock:
+            self._sketch.increment(key)
+            entry = self._entries.get(key)
+            if entry is None:
+                self.misses += 1
+                return default
+            self._entries.move_to_end(key)
+            self.hits += 1
+            return entry[0]
+
+    def put(self, key, value, generation=None):
+        """
+        Offer a value to the cache.
+
+        Args:
+            key (tuple): The cache key.
+            value: The message, or sequence of messages.
+            generation (int or None): Generation of the cache when the value started being loaded, the value
+                is not stored if the cache was cleared or invalidated since.
+
+        Returns:
+            bool: True if the value has been stored, False if the admission policy rejected it or it is
+                outdated. A value already cached for the key is kept in that case.
+        """
+        size = self.entry_size(key, value)
+        with self._lock:
+            if generation is not None and generation != self.generation:
+                return False
+            if size > self.max_bytes:
+                self.rejected += 1
+                return False
+
+            # Pick the least recently used entries that would make room for the new one. The candidate is only
+            # admitted if it is more frequently requested than every one of them.
+            previous = self._entries.get(key)
+            victims = []
+            to_free = self._bytes - (previous[1] if previous is not None else 0) + size - self.max_bytes
+            if to_free > 0:
+                candidate_frequency = self._sketch.frequency(key)
+                for victim_key, (_, victim_size) in self._entries.items():
+                    if to_free <= 0:
+                        break
+                    if victim_key == key:
+                        continue
+                    if self._sketch.frequency(victim_key) >= candidate_frequency:
+                        self.rejected += 1
+                        return False
+                    victims.append(victim_key)
+                    to_free -= victim_size
+
+            for victim_key in victims:
+                self._bytes -= self._entries.pop(victim_key)[1]
+                self.evicted += 1
+            if previous is not None:
+                self._bytes -= self._entries.pop(key)[1]
+            self._entries[key] = (value, size)
+            self._bytes += size
+            self.admitted += 1
+            return True
+
+    def restore(self, key, value, frequency=1):
+        """Put back an entry saved from a previous process, along with how often it had been requested."""
+        with self._lock:
+            for _ in range(frequency):
+                self._sketch.increment(key)
+        return self.put(key, value)
+
+    def items(self):
+        """Snapshot of the cached (key, value) pairs, from least to most recently used."""
+        with self._lock:
+            return [(key, entry[0]) for key, entry in self._entries.items()]
+
+    def frequency(self, key):
+        return self._sketch.frequency(key)
+
+    def invalidate(self, **criteria):
+        """
+        Drop the entries matching all the given field values.
+
+        A field of the request key matches if it is equal to the value (or contains it, for repeated fields).
+        A field which is not part of the key is looked up in the cached messages instead, and is ignored if
+        the messages do not have it either, so that an entry which may depend on the value is dropped.
+
+        Returns:
+            int: Number of dropped entries.
+        """
+        positions = {field: self.key_fields.index(field) for field in criteria if field in self.key_fields}
+
+        def matches(key, value):
+            messages = value if self.streaming else (value,)
+            for field, expected in criteria.items():
+                if field in positions:
+                    actual = key[positions[field]]
+                    if not (expected in actual if isinstance(actual, tuple) else actual == expected):
+                        return False
+                elif messages and field in messages[0].DESCRIPTOR.fields_by_name:
+                    if all(getattr(message, field) != expected for message in messages):
+                        return False
+            return True
+
+        with self._lock:
+            # Loads in progress may depend on the invalidated data
+            self.generation += 1
+            keys = [key for key, (value, _) in self._entries.items() if matches(key, value)]
+            for key in keys:
+                self._bytes -= self._entries.pop(key)[1]
+        return len(keys)
+
+    def get_or_load(self, key, loader):
+        """The cached value for key, calling loader() and offering its result to the cache on a miss."""
+        value = self.get(key, _MISSING)
+        if value is _MISSING:
+            generation = self.generation
+            value = loader()
+            if self.streaming:
+                value = tuple(value)
+            self.put(key, value, generation)
+        return value
+
+    def clear(self):
+        with self._lock:
+            self.generation += 1
+            self._entries.clear()
+            self._bytes = 0
+            self._sketch.clear()
+            self._reset_counters()
+
+    def stats(self):
+        lookups = self.hits + self.misses
+        return {
+            "name": self.name,
+            "entries": len(self._entries),
+            "size_bytes": self._bytes,
+            "max_bytes": self.max_bytes,
+            "hits": self.hits,
+            "misses": self.misses,
+            "hit_ratio": self.hits / lookups if lookups else 0.0,
+            "admitted": self.admitted,
+            "rejected": self.rejected,
+            "evicted": self.evicted,
+            "age_seconds": time.time() - self.created,
+        }
+
+
+class CacheRegistry:
+    """
+    Set of named response caches, one per cached RPC.
+
+    Args:
+        caches (Iterable[MessageCache]): The caches.
+        access_log (AccessLog): Records the keys of the requests served through the caches, if set.
+    """
+
+    def __init__(self, caches=(), access_log=None):
+        self._caches = OrderedDict()
+        self.access_log = access_log
+        self._local = threading.local()
+        for cache in caches:
+            self.add(cache)
+
+    def add(self, cache):
+        self._caches[cache.name] = cache
+
+    def get(self, name):
+        return self._caches.get(name)
+
+    def __iter__(self):
+        return iter(self._caches.values())
+
+    def __len__(self):
+        return len(self._caches)
+
+    def fetch(self, name, request, loader):
+        """
+        Serve an RPC from its cache.
+
+        Args:
+            name (str): Name of the cache (RPC).
+            request: The request message, used to build the cache key.
+            loader (Callable): Computes the response on a cache miss.
+
+        Returns:
+            The response message, or an iterator over the response messages for streaming RPCs.
+        """
+        cache = self._caches.get(name)
+        if cache is None:
+            return loader()
+        key = cache.key_for(request)
+        if self.access_log is not None and not getattr(self._local, "unrecorded", False):
+            self.access_log.record(name, key)
+        value = cache.get_or_load(key, loader)
+        return iter(value) if cache.streaming else value
+
+    @contextmanager
+    def unrecorded(self):
+        """Serve the requests of the calling thread without recording them in the access log, e.g. replays."""
+        self._local.unrecorded = True
+        try:
+            yield
+        finally:
+            self._local.unrecorded = False
+
+    def clear(self):
+        for cache in self:
+            cache.clear()
+
+    def invalidate(self, names=None, **criteria):
+        """
+        Drop the entries matching the criteria from the named caches (all of them if names is empty).
+
+        Returns:
+            int: Number of dropped entries.
+        """
+        return sum(cache.invalidate(**criteria) for cache in self if not names or cache.name in names)
+
+    def stats(self):
+        return [cache.stats() for cache in self]
+
+    def log_stats(self, level=logging.INFO):
+        for stats in self.stats():
+            logger.log(
+                level,
+                "Cache %(name)s: %(entries)d entries, %(size_bytes)d/%(max_bytes)d bytes, "
+                "hit ratio %(hit_ratio).3f, %(evicted)d evicted, %(rejected)d rejected",
+                stats
+            )
+
+
+def build_caches(service_descriptor, budgets, max_bytes, message_module):
+    """
+    Create the caches for the RPCs of a gRPC service. The page fields of paged requests are not part of the
+    cache keys, as pages are not cached.
+
+    Args:
+        service_descriptor: Protobuf descriptor of the gRPC service.
+        budgets (Dict[str, float]): Share of max_bytes allocated to each cached RPC.
+        max_bytes (int): Overall memory budget of the caches, 0 disables caching.
+        message_module: Generated ``*_pb2`` module holding the request and response classes.
+
+    Returns:
+        CacheRegistry: The caches, keyed by RPC name.
+    """
+    registry = CacheRegistry()
+    if max_bytes <= 0:
+        return registry
+    for rpc_name, share in budgets.items():
+        method = service_descriptor.methods_by_name[rpc_name]
+        registry.add(MessageCache(
+            name=rpc_name,
+            max_bytes=int(max_bytes * share),
+            key_fields=[field.name for field in method.input_type.fields if field.name not in PAGE_FIELDS],
+            streaming=method.server_streaming,
+            message_class=getattr(message_module, method.output_type.name),
+            request_class=getattr(message_module, method.input_type.name),
+        ))
+    return registry
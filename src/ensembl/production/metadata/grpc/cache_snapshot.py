@@ -0,0 +1,196 @@
+#  See the NOTICE file distributed with this work for additional information
+#  regarding copyright ownership.
+#  Licensed under the Apache License, Version 2.0 (the "License");
+#  you may not use this file except in compliance with the License.
+#  You may obtain a copy of the License at
+#      http://www.apache.org/licenses/LICENSE-2.0
+#  Unless required by applicable law or agreed to in writing, software
+#  distributed under the License is distributed on an "AS IS" BASIS,
+#  WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+#  See the License for the specific language governing permissions and
+#  limitations under the License.
+"""
+Warm-cache file: the content of the response caches saved to local disk so that a restarted service does not
+begin with empty caches.
+
+The file is made of JSON lines. The first line is a header holding the file format and version, the key fields
+of each cache and the release fingerprint of the metadata DB at the time the cached responses were computed.
+Every following line is a cache entry: the cache (RPC) name, the key, the access frequency and the serialised
+protobuf message(s), base64 encoded. A file is only loaded if its format version is supported and its
+fingerprint matches the current release state, and the entries of a cache only if its key fields are
+unchanged.
+"""
+import base64
+import json
+import logging
+import os
+import threading
+import time
+
+import sqlalchemy as db
+from google.protobuf.message import DecodeError
+
+logger = logging.getLogger(__name__)
+
+FILE_FORMAT = "ensembl-metadata-service-cache"
+FILE_FORMAT_VERSION = 2
+
+
+def dump_caches(caches, path, fingerprint):
+    """
+    Write the content of the caches to path, replacing it atomically.
+
+    Args:
+        caches (CacheRegistry): The caches to save.
+        path (str): Location of the warm-cache file.
+        fingerprint (str): Release fingerprint the cached responses were computed against.
+
+    Returns:
+        int: Number of saved entries.
+    """
+    header = {
+        "format": FILE_FORMAT,
+        "version": FILE_FORMAT_VERSION,
+        "fingerprint": fingerprint,
+        "key_fields": {cache.name: list(cache.key_fields) for cache in caches},
+        "created": time.time(),
+    }
+    count = 0
+    tmp_path = f"{path}.tmp"
+    with open(tmp_path, "w", encoding="utf-8") as file:
+        file.write(json.dumps(header) + "\n")
+        for cache in caches:
+            # Least recently used entries first, so that reloading them restores the LRU order
+            for key, value in cache.items():
+                messages = value if cache.streaming else (value,)
+                record = {
+                    "cache": cache.name,
+                    "key": list(key),
+                    "frequency": cache.frequency(key),
+                    "messages": [
+                        base64.b64encode(message.SerializeToString()).decode() for message in messages
+                    ],
+                }
+                file.write(json.dumps(record) + "\n")
+                count += 1
+    os.replace(tmp_path, path)
+    return count
+
+
+def load_caches(caches, path, fingerprint):
+    """
+    Fill the caches from a warm-cache file, provided it was written for the same release state.
+
+    Args:
+        caches (CacheRegistry): The caches to fill.
+        path (str): Location of the warm-cache file.
+        fingerprint (str): Current release fingerprint of the metadata DB.
+
+    Returns:
+        int: Number of restored entries.
+    """
+    if not os.path.exists(path):
+        logger.info("No warm-cache file found at %s", path)
+        return 0
+    count = 0
+    with open(path, encoding="utf-8") as file:
+        try:
+            header = json.loads(file.readline())
+        except ValueError:
+            logger.warning("Ignoring warm-cache file %s: invalid header", path)
+            return 0
+        if header.get("format") != FILE_FORMAT or header.get("version") != FILE_FORMAT_VERSION:
+            logger.warning("Ignoring warm-cache file %s: unsupported format %s v%s",
+                           path, header.get("format"), header.get("version"))
+            return 0
+        if header.get("fingerprint") != fingerprint:
+            logger.info("Ignoring warm-cache file %s: written for another release state", path)
+            return 0
+        key_fields = header.get("key_fields", {})
+        for line in file:
+            try:
+                record = json.loads(line)
+            except ValueError:
+                # Truncated last line, the file was not written completely
+                logger.warning("Stopped loading warm-cache file %s: invalid record", path)
+                break
+            cache = caches.get(record["cache"])
+            # Keys written before the fields of the request changed would never be hit
+            if cache is None or key_fields.get(cache.name) != list(cache.key_fields):
+                continue
+            key = tuple(tuple(value) if isinstance(value, list) else value for value in record["key"])
+            messages = tuple(
+                cache.message_class.FromString(base64.b64decode(message)) for message in record["messages"]
+            )
+            if cache.restore(key, messages if cache.streaming else messages[0], record.get("frequency", 1)):
+                count += 1
+    return count
+
+
+class CacheSnapshotter:
+    """
+    Save the response caches to a warm-cache file periodically and on shutdown, and reload them at startup.
+
+    Args:
+        caches (CacheRegistry): The caches to save and restore.
+        db_conn (BaseAdaptor): Adaptor used to compute the release fingerprint of the metadata DB.
+        path (str): Location of the warm-cache file.
+        interval (int): Seconds between two saves, 0 only saves on shutdown.
+    """
+
+    def __init__(self, caches, db_conn, path, interval=0):
+        self.caches = caches
+        self.db_conn = db_conn
+        self.path = path
+        self.interval = interval
+        self.fingerprint = None
+        self._stop = threading.Event()
+        self._thread = None
+
+    def load(self):
+        self.fingerprint = self.db_conn.fetch_release_fingerprint()
+        try:
+            count = load_caches(self.caches, self.path, self.fingerprint)
+        except (OSError, ValueError, AttributeError, KeyError, TypeError, DecodeError) as e:
+            # Unreadable file, or a header or record with missing fields or undecodable messages
+            logger.warning("Failed to load warm-cache file %s: %s", self.path, e)
+            return 0
+        logger.info("Restored %s cache entries from %s", count, self.path)
+        return count
+
+    def dump(self):
+        fingerprint = self.db_conn.fetch_release_fingerprint()
+        if self.fingerprint is not None and fingerprint != self.fingerprint:
+            # The caches may hold responses computed before the release state changed
+            logger.info("Release state changed, not saving caches to %s", self.path)
+            return 0
+        try:
+            count = dump_caches(self.caches, self.path, fingerprint)
+        except OSError as e:
+            logger.warning("Failed to save caches to %s: %s", self.path, e)
+            return 0
+        logger.info("Saved %s cache entries to %s", count, self.path)
+        return count
+
+    def release_changed(self, fingerprint):
+        """The caches have been rebuilt for a new release state, save them against its fingerprint."""
+        self.fingerprint = fingerprint
+
+    def _run(self):
+        while not self._stop.wait(self.interval):
+            try:
+                self.dump()
+            except db.exc.SQLAlchemyError as e:
+                # The release fingerprint could not be read, try again at the next save
+                logger.warning("Periodic cache save failed: %s", e)
+
+    def start(self):
+        if self.interval > 0:
+            self._thread = threading.Thread(target=self._run, name="cache-snapshot", daemon=True)
+            self._thread.start()
+
+    def stop(self):
+        self._stop.set()
+        if self._thread is not None:
+            self._thread.join()
+        self.dump()
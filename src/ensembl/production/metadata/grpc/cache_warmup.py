@@ -0,0 +1,210 @@
+#  See the NOTICE file distributed with this work for additional information
+#  regarding copyright ownership.
+#  Licensed under the Apache License, Version 2.0 (the "License");
+#  you may not use this file except in compliance with the License.
+#  You may obtain a copy of the License at
+#      http://www.apache.org/licenses/LICENSE-2.0
+#  Unless required by applicable law or agreed to in writing, software
+#  distributed under the License is distributed on an "AS IS" BASIS,
+#  WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+#  See the License for the specific language governing permissions and
+#  limitations under the License.
+"""
+Cache pre-warming from a sampled log of the requests served by the cached RPCs.
+
+The access log keeps, for each cached RPC, approximate counts of the request keys seen in a sample of the
+requests. It is saved to a JSON file so that it survives restarts. Before the server starts accepting
+requests, the most requested keys of each RPC, and the genomes of the popular organisms group, are replayed
+through the servicer so that their responses are computed and cached up front.
+"""
+import json
+import logging
+import os
+import random
+import threading
+from collections import Counter
+
+import sqlalchemy as db
+
+from ensembl.production.metadata.grpc.adaptors.indexes.base import refresh_indexes
+
+logger = logging.getLogger(__name__)
+
+# RPCs replayed for each genome of the popular organisms group, with the request field holding the genome UUID
+POPULAR_GENOME_RPCS = (
+    ("GetGenomeByUUID", "genome_uuid"),
+    ("GetSpeciesInformation", "genome_uuid"),
+    ("GetTopLevelStatisticsByUUID", "genome_uuid"),
+    ("GetDatasetsListByUUID", "genome_uuid"),
+)
+
+
+class AccessLog:
+    """
+    Sampled counts of request keys per RPC.
+
+    Args:
+        sample_rate (float): Fraction of the requests recorded, between 0 and 1.
+        max_keys (int): Number of distinct keys kept per RPC. When exceeded, the least requested half is
+            dropped.
+    """
+
+    def __init__(self, sample_rate=0.1, max_keys=1000):
+        self.sample_rate = sample_rate
+        self.max_keys = max_keys
+        self._counts = {}
+        self._lock = threading.Lock()
+
+    def record(self, name, key):
+        if self.sample_rate < 1 and random.random() >= self.sample_rate:
+            return
+        with self._lock:
+            counts = self._counts.setdefault(name, Counter())
+            counts[key] += 1
+            if len(counts) > self.max_keys:
+                self._counts[name] = Counter(dict(counts.most_common(self.max_keys // 2)))
+
+    def top(self, name, count):
+        """Most requested keys of an RPC, most requested first."""
+        with self._lock:
+            counts = self._counts.get(name)
+            return [key for key, _ in counts.most_common(count)] if counts else []
+
+    def names(self):
+        with self._lock:
+            return list(self._counts)
+
+    def dump(self, path):
+        with self._lock:
+            content = {name: [[list(key), count] for key, count in counts.most_common()]
+                       for name, counts in self._counts.items()}
+        tmp_path = f"{path}.tmp"
+        with open(tmp_path, "w", encoding="utf-8") as file:
+            json.dump(content, file)
+        os.replace(tmp_path, path)
+
+    def load(self, path):
+        if not os.path.exists(path):
+            return
+        with open(path, encoding="utf-8") as file:
+            content = json.load(file)
+        with self._lock:
+            for name, entries in content.items():
+                counts = self._counts.setdefault(name, Counter())
+                for key, count in entries[:self.max_keys]:
+                    key = tuple(tuple(value) if isinstance(value, list) else value for value in key)
+                    counts[key] += count
+
+
+def replay(servicer, name, request):
+    """Call an RPC of the servicer outside of gRPC, consuming the response of streaming RPCs."""
+    response = getattr(servicer, name)(request, None)
+    if not hasattr(response, "ByteSize"):
+        for _ in response:
+            pass
+
+
+def prewarm(servicer, access_log=None, top_n=100, group_code="popular"):
+    """
+    Fill the caches of the servicer with the responses of the most requested keys and of the popular genomes.
+
+    Args:
+        servicer (EnsemblMetadataServicer): Servicer holding the caches and the DB connection.
+        access_log (AccessLog): Requests seen by the service, None to only warm the popular genomes.
+        top_n (int): Number of keys replayed per RPC.
+        group_code (str): Code of the organisms group whose genomes are always warmed.
+
+    Returns:
+        int: Number of replayed requests.
+    """
+    requests = []
+    if access_log is not None:
+        for name in access_log.names():
+            cache = servicer.caches.get(name)
+            if cache is None:
+                continue
+            for key in access_log.top(name, top_n):
+                requests.append((name, cache.request_for(key)))
+    try:
+        genome_uuids = servicer.db.fetch_group_genome_uuids(group_code)
+    except db.exc.SQLAlchemyError as e:
+        logger.warning("Failed to fetch the genomes of the %s group: %s", group_code, e)
+        genome_uuids = []
+    for genome_uuid in genome_uuids:
+        for name, field in POPULAR_GENOME_RPCS:
+            cache = servicer.caches.get(name)
+            if cache is not None:
+                requests.append((name, cache.request_class(**{field: genome_uuid})))
+
+    count = 0
+    # Replayed requests are not client requests, they must not make their keys more popular
+    with servicer.caches.unrecorded():
+        for name, request in requests:
+            try:
+                replay(servicer, name, request)
+                count += 1
+            except (db.exc.SQLAlchemyError, ValueError) as e:
+                logger.warning("Pre-warm of %s failed for %s: %s", name, request, e)
+    logger.info("Pre-warmed caches with %s requests", count)
+    return count
+
+
+def rebuild(servicer, access_log=None, top_n=0):
+    """
+    Rebuild the in-memory indexes from the metadata DB, empty the caches and pre-warm them again.
+
+    Returns:
+        int: Number of replayed requests.
+    """
+    refresh_indexes()
+    servicer.caches.clear()
+    logger.info("Rebuilt indexes and cleared caches")
+    if top_n > 0:
+        return prewarm(servicer, access_log, top_n)
+    return 0
+
+
+class AccessLogSaver:
+    """
+    Save the access log to a file periodically and on shutdown.
+
+    Args:
+        access_log (AccessLog): The access log to save.
+        path (str): Location of the access log file.
+        interval (int): Seconds between two saves, 0 only saves on shutdown.
+    """
+
+    def __init__(self, access_log, path, interval=0):
+        self.access_log = access_log
+        self.path = path
+        self.interval = interval
+        self._stop = threading.Event()
+        self._thread = None
+
+    def load(self):
+        try:
+            self.access_log.load(self.path)
+        except (OSError, ValueError, AttributeError, TypeError) as e:
+            # Unreadable file, or entries not in the access log format
+            logger.warning("Failed to load access log %s: %s", self.path, e)
+
+    def dump(self):
+        try:
+            self.access_log.dump(self.path)
+        except OSError as e:
+            logger.warning("Failed to save access log to %s: %s", self.path, e)
+
+    def _run(self):
+        while not self._stop.wait(self.interval):
+            self.dump()
+
+    def start(self):
+        if self.interval > 0:
+            self._thread = threading.Thread(target=self._run, name="access-log", daemon=True)
+            self._thread.start()
+
+    def stop(self):
+        self._stop.set()
+        if self._thread is not None:
+            self._thread.join()
+        self.dump()
@@ -12,6 +12,7 @@
 import grpc
 import logging
 
+from google.protobuf.field_mask_pb2 import FieldMask
 from ensembl_metadata_pb2 import (
     GenomeUUIDRequest,
     GenomeNameRequest,
@@ -27,7 +28,12 @@ from ensembl_metadata_pb2 import (
     OrganismsGroupRequest,
     AssemblyRegionRequest,
     GenomeAssemblySequenceRegionRequest,
-    GenomeTagRequest
+    GenomeTagRequest,
+    GenomeSuggestionRequest,
+    GenomeUUIDsRequest,
+    GenomeUUIDLookup,
+    ListCachesRequest,
+    InvalidateCacheRequest
 )
 
 import ensembl.production.metadata.grpc.ensembl_metadata_pb2_grpc as ensembl_metadata_pb2_grpc
@@ -56,6 +62,39 @@ def get_genomes_by_keyword(stub, genome_request):
             print(genome)
 
 
+def get_genomes_by_uuids(stub):
+    request = GenomeUUIDsRequest(genome_uuid=["9caa2cae-d1c8-4cfc-9ffd-2e13bc3e95b1", "rhubarb"])
+    for genome in stub.GetGenomesByUUIDs(request):
+        print(genome.genome_uuid or "No genome")
+
+
+def get_releases_by_page(stub):
+    # Releases two at a time, the token of the next page is in the trailing metadata of the call
+    request = ReleaseRequest(page_size=2)
+    while True:
+        call = stub.GetRelease(request)
+        for release in call:
+            print(release.release_version, release.release_label)
+        request.page_token = dict(call.trailing_metadata()).get("next-page-token", "")
+        if not request.page_token:
+            break
+
+
+def get_genome_with_read_mask(stub):
+    # Only the assembly name and the release version are returned (and fetched)
+    request = GenomeUUIDRequest(
+        genome_uuid="9caa2cae-d1c8-4cfc-9ffd-2e13bc3e95b1",
+        read_mask=FieldMask(paths=["assembly.name", "release.release_version"])
+    )
+    print(stub.GetGenomeByUUID(request))
+
+
+def suggest_genomes(stub):
+    request = GenomeSuggestionRequest(prefix="hom", limit=5)
+    for genome in stub.SuggestGenomes(request):
+        print(genome.genome_uuid, genome.organism.scientific_name, genome.assembly.name)
+
+
 def get_genomes(stub):
     request1 = GenomeUUIDRequest(genome_uuid="9caa2cae-d1c8-4cfc-9ffd-2e13bc3e95b1")
     request2 = GenomeUUIDRequest(genome_uuid="rhubarb")
@@ -68,6 +107,7 @@ def get_genomes(stub):
     )
     request6 = GenomeByKeywordRequest(keyword="Human")
     request7 = GenomeByKeywordRequest(keyword="Bigfoot")
+    request8 = GenomeByKeywordRequest(keyword="homo sapien", fuzzy=True)
     print("**** Valid UUID ****")
     get_genome(stub, request1)
     print("**** Invalid UUID ****")
@@ -82,6 +122,8 @@ def get_genomes(stub):
     get_genomes_by_keyword(stub, request6)
     print("**** Invalid keyword ****")
     get_genomes_by_keyword(stub, request7)
+    print("**** Misspelt keyword, fuzzy search ****")
+    get_genomes_by_keyword(stub, request8)
 
 
 def list_genome_sequences(stub):
@@ -292,6 +334,17 @@ def get_genome_uuid(stub):
     print(genome_uuid3)
 
 
+def lookup_genome_uuids(stub):
+    lookups = [
+        GenomeUUIDLookup(correlation_id="1", ensembl_name="homo_sapiens", assembly_name="GRCh38.p13"),
+        GenomeUUIDLookup(
+            correlation_id="2", ensembl_name="homo_sapiens", assembly_name="GRCh38", use_default=True
+        ),
+    ]
+    for result in stub.LookupGenomeUUIDs(iter(lookups)):
+        print(result.correlation_id, result.genome_uuid)
+
+
 def get_organisms_group_count(stub):
     request = OrganismsGroupRequest()
     organisms_group_count = stub.GetOrganismsGroupCount(request)
@@ -318,6 +371,27 @@ def get_genome_uuid_by_tag(stub):
     print(genome_uuid4)
 
 
+def list_caches(admin_stub):
+    caches = admin_stub.ListCaches(ListCachesRequest())
+    print(caches)
+
+
+def invalidate_genome(admin_stub):
+    request = InvalidateCacheRequest(genome_uuid="a7335667-93e7-11ec-a39d-005056b38ce3")
+    result = admin_stub.InvalidateCache(request)
+    print(result)
+
+
+def run_admin(port):
+    """Examples of the admin service, only served when ADMIN_PORT is set."""
+    with grpc.insecure_channel(f"localhost:{port}") as channel:
+        admin_stub = ensembl_metadata_pb2_grpc.EnsemblMetadataAdminStub(channel)
+        print("-------------- List Caches --------------")
+        list_caches(admin_stub)
+        print("-------------- Invalidate Genome --------------")
+        invalidate_genome(admin_stub)
+
+
 def run():
     with grpc.insecure_channel("localhost:50051") as channel:
         stub = ensembl_metadata_pb2_grpc.EnsemblMetadataStub(channel)
@@ -357,6 +431,16 @@ def run():
         get_organisms_group_count(stub)
         print("-------------- Get Genome UUID By Tag --------------")
         get_genome_uuid_by_tag(stub)
+        print("-------------- Suggest Genomes --------------")
+        suggest_genomes(stub)
+        print("-------------- Get Genomes By UUIDs --------------")
+        get_genomes_by_uuids(stub)
+        print("-------------- Get Releases By Page --------------")
+        get_releases_by_page(stub)
+        print("-------------- Get Genome With Read Mask --------------")
+        get_genome_with_read_mask(stub)
+        print("-------------- Lookup Genome UUIDs --------------")
+        lookup_genome_uuids(stub)
 
 
 if __name__ == "__main__":
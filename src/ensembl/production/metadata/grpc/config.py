@@ -19,3 +19,46 @@ class MetadataConfig:
     max_overflow = os.environ.get("MAX_OVERFLOW", 0)
     pool_recycle = os.environ.get("POOL_RECYCLE", 50)
     allow_unreleased = os.environ.get("ALLOW_UNRELEASED", False)
+    # Overall memory budget (in bytes) of the gRPC response caches, 0 disables caching
+    cache_max_bytes = int(os.environ.get("CACHE_MAX_BYTES", 256 * 1024 * 1024))
+    # Warm-cache file used to save the caches on shutdown and reload them at startup, empty to disable
+    cache_snapshot_path = os.environ.get("CACHE_SNAPSHOT_PATH", "")
+    # Seconds between two saves of the warm-cache file, 0 to only save it on shutdown
+    cache_snapshot_interval = int(os.environ.get("CACHE_SNAPSHOT_INTERVAL", 600))
+    # File used to keep the sampled log of the cached requests across restarts, empty to disable the log
+    access_log_path = os.environ.get("ACCESS_LOG_PATH", "")
+    # Fraction of the cached requests recorded in the access log
+    access_log_sample_rate = float(os.environ.get("ACCESS_LOG_SAMPLE_RATE", 0.1))
+    # Number of most requested keys replayed per RPC to pre-warm the caches at startup, 0 disables pre-warming
+    cache_prewarm_top_n = int(os.environ.get("CACHE_PREWARM_TOP_N", 100))
+    # Port of the admin service (cache introspection and invalidation), 0 disables it
+    admin_port = int(os.environ.get("ADMIN_PORT", 0))
+    # Interface the admin service listens on, local only by default
+    admin_host = os.environ.get("ADMIN_HOST", "127.0.0.1")
+    # Seconds between two checks of the release state of the metadata DB, 0 disables them. On change, the
+    # in-memory indexes (dimension tables) are rebuilt and the caches are emptied and pre-warmed again.
+    release_poll_interval = int(os.environ.get("RELEASE_POLL_INTERVAL", 60))
+    # Number of genomes returned by SuggestGenomes when the request gives no limit, and maximum limit accepted
+    suggest_default_limit = int(os.environ.get("SUGGEST_DEFAULT_LIMIT", 10))
+    suggest_max_limit = int(os.environ.get("SUGGEST_MAX_LIMIT", 100))
+    # Number of genomes whose datasets are loaded with a single query when listing genomes with their datasets
+    dataset_chunk_size = int(os.environ.get("DATASET_CHUNK_SIZE", 500))
+    # Largest number of values a multi-value filter (e.g. thousands of genome UUIDs) is sent with in a single
+    # IN list: bigger filters are split into chunks of that size, fetched in parallel by in_chunk_workers
+    # threads
+    in_chunk_size = int(os.environ.get("IN_CHUNK_SIZE", 1000))
+    in_chunk_workers = int(os.environ.get("IN_CHUNK_WORKERS", 4))
+    # Number of rows fetched at a time from the server-side cursor of the streamed genome listings
+    stream_batch_size = int(os.environ.get("STREAM_BATCH_SIZE", 500))
+    # Number of messages of a page of the paged list RPCs when the request gives no page size, and maximum
+    # page size
+    page_default_size = int(os.environ.get("PAGE_DEFAULT_SIZE", 100))
+    page_max_size = int(os.environ.get("PAGE_MAX_SIZE", 1000))
+    # Comma separated URIs of the read replicas of the metadata and taxonomy DBs, which take the reads in turn
+    metadata_replica_uris = [uri for uri in os.environ.get("METADATA_REPLICA_URIS", "").split(",") if uri]
+    taxon_replica_uris = [uri for uri in os.environ.get("TAXONOMY_REPLICA_URIS", "").split(",") if uri]
+    # Seconds a read replica that cannot be reached (or fails) is left out
+    replica_eject_seconds = int(os.environ.get("REPLICA_EJECT_SECONDS", 30))
+    # Read the release state (release checks, in-memory indexes, releases) from the primary DB only, 0 to use
+    # the replicas too
+    replica_pin_releases = bool(int(os.environ.get("REPLICA_PIN_RELEASES", 1)))
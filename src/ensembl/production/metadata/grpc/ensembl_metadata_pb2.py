@@ -11,9 +11,10 @@ from google.protobuf.internal import builder as _builder
 _sym_db = _symbol_database.Default()
 
 
+from google.protobuf import field_mask_pb2 as google_dot_protobuf_dot_field__mask__pb2
 
 
-DESCRIPTOR = _descriptor_pool.Default().AddSerializedFile(b'\n7ensembl/production/metadata/grpc/ensembl_metadata.proto\x12\x10\x65nsembl_metadata\"\xbb\x02\n\x06Genome\x12\x13\n\x0bgenome_uuid\x18\x01 \x01(\t\x12,\n\x08\x61ssembly\x18\x02 \x01(\x0b\x32\x1a.ensembl_metadata.Assembly\x12&\n\x05taxon\x18\x03 \x01(\x0b\x32\x17.ensembl_metadata.Taxon\x12\x0f\n\x07\x63reated\x18\x04 \x01(\t\x12,\n\x08organism\x18\x05 \x01(\x0b\x32\x1a.ensembl_metadata.Organism\x12\x39\n\x0f\x61ttributes_info\x18\x06 \x01(\x0b\x32 .ensembl_metadata.AttributesInfo\x12 \n\x18related_assemblies_count\x18\x07 \x01(\x05\x12*\n\x07release\x18\x08 \x01(\x0b\x32\x19.ensembl_metadata.Release\"\x99\x01\n\x07Species\x12\x13\n\x0bgenome_uuid\x18\x01 \x01(\t\x12\x10\n\x08taxon_id\x18\x02 \x01(\r\x12\x17\n\x0fscientific_name\x18\x03 \x01(\t\x12 \n\x18scientific_parlance_name\x18\x04 \x01(\t\x12\x1b\n\x13genbank_common_name\x18\x05 \x01(\t\x12\x0f\n\x07synonym\x18\x06 \x03(\t\"\xb6\x01\n\x0c\x41ssemblyInfo\x12\x15\n\rassembly_uuid\x18\x01 \x01(\t\x12\x11\n\taccession\x18\x02 \x01(\t\x12\r\n\x05level\x18\x03 \x01(\t\x12\x0c\n\x04name\x18\x04 \x01(\t\x12\x13\n\x0b\x63hromosomal\x18\x05 \x01(\r\x12\x0e\n\x06length\x18\x06 \x01(\x04\x12\x19\n\x11sequence_location\x18\x07 \x01(\t\x12\x0b\n\x03md5\x18\x08 \x01(\t\x12\x12\n\nsha512t24u\x18\t \x01(\t\"O\n\nSubSpecies\x12\x15\n\rorganism_uuid\x18\x01 \x01(\t\x12\x14\n\x0cspecies_type\x18\x02 \x03(\t\x12\x14\n\x0cspecies_name\x18\x03 \x03(\t\"c\n\x13\x41ttributeStatistics\x12\x0c\n\x04name\x18\x01 \x01(\t\x12\r\n\x05label\x18\x02 \x01(\t\x12\x16\n\x0estatistic_type\x18\x03 \x01(\t\x12\x17\n\x0fstatistic_value\x18\x04 \x01(\t\"j\n\x18TopLevelStatisticsByUUID\x12\x13\n\x0bgenome_uuid\x18\x01 \x01(\t\x12\x39\n\nstatistics\x18\x02 \x03(\x0b\x32%.ensembl_metadata.AttributeStatistics\"u\n\x12TopLevelStatistics\x12\x15\n\rorganism_uuid\x18\x01 \x01(\t\x12H\n\x14stats_by_genome_uuid\x18\x02 \x03(\x0b\x32*.ensembl_metadata.TopLevelStatisticsByUUID\"\xb2\x01\n\x08\x41ssembly\x12\x11\n\taccession\x18\x01 \x01(\t\x12\x0c\n\x04name\x18\x02 \x01(\t\x12\x11\n\tucsc_name\x18\x03 \x01(\t\x12\r\n\x05level\x18\x04 \x01(\t\x12\x14\n\x0c\x65nsembl_name\x18\x05 \x01(\t\x12\x15\n\rassembly_uuid\x18\x06 \x01(\t\x12\x14\n\x0cis_reference\x18\x07 \x01(\x08\x12\x10\n\x08url_name\x18\x08 \x01(\t\x12\x0e\n\x06tol_id\x18\t \x01(\t\"`\n\x05Taxon\x12\x13\n\x0btaxonomy_id\x18\x01 \x01(\r\x12\x17\n\x0fscientific_name\x18\x02 \x01(\t\x12\x0e\n\x06strain\x18\x03 \x01(\t\x12\x19\n\x11\x61lternative_names\x18\x04 \x03(\t\"\x9c\x01\n\x07Release\x12\x17\n\x0frelease_version\x18\x01 \x01(\x01\x12\x14\n\x0crelease_date\x18\x02 \x01(\t\x12\x15\n\rrelease_label\x18\x03 \x01(\t\x12\x12\n\nis_current\x18\x04 \x01(\x08\x12\x11\n\tsite_name\x18\x05 \x01(\t\x12\x12\n\nsite_label\x18\x06 \x01(\t\x12\x10\n\x08site_uri\x18\x07 \x01(\t\"\xde\x01\n\x08Organism\x12\x13\n\x0b\x63ommon_name\x18\x01 \x01(\t\x12\x0e\n\x06strain\x18\x02 \x01(\t\x12\x17\n\x0fscientific_name\x18\x03 \x01(\t\x12\x14\n\x0c\x65nsembl_name\x18\x04 \x01(\t\x12 \n\x18scientific_parlance_name\x18\x05 \x01(\t\x12\x15\n\rorganism_uuid\x18\x06 \x01(\t\x12\x13\n\x0bstrain_type\x18\x07 \x01(\t\x12\x13\n\x0btaxonomy_id\x18\x08 \x01(\x05\x12\x1b\n\x13species_taxonomy_id\x18\t \x01(\x05\"K\n\tAttribute\x12\x0c\n\x04name\x18\x01 \x01(\t\x12\r\n\x05label\x18\x02 \x01(\t\x12\x13\n\x0b\x64\x65scription\x18\x03 \x01(\t\x12\x0c\n\x04type\x18\x04 \x01(\t\"\xa1\x03\n\x0e\x41ttributesInfo\x12\x18\n\x10genebuild_method\x18\x01 \x01(\t\x12 \n\x18genebuild_method_display\x18\x02 \x01(\t\x12%\n\x1dgenebuild_last_geneset_update\x18\x03 \x01(\t\x12\x19\n\x11genebuild_version\x18\x04 \x01(\t\x12\x1f\n\x17genebuild_provider_name\x18\x05 \x01(\t\x12\x1e\n\x16genebuild_provider_url\x18\x06 \x01(\t\x12\x1d\n\x15genebuild_sample_gene\x18\x07 \x01(\t\x12!\n\x19genebuild_sample_location\x18\x08 \x01(\t\x12\x16\n\x0e\x61ssembly_level\x18\t \x01(\t\x12\x15\n\rassembly_date\x18\n \x01(\t\x12\x1e\n\x16\x61ssembly_provider_name\x18\x0b \x01(\t\x12\x1d\n\x15\x61ssembly_provider_url\x18\x0c \x01(\t\x12 \n\x18variation_sample_variant\x18\r \x01(\t\"\xa4\x02\n\x0c\x44\x61tasetInfos\x12\x13\n\x0bgenome_uuid\x18\x01 \x01(\t\x12\x14\n\x0c\x64\x61taset_type\x18\x02 \x01(\t\x12\x41\n\rdataset_infos\x18\x03 \x03(\x0b\x32*.ensembl_metadata.DatasetInfos.DatasetInfo\x1a\xa5\x01\n\x0b\x44\x61tasetInfo\x12\x14\n\x0c\x64\x61taset_uuid\x18\x01 \x01(\t\x12\x14\n\x0c\x64\x61taset_name\x18\x02 \x01(\t\x12\x0c\n\x04name\x18\x03 \x01(\t\x12\x0c\n\x04type\x18\x04 \x01(\t\x12\x17\n\x0f\x64\x61taset_version\x18\x05 \x01(\t\x12\x15\n\rdataset_label\x18\x06 \x01(\t\x12\x0f\n\x07version\x18\x07 \x01(\x01\x12\r\n\x05value\x18\x08 \x01(\t\"q\n\x0eGenomeSequence\x12\x11\n\taccession\x18\x01 \x01(\t\x12\x0c\n\x04name\x18\x02 \x01(\t\x12\x19\n\x11sequence_location\x18\x03 \x01(\t\x12\x0e\n\x06length\x18\x04 \x01(\x04\x12\x13\n\x0b\x63hromosomal\x18\x05 \x01(\x08\"r\n\x0e\x41ssemblyRegion\x12\x0c\n\x04name\x18\x01 \x01(\t\x12\x0c\n\x04rank\x18\x02 \x01(\x05\x12\x0b\n\x03md5\x18\x03 \x01(\t\x12\x0e\n\x06length\x18\x04 \x01(\x04\x12\x12\n\nsha512t24u\x18\x05 \x01(\t\x12\x13\n\x0b\x63hromosomal\x18\x06 \x01(\x08\"r\n\x1cGenomeAssemblySequenceRegion\x12\x0c\n\x04name\x18\x01 \x01(\t\x12\x0b\n\x03md5\x18\x02 \x01(\t\x12\x0e\n\x06length\x18\x03 \x01(\x04\x12\x12\n\nsha512t24u\x18\x04 \x01(\t\x12\x13\n\x0b\x63hromosomal\x18\x05 \x01(\x08\"\xac\x01\n\x08\x44\x61tasets\x12\x13\n\x0bgenome_uuid\x18\x01 \x01(\t\x12:\n\x08\x64\x61tasets\x18\x02 \x03(\x0b\x32(.ensembl_metadata.Datasets.DatasetsEntry\x1aO\n\rDatasetsEntry\x12\x0b\n\x03key\x18\x01 \x01(\t\x12-\n\x05value\x18\x02 \x01(\x0b\x32\x1e.ensembl_metadata.DatasetInfos:\x02\x38\x01\"!\n\nGenomeUUID\x12\x13\n\x0bgenome_uuid\x18\x01 \x01(\t\"\x8f\x01\n\x0eOrganismsGroup\x12\x1b\n\x13species_taxonomy_id\x18\x01 \x01(\r\x12\x14\n\x0c\x65nsembl_name\x18\x02 \x01(\t\x12\x13\n\x0b\x63ommon_name\x18\x03 \x01(\t\x12\x17\n\x0fscientific_name\x18\x04 \x01(\t\x12\r\n\x05order\x18\x05 \x01(\r\x12\r\n\x05\x63ount\x18\x06 \x01(\r\"o\n\x13OrganismsGroupCount\x12?\n\x15organisms_group_count\x18\x01 \x03(\x0b\x32 .ensembl_metadata.OrganismsGroup\x12\x17\n\x0frelease_version\x18\x02 \x01(\x01\"A\n\x11GenomeUUIDRequest\x12\x13\n\x0bgenome_uuid\x18\x01 \x01(\t\x12\x17\n\x0frelease_version\x18\x02 \x01(\x01\"B\n\x16GenomeByKeywordRequest\x12\x0f\n\x07keyword\x18\x01 \x01(\t\x12\x17\n\x0frelease_version\x18\x02 \x01(\x01\"U\n\x11GenomeNameRequest\x12\x14\n\x0c\x65nsembl_name\x18\x01 \x01(\t\x12\x11\n\tsite_name\x18\x02 \x01(\t\x12\x17\n\x0frelease_version\x18\x03 \x01(\x01\"C\n\x11\x41ssemblyIDRequest\x12\x15\n\rassembly_uuid\x18\x01 \x01(\t\x12\x17\n\x0frelease_version\x18\x02 \x01(\x01\"Q\n\x1a\x41ssemblyAccessionIDRequest\x12\x1a\n\x12\x61ssembly_accession\x18\x01 \x01(\t\x12\x17\n\x0frelease_version\x18\x02 \x01(\x01\"9\n\x11OrganismIDRequest\x12\x15\n\rorganism_uuid\x18\x01 \x01(\t\x12\r\n\x05group\x18\x02 \x01(\t\"R\n\x0eReleaseRequest\x12\x11\n\tsite_name\x18\x01 \x03(\t\x12\x17\n\x0frelease_version\x18\x02 \x03(\x01\x12\x14\n\x0c\x63urrent_only\x18\x03 \x01(\x08\"F\n\x15GenomeSequenceRequest\x12\x13\n\x0bgenome_uuid\x18\x01 \x01(\t\x12\x18\n\x10\x63hromosomal_only\x18\x02 \x01(\x08\"F\n\x15\x41ssemblyRegionRequest\x12\x13\n\x0bgenome_uuid\x18\x01 \x01(\t\x12\x18\n\x10\x63hromosomal_only\x18\x02 \x01(\x08\"X\n#GenomeAssemblySequenceRegionRequest\x12\x13\n\x0bgenome_uuid\x18\x01 \x01(\t\x12\x1c\n\x14sequence_region_name\x18\x02 \x01(\t\"?\n\x0f\x44\x61tasetsRequest\x12\x13\n\x0bgenome_uuid\x18\x01 \x01(\t\x12\x17\n\x0frelease_version\x18\x02 \x01(\x01\"B\n\x15GenomeDatatypeRequest\x12\x13\n\x0bgenome_uuid\x18\x01 \x01(\t\x12\x14\n\x0c\x64\x61taset_type\x18\x02 \x01(\t\"U\n\x11GenomeInfoRequest\x12\x14\n\x0c\x65nsembl_name\x18\x01 \x01(\t\x12\x15\n\rassembly_name\x18\x02 \x01(\t\x12\x13\n\x0buse_default\x18\x03 \x01(\x08\"0\n\x15OrganismsGroupRequest\x12\x17\n\x0frelease_version\x18\x01 \x01(\x01\"&\n\x10GenomeTagRequest\x12\x12\n\ngenome_tag\x18\x01 \x01(\t2\xd2\x0e\n\x0f\x45nsemblMetadata\x12R\n\x0fGetGenomeByUUID\x12#.ensembl_metadata.GenomeUUIDRequest\x1a\x18.ensembl_metadata.Genome\"\x00\x12T\n\rGetGenomeUUID\x12#.ensembl_metadata.GenomeInfoRequest\x1a\x1c.ensembl_metadata.GenomeUUID\"\x00\x12]\n\x13GetGenomesByKeyword\x12(.ensembl_metadata.GenomeByKeywordRequest\x1a\x18.ensembl_metadata.Genome\"\x00\x30\x01\x12m\n\x1fGetGenomesByAssemblyAccessionID\x12,.ensembl_metadata.AssemblyAccessionIDRequest\x1a\x18.ensembl_metadata.Genome\"\x00\x30\x01\x12Y\n\x15GetSpeciesInformation\x12#.ensembl_metadata.GenomeUUIDRequest\x1a\x19.ensembl_metadata.Species\"\x00\x12_\n\x16GetAssemblyInformation\x12#.ensembl_metadata.AssemblyIDRequest\x1a\x1e.ensembl_metadata.AssemblyInfo\"\x00\x12_\n\x18GetSubSpeciesInformation\x12#.ensembl_metadata.OrganismIDRequest\x1a\x1c.ensembl_metadata.SubSpecies\"\x00\x12\x64\n\x15GetTopLevelStatistics\x12#.ensembl_metadata.OrganismIDRequest\x1a$.ensembl_metadata.TopLevelStatistics\"\x00\x12p\n\x1bGetTopLevelStatisticsByUUID\x12#.ensembl_metadata.GenomeUUIDRequest\x1a*.ensembl_metadata.TopLevelStatisticsByUUID\"\x00\x12R\n\x0fGetGenomeByName\x12#.ensembl_metadata.GenomeNameRequest\x1a\x18.ensembl_metadata.Genome\"\x00\x12M\n\nGetRelease\x12 .ensembl_metadata.ReleaseRequest\x1a\x19.ensembl_metadata.Release\"\x00\x30\x01\x12V\n\x10GetReleaseByUUID\x12#.ensembl_metadata.GenomeUUIDRequest\x1a\x19.ensembl_metadata.Release\"\x00\x30\x01\x12\x62\n\x11GetGenomeSequence\x12\'.ensembl_metadata.GenomeSequenceRequest\x1a .ensembl_metadata.GenomeSequence\"\x00\x30\x01\x12\x62\n\x11GetAssemblyRegion\x12\'.ensembl_metadata.AssemblyRegionRequest\x1a .ensembl_metadata.AssemblyRegion\"\x00\x30\x01\x12\x8a\x01\n\x1fGetGenomeAssemblySequenceRegion\x12\x35.ensembl_metadata.GenomeAssemblySequenceRegionRequest\x1a..ensembl_metadata.GenomeAssemblySequenceRegion\"\x00\x12X\n\x15GetDatasetsListByUUID\x12!.ensembl_metadata.DatasetsRequest\x1a\x1a.ensembl_metadata.Datasets\"\x00\x12\x62\n\x15GetDatasetInformation\x12\'.ensembl_metadata.GenomeDatatypeRequest\x1a\x1e.ensembl_metadata.DatasetInfos\"\x00\x12j\n\x16GetOrganismsGroupCount\x12\'.ensembl_metadata.OrganismsGroupRequest\x1a%.ensembl_metadata.OrganismsGroupCount\"\x00\x12X\n\x12GetGenomeUUIDByTag\x12\".ensembl_metadata.GenomeTagRequest\x1a\x1c.ensembl_metadata.GenomeUUID\"\x00\x62\x06proto3')
+DESCRIPTOR = _descriptor_pool.Default().AddSerializedFile(b'\n7ensembl/production/metadata/grpc/ensembl_metadata.proto\x12\x10\x65nsembl_metadata\x1a google/protobuf/field_mask.proto\"\xbb\x02\n\x06Genome\x12\x13\n\x0bgenome_uuid\x18\x01 \x01(\t\x12,\n\x08\x61ssembly\x18\x02 \x01(\x0b\x32\x1a.ensembl_metadata.Assembly\x12&\n\x05taxon\x18\x03 \x01(\x0b\x32\x17.ensembl_metadata.Taxon\x12\x0f\n\x07\x63reated\x18\x04 \x01(\t\x12,\n\x08organism\x18\x05 \x01(\x0b\x32\x1a.ensembl_metadata.Organism\x12\x39\n\x0f\x61ttributes_info\x18\x06 \x01(\x0b\x32 .ensembl_metadata.AttributesInfo\x12 \n\x18related_assemblies_count\x18\x07 \x01(\x05\x12*\n\x07release\x18\x08 \x01(\x0b\x32\x19.ensembl_metadata.Release\"\x99\x01\n\x07Species\x12\x13\n\x0bgenome_uuid\x18\x01 \x01(\t\x12\x10\n\x08taxon_id\x18\x02 \x01(\r\x12\x17\n\x0fscientific_name\x18\x03 \x01(\t\x12 \n\x18scientific_parlance_name\x18\x04 \x01(\t\x12\x1b\n\x13genbank_common_name\x18\x05 \x01(\t\x12\x0f\n\x07synonym\x18\x06 \x03(\t\"\xb6\x01\n\x0c\x41ssemblyInfo\x12\x15\n\rassembly_uuid\x18\x01 \x01(\t\x12\x11\n\taccession\x18\x02 \x01(\t\x12\r\n\x05level\x18\x03 \x01(\t\x12\x0c\n\x04name\x18\x04 \x01(\t\x12\x13\n\x0b\x63hromosomal\x18\x05 \x01(\r\x12\x0e\n\x06length\x18\x06 \x01(\x04\x12\x19\n\x11sequence_location\x18\x07 \x01(\t\x12\x0b\n\x03md5\x18\x08 \x01(\t\x12\x12\n\nsha512t24u\x18\t \x01(\t\"O\n\nSubSpecies\x12\x15\n\rorganism_uuid\x18\x01 \x01(\t\x12\x14\n\x0cspecies_type\x18\x02 \x03(\t\x12\x14\n\x0cspecies_name\x18\x03 \x03(\t\"c\n\x13\x41ttributeStatistics\x12\x0c\n\x04name\x18\x01 \x01(\t\x12\r\n\x05label\x18\x02 \x01(\t\x12\x16\n\x0estatistic_type\x18\x03 \x01(\t\x12\x17\n\x0fstatistic_value\x18\x04 \x01(\t\"j\n\x18TopLevelStatisticsByUUID\x12\x13\n\x0bgenome_uuid\x18\x01 \x01(\t\x12\x39\n\nstatistics\x18\x02 \x03(\x0b\x32%.ensembl_metadata.AttributeStatistics\"u\n\x12TopLevelStatistics\x12\x15\n\rorganism_uuid\x18\x01 \x01(\t\x12H\n\x14stats_by_genome_uuid\x18\x02 \x03(\x0b\x32*.ensembl_metadata.TopLevelStatisticsByUUID\"\xb2\x01\n\x08\x41ssembly\x12\x11\n\taccession\x18\x01 \x01(\t\x12\x0c\n\x04name\x18\x02 \x01(\t\x12\x11\n\tucsc_name\x18\x03 \x01(\t\x12\r\n\x05level\x18\x04 \x01(\t\x12\x14\n\x0c\x65nsembl_name\x18\x05 \x01(\t\x12\x15\n\rassembly_uuid\x18\x06 \x01(\t\x12\x14\n\x0cis_reference\x18\x07 \x01(\x08\x12\x10\n\x08url_name\x18\x08 \x01(\t\x12\x0e\n\x06tol_id\x18\t \x01(\t\"`\n\x05Taxon\x12\x13\n\x0btaxonomy_id\x18\x01 \x01(\r\x12\x17\n\x0fscientific_name\x18\x02 \x01(\t\x12\x0e\n\x06strain\x18\x03 \x01(\t\x12\x19\n\x11\x61lternative_names\x18\x04 \x03(\t\"\x9c\x01\n\x07Release\x12\x17\n\x0frelease_version\x18\x01 \x01(\x01\x12\x14\n\x0crelease_date\x18\x02 \x01(\t\x12\x15\n\rrelease_label\x18\x03 \x01(\t\x12\x12\n\nis_current\x18\x04 \x01(\x08\x12\x11\n\tsite_name\x18\x05 \x01(\t\x12\x12\n\nsite_label\x18\x06 \x01(\t\x12\x10\n\x08site_uri\x18\x07 \x01(\t\"\xde\x01\n\x08Organism\x12\x13\n\x0b\x63ommon_name\x18\x01 \x01(\t\x12\x0e\n\x06strain\x18\x02 \x01(\t\x12\x17\n\x0fscientific_name\x18\x03 \x01(\t\x12\x14\n\x0c\x65nsembl_name\x18\x04 \x01(\t\x12 \n\x18scientific_parlance_name\x18\x05 \x01(\t\x12\x15\n\rorganism_uuid\x18\x06 \x01(\t\x12\x13\n\x0bstrain_type\x18\x07 \x01(\t\x12\x13\n\x0btaxonomy_id\x18\x08 \x01(\x05\x12\x1b\n\x13species_taxonomy_id\x18\t \x01(\x05\"K\n\tAttribute\x12\x0c\n\x04name\x18\x01 \x01(\t\x12\r\n\x05label\x18\x02 \x01(\t\x12\x13\n\x0b\x64\x65scription\x18\x03 \x01(\t\x12\x0c\n\x04type\x18\x04 \x01(\t\"\xa1\x03\n\x0e\x41ttributesInfo\x12\x18\n\x10genebuild_method\x18\x01 \x01(\t\x12 \n\x18genebuild_method_display\x18\x02 \x01(\t\x12%\n\x1dgenebuild_last_geneset_update\x18\x03 \x01(\t\x12\x19\n\x11genebuild_version\x18\x04 \x01(\t\x12\x1f\n\x17genebuild_provider_name\x18\x05 \x01(\t\x12\x1e\n\x16genebuild_provider_url\x18\x06 \x01(\t\x12\x1d\n\x15genebuild_sample_gene\x18\x07 \x01(\t\x12!\n\x19genebuild_sample_location\x18\x08 \x01(\t\x12\x16\n\x0e\x61ssembly_level\x18\t \x01(\t\x12\x15\n\rassembly_date\x18\n \x01(\t\x12\x1e\n\x16\x61ssembly_provider_name\x18\x0b \x01(\t\x12\x1d\n\x15\x61ssembly_provider_url\x18\x0c \x01(\t\x12 \n\x18variation_sample_variant\x18\r \x01(\t\"\xa4\x02\n\x0c\x44\x61tasetInfos\x12\x13\n\x0bgenome_uuid\x18\x01 \x01(\t\x12\x14\n\x0c\x64\x61taset_type\x18\x02 \x01(\t\x12\x41\n\rdataset_infos\x18\x03 \x03(\x0b\x32*.ensembl_metadata.DatasetInfos.DatasetInfo\x1a\xa5\x01\n\x0b\x44\x61tasetInfo\x12\x14\n\x0c\x64\x61taset_uuid\x18\x01 \x01(\t\x12\x14\n\x0c\x64\x61taset_name\x18\x02 \x01(\t\x12\x0c\n\x04name\x18\x03 \x01(\t\x12\x0c\n\x04type\x18\x04 \x01(\t\x12\x17\n\x0f\x64\x61taset_version\x18\x05 \x01(\t\x12\x15\n\rdataset_label\x18\x06 \x01(\t\x12\x0f\n\x07version\x18\x07 \x01(\x01\x12\r\n\x05value\x18\x08 \x01(\t\"q\n\x0eGenomeSequence\x12\x11\n\taccession\x18\x01 \x01(\t\x12\x0c\n\x04name\x18\x02 \x01(\t\x12\x19\n\x11sequence_location\x18\x03 \x01(\t\x12\x0e\n\x06length\x18\x04 \x01(\x04\x12\x13\n\x0b\x63hromosomal\x18\x05 \x01(\x08\"r\n\x0e\x41ssemblyRegion\x12\x0c\n\x04name\x18\x01 \x01(\t\x12\x0c\n\x04rank\x18\x02 \x01(\x05\x12\x0b\n\x03md5\x18\x03 \x01(\t\x12\x0e\n\x06length\x18\x04 \x01(\x04\x12\x12\n\nsha512t24u\x18\x05 \x01(\t\x12\x13\n\x0b\x63hromosomal\x18\x06 \x01(\x08\"r\n\x1cGenomeAssemblySequenceRegion\x12\x0c\n\x04name\x18\x01 \x01(\t\x12\x0b\n\x03md5\x18\x02 \x01(\t\x12\x0e\n\x06length\x18\x03 \x01(\x04\x12\x12\n\nsha512t24u\x18\x04 \x01(\t\x12\x13\n\x0b\x63hromosomal\x18\x05 \x01(\x08\"\xac\x01\n\x08\x44\x61tasets\x12\x13\n\x0bgenome_uuid\x18\x01 \x01(\t\x12:\n\x08\x64\x61tasets\x18\x02 \x03(\x0b\x32(.ensembl_metadata.Datasets.DatasetsEntry\x1aO\n\rDatasetsEntry\x12\x0b\n\x03key\x18\x01 \x01(\t\x12-\n\x05value\x18\x02 \x01(\x0b\x32\x1e.ensembl_metadata.DatasetInfos:\x02\x38\x01\"!\n\nGenomeUUID\x12\x13\n\x0bgenome_uuid\x18\x01 \x01(\t\"E\n\x16GenomeUUIDLookupResult\x12\x16\n\x0e\x63orrelation_id\x18\x01 \x01(\t\x12\x13\n\x0bgenome_uuid\x18\x02 \x01(\t\"\x8f\x01\n\x0eOrganismsGroup\x12\x1b\n\x13species_taxonomy_id\x18\x01 \x01(\r\x12\x14\n\x0c\x65nsembl_name\x18\x02 \x01(\t\x12\x13\n\x0b\x63ommon_name\x18\x03 \x01(\t\x12\x17\n\x0fscientific_name\x18\x04 \x01(\t\x12\r\n\x05order\x18\x05 \x01(\r\x12\r\n\x05\x63ount\x18\x06 \x01(\r\"o\n\x13OrganismsGroupCount\x12?\n\x15organisms_group_count\x18\x01 \x03(\x0b\x32 .ensembl_metadata.OrganismsGroup\x12\x17\n\x0frelease_version\x18\x02 \x01(\x01\"p\n\x11GenomeUUIDRequest\x12\x13\n\x0bgenome_uuid\x18\x01 \x01(\t\x12\x17\n\x0frelease_version\x18\x02 \x01(\x01\x12-\n\tread_mask\x18\x03 \x01(\x0b\x32\x1a.google.protobuf.FieldMask\"q\n\x12GenomeUUIDsRequest\x12\x13\n\x0bgenome_uuid\x18\x01 \x03(\t\x12\x17\n\x0frelease_version\x18\x02 \x01(\x01\x12-\n\tread_mask\x18\x03 \x01(\x0b\x32\x1a.google.protobuf.FieldMask\"x\n\x16GenomeByKeywordRequest\x12\x0f\n\x07keyword\x18\x01 \x01(\t\x12\x17\n\x0frelease_version\x18\x02 \x01(\x01\x12\r\n\x05\x66uzzy\x18\x03 \x01(\x08\x12\x11\n\tpage_size\x18\x04 \x01(\x05\x12\x12\n\npage_token\x18\x05 \x01(\t\"Q\n\x17GenomeSuggestionRequest\x12\x0e\n\x06prefix\x18\x01 \x01(\t\x12\r\n\x05limit\x18\x02 \x01(\r\x12\x17\n\x0frelease_version\x18\x03 \x01(\x01\"\x84\x01\n\x11GenomeNameRequest\x12\x14\n\x0c\x65nsembl_name\x18\x01 \x01(\t\x12\x11\n\tsite_name\x18\x02 \x01(\t\x12\x17\n\x0frelease_version\x18\x03 \x01(\x01\x12-\n\tread_mask\x18\x04 \x01(\x0b\x32\x1a.google.protobuf.FieldMask\"C\n\x11\x41ssemblyIDRequest\x12\x15\n\rassembly_uuid\x18\x01 \x01(\t\x12\x17\n\x0frelease_version\x18\x02 \x01(\x01\"Q\n\x1a\x41ssemblyAccessionIDRequest\x12\x1a\n\x12\x61ssembly_accession\x18\x01 \x01(\t\x12\x17\n\x0frelease_version\x18\x02 \x01(\x01\"9\n\x11OrganismIDRequest\x12\x15\n\rorganism_uuid\x18\x01 \x01(\t\x12\r\n\x05group\x18\x02 \x01(\t\"y\n\x0eReleaseRequest\x12\x11\n\tsite_name\x18\x01 \x03(\t\x12\x17\n\x0frelease_version\x18\x02 \x03(\x01\x12\x14\n\x0c\x63urrent_only\x18\x03 \x01(\x08\x12\x11\n\tpage_size\x18\x04 \x01(\x05\x12\x12\n\npage_token\x18\x05 \x01(\t\"m\n\x15GenomeSequenceRequest\x12\x13\n\x0bgenome_uuid\x18\x01 \x01(\t\x12\x18\n\x10\x63hromosomal_only\x18\x02 \x01(\x08\x12\x11\n\tpage_size\x18\x03 \x01(\x05\x12\x12\n\npage_token\x18\x04 \x01(\t\"m\n\x15\x41ssemblyRegionRequest\x12\x13\n\x0bgenome_uuid\x18\x01 \x01(\t\x12\x18\n\x10\x63hromosomal_only\x18\x02 \x01(\x08\x12\x11\n\tpage_size\x18\x03 \x01(\x05\x12\x12\n\npage_token\x18\x04 \x01(\t\"X\n#GenomeAssemblySequenceRegionRequest\x12\x13\n\x0bgenome_uuid\x18\x01 \x01(\t\x12\x1c\n\x14sequence_region_name\x18\x02 \x01(\t\"?\n\x0f\x44\x61tasetsRequest\x12\x13\n\x0bgenome_uuid\x18\x01 \x01(\t\x12\x17\n\x0frelease_version\x18\x02 \x01(\x01\"B\n\x15GenomeDatatypeRequest\x12\x13\n\x0bgenome_uuid\x18\x01 \x01(\t\x12\x14\n\x0c\x64\x61taset_type\x18\x02 \x01(\t\"U\n\x11GenomeInfoRequest\x12\x14\n\x0c\x65nsembl_name\x18\x01 \x01(\t\x12\x15\n\rassembly_name\x18\x02 \x01(\t\x12\x13\n\x0buse_default\x18\x03 \x01(\x08\"l\n\x10GenomeUUIDLookup\x12\x16\n\x0e\x63orrelation_id\x18\x01 \x01(\t\x12\x14\n\x0c\x65nsembl_name\x18\x02 \x01(\t\x12\x15\n\rassembly_name\x18\x03 \x01(\t\x12\x13\n\x0buse_default\x18\x04 \x01(\x08\"0\n\x15OrganismsGroupRequest\x12\x17\n\x0frelease_version\x18\x01 \x01(\x01\"&\n\x10GenomeTagRequest\x12\x12\n\ngenome_tag\x18\x01 \x01(\t\"\xd2\x01\n\x0f\x43\x61\x63heStatistics\x12\x0c\n\x04name\x18\x01 \x01(\t\x12\x0f\n\x07\x65ntries\x18\x02 \x01(\r\x12\x12\n\nsize_bytes\x18\x03 \x01(\x04\x12\x11\n\tmax_bytes\x18\x04 \x01(\x04\x12\x0c\n\x04hits\x18\x05 \x01(\x04\x12\x0e\n\x06misses\x18\x06 \x01(\x04\x12\x11\n\thit_ratio\x18\x07 \x01(\x01\x12\x10\n\x08\x61\x64mitted\x18\x08 \x01(\x04\x12\x10\n\x08rejected\x18\t \x01(\x04\x12\x0f\n\x07\x65victed\x18\n \x01(\x04\x12\x13\n\x0b\x61ge_seconds\x18\x0b \x01(\x01\">\n\tCacheList\x12\x31\n\x06\x63\x61\x63hes\x18\x01 \x03(\x0b\x32!.ensembl_metadata.CacheStatistics\"\x13\n\x11ListCachesRequest\"m\n\x16InvalidateCacheRequest\x12\x12\n\ncache_name\x18\x01 \x03(\t\x12\x13\n\x0bgenome_uuid\x18\x02 \x01(\t\x12\x17\n\x0frelease_version\x18\x03 \x01(\x01\x12\x11\n\tsite_name\x18\x04 \x01(\t\",\n\x15InvalidateCacheResult\x12\x13\n\x0binvalidated\x18\x01 \x01(\r\",\n\x14RebuildCachesRequest\x12\x14\n\x0cskip_prewarm\x18\x01 \x01(\x08\"(\n\x13RebuildCachesResult\x12\x11\n\tprewarmed\x18\x01 \x01(\r2\xef\x10\n\x0f\x45nsemblMetadata\x12R\n\x0fGetGenomeByUUID\x12#.ensembl_metadata.GenomeUUIDRequest\x1a\x18.ensembl_metadata.Genome\"\x00\x12W\n\x11GetGenomesByUUIDs\x12$.ensembl_metadata.GenomeUUIDsRequest\x1a\x18.ensembl_metadata.Genome\"\x00\x30\x01\x12T\n\rGetGenomeUUID\x12#.ensembl_metadata.GenomeInfoRequest\x1a\x1c.ensembl_metadata.GenomeUUID\"\x00\x12g\n\x11LookupGenomeUUIDs\x12\".ensembl_metadata.GenomeUUIDLookup\x1a(.ensembl_metadata.GenomeUUIDLookupResult\"\x00(\x01\x30\x01\x12]\n\x13GetGenomesByKeyword\x12(.ensembl_metadata.GenomeByKeywordRequest\x1a\x18.ensembl_metadata.Genome\"\x00\x30\x01\x12m\n\x1fGetGenomesByAssemblyAccessionID\x12,.ensembl_metadata.AssemblyAccessionIDRequest\x1a\x18.ensembl_metadata.Genome\"\x00\x30\x01\x12Y\n\x15GetSpeciesInformation\x12#.ensembl_metadata.GenomeUUIDRequest\x1a\x19.ensembl_metadata.Species\"\x00\x12_\n\x16GetAssemblyInformation\x12#.ensembl_metadata.AssemblyIDRequest\x1a\x1e.ensembl_metadata.AssemblyInfo\"\x00\x12_\n\x18GetSubSpeciesInformation\x12#.ensembl_metadata.OrganismIDRequest\x1a\x1c.ensembl_metadata.SubSpecies\"\x00\x12\x64\n\x15GetTopLevelStatistics\x12#.ensembl_metadata.OrganismIDRequest\x1a$.ensembl_metadata.TopLevelStatistics\"\x00\x12p\n\x1bGetTopLevelStatisticsByUUID\x12#.ensembl_metadata.GenomeUUIDRequest\x1a*.ensembl_metadata.TopLevelStatisticsByUUID\"\x00\x12R\n\x0fGetGenomeByName\x12#.ensembl_metadata.GenomeNameRequest\x1a\x18.ensembl_metadata.Genome\"\x00\x12M\n\nGetRelease\x12 .ensembl_metadata.ReleaseRequest\x1a\x19.ensembl_metadata.Release\"\x00\x30\x01\x12V\n\x10GetReleaseByUUID\x12#.ensembl_metadata.GenomeUUIDRequest\x1a\x19.ensembl_metadata.Release\"\x00\x30\x01\x12\x62\n\x11GetGenomeSequence\x12\'.ensembl_metadata.GenomeSequenceRequest\x1a .ensembl_metadata.GenomeSequence\"\x00\x30\x01\x12\x62\n\x11GetAssemblyRegion\x12\'.ensembl_metadata.AssemblyRegionRequest\x1a .ensembl_metadata.AssemblyRegion\"\x00\x30\x01\x12\x8a\x01\n\x1fGetGenomeAssemblySequenceRegion\x12\x35.ensembl_metadata.GenomeAssemblySequenceRegionRequest\x1a..ensembl_metadata.GenomeAssemblySequenceRegion\"\x00\x12X\n\x15GetDatasetsListByUUID\x12!.ensembl_metadata.DatasetsRequest\x1a\x1a.ensembl_metadata.Datasets\"\x00\x12\x62\n\x15GetDatasetInformation\x12\'.ensembl_metadata.GenomeDatatypeRequest\x1a\x1e.ensembl_metadata.DatasetInfos\"\x00\x12j\n\x16GetOrganismsGroupCount\x12\'.ensembl_metadata.OrganismsGroupRequest\x1a%.ensembl_metadata.OrganismsGroupCount\"\x00\x12X\n\x12GetGenomeUUIDByTag\x12\".ensembl_metadata.GenomeTagRequest\x1a\x1c.ensembl_metadata.GenomeUUID\"\x00\x12Y\n\x0eSuggestGenomes\x12).ensembl_metadata.GenomeSuggestionRequest\x1a\x18.ensembl_metadata.Genome\"\x00\x30\x01\x32\xb2\x02\n\x14\x45nsemblMetadataAdmin\x12P\n\nListCaches\x12#.ensembl_metadata.ListCachesRequest\x1a\x1b.ensembl_metadata.CacheList\"\x00\x12\x66\n\x0fInvalidateCache\x12(.ensembl_metadata.InvalidateCacheRequest\x1a\'.ensembl_metadata.InvalidateCacheResult\"\x00\x12`\n\rRebuildCaches\x12&.ensembl_metadata.RebuildCachesRequest\x1a%.ensembl_metadata.RebuildCachesResult\"\x00\x62\x06proto3')
 
 _globals = globals()
 _builder.BuildMessageAndEnumDescriptors(DESCRIPTOR, _globals)
@@ -22,82 +23,106 @@ if _descriptor._USE_C_DESCRIPTORS == False:
   DESCRIPTOR._options = None
   _DATASETS_DATASETSENTRY._options = None
   _DATASETS_DATASETSENTRY._serialized_options = b'8\001'
-  _globals['_GENOME']._serialized_start=78
-  _globals['_GENOME']._serialized_end=393
-  _globals['_SPECIES']._serialized_start=396
-  _globals['_SPECIES']._serialized_end=549
-  _globals['_ASSEMBLYINFO']._serialized_start=552
-  _globals['_ASSEMBLYINFO']._serialized_end=734
-  _globals['_SUBSPECIES']._serialized_start=736
-  _globals['_SUBSPECIES']._serialized_end=815
-  _globals['_ATTRIBUTESTATISTICS']._serialized_start=817
-  _globals['_ATTRIBUTESTATISTICS']._serialized_end=916
-  _globals['_TOPLEVELSTATISTICSBYUUID']._serialized_start=918
-  _globals['_TOPLEVELSTATISTICSBYUUID']._serialized_end=1024
-  _globals['_TOPLEVELSTATISTICS']._serialized_start=1026
-  _globals['_TOPLEVELSTATISTICS']._serialized_end=1143
-  _globals['_ASSEMBLY']._serialized_start=1146
-  _globals['_ASSEMBLY']._serialized_end=1324
-  _globals['_TAXON']._serialized_start=1326
-  _globals['_TAXON']._serialized_end=1422
-  _globals['_RELEASE']._serialized_start=1425
-  _globals['_RELEASE']._serialized_end=1581
-  _globals['_ORGANISM']._serialized_start=1584
-  _globals['_ORGANISM']._serialized_end=1806
-  _globals['_ATTRIBUTE']._serialized_start=1808
-  _globals['_ATTRIBUTE']._serialized_end=1883
-  _globals['_ATTRIBUTESINFO']._serialized_start=1886
-  _globals['_ATTRIBUTESINFO']._serialized_end=2303
-  _globals['_DATASETINFOS']._serialized_start=2306
-  _globals['_DATASETINFOS']._serialized_end=2598
-  _globals['_DATASETINFOS_DATASETINFO']._serialized_start=2433
-  _globals['_DATASETINFOS_DATASETINFO']._serialized_end=2598
-  _globals['_GENOMESEQUENCE']._serialized_start=2600
-  _globals['_GENOMESEQUENCE']._serialized_end=2713
-  _globals['_ASSEMBLYREGION']._serialized_start=2715
-  _globals['_ASSEMBLYREGION']._serialized_end=2829
-  _globals['_GENOMEASSEMBLYSEQUENCEREGION']._serialized_start=2831
-  _globals['_GENOMEASSEMBLYSEQUENCEREGION']._serialized_end=2945
-  _globals['_DATASETS']._serialized_start=2948
-  _globals['_DATASETS']._serialized_end=3120
-  _globals['_DATASETS_DATASETSENTRY']._serialized_start=3041
-  _globals['_DATASETS_DATASETSENTRY']._serialized_end=3120
-  _globals['_GENOMEUUID']._serialized_start=3122
-  _globals['_GENOMEUUID']._serialized_end=3155
-  _globals['_ORGANISMSGROUP']._serialized_start=3158
-  _globals['_ORGANISMSGROUP']._serialized_end=3301
-  _globals['_ORGANISMSGROUPCOUNT']._serialized_start=3303
-  _globals['_ORGANISMSGROUPCOUNT']._serialized_end=3414
-  _globals['_GENOMEUUIDREQUEST']._serialized_start=3416
-  _globals['_GENOMEUUIDREQUEST']._serialized_end=3481
-  _globals['_GENOMEBYKEYWORDREQUEST']._serialized_start=3483
-  _globals['_GENOMEBYKEYWORDREQUEST']._serialized_end=3549
-  _globals['_GENOMENAMEREQUEST']._serialized_start=3551
-  _globals['_GENOMENAMEREQUEST']._serialized_end=3636
-  _globals['_ASSEMBLYIDREQUEST']._serialized_start=3638
-  _globals['_ASSEMBLYIDREQUEST']._serialized_end=3705
-  _globals['_ASSEMBLYACCESSIONIDREQUEST']._serialized_start=3707
-  _globals['_ASSEMBLYACCESSIONIDREQUEST']._serialized_end=3788
-  _globals['_ORGANISMIDREQUEST']._serialized_start=3790
-  _globals['_ORGANISMIDREQUEST']._serialized_end=3847
-  _globals['_RELEASEREQUEST']._serialized_start=3849
-  _globals['_RELEASEREQUEST']._serialized_end=3931
-  _globals['_GENOMESEQUENCEREQUEST']._serialized_start=3933
-  _globals['_GENOMESEQUENCEREQUEST']._serialized_end=4003
-  _globals['_ASSEMBLYREGIONREQUEST']._serialized_start=4005
-  _globals['_ASSEMBLYREGIONREQUEST']._serialized_end=4075
-  _globals['_GENOMEASSEMBLYSEQUENCEREGIONREQUEST']._serialized_start=4077
-  _globals['_GENOMEASSEMBLYSEQUENCEREGIONREQUEST']._serialized_end=4165
-  _globals['_DATASETSREQUEST']._serialized_start=4167
-  _globals['_DATASETSREQUEST']._serialized_end=4230
-  _globals['_GENOMEDATATYPEREQUEST']._serialized_start=4232
-  _globals['_GENOMEDATATYPEREQUEST']._serialized_end=4298
-  _globals['_GENOMEINFOREQUEST']._serialized_start=4300
-  _globals['_GENOMEINFOREQUEST']._serialized_end=4385
-  _globals['_ORGANISMSGROUPREQUEST']._serialized_start=4387
-  _globals['_ORGANISMSGROUPREQUEST']._serialized_end=4435
-  _globals['_GENOMETAGREQUEST']._serialized_start=4437
-  _globals['_GENOMETAGREQUEST']._serialized_end=4475
-  _globals['_ENSEMBLMETADATA']._serialized_start=4478
-  _globals['_ENSEMBLMETADATA']._serialized_end=6352
+  _globals['_GENOME']._serialized_start=112
+  _globals['_GENOME']._serialized_end=427
+  _globals['_SPECIES']._serialized_start=430
+  _globals['_SPECIES']._serialized_end=583
+  _globals['_ASSEMBLYINFO']._serialized_start=586
+  _globals['_ASSEMBLYINFO']._serialized_end=768
+  _globals['_SUBSPECIES']._serialized_start=770
+  _globals['_SUBSPECIES']._serialized_end=849
+  _globals['_ATTRIBUTESTATISTICS']._serialized_start=851
+  _globals['_ATTRIBUTESTATISTICS']._serialized_end=950
+  _globals['_TOPLEVELSTATISTICSBYUUID']._serialized_start=952
+  _globals['_TOPLEVELSTATISTICSBYUUID']._serialized_end=1058
+  _globals['_TOPLEVELSTATISTICS']._serialized_start=1060
+  _globals['_TOPLEVELSTATISTICS']._serialized_end=1177
+  _globals['_ASSEMBLY']._serialized_start=1180
+  _globals['_ASSEMBLY']._serialized_end=1358
+  _globals['_TAXON']._serialized_start=1360
+  _globals['_TAXON']._serialized_end=1456
+  _globals['_RELEASE']._serialized_start=1459
+  _globals['_RELEASE']._serialized_end=1615
+  _globals['_ORGANISM']._serialized_start=1618
+  _globals['_ORGANISM']._serialized_end=1840
+  _globals['_ATTRIBUTE']._serialized_start=1842
+  _globals['_ATTRIBUTE']._serialized_end=1917
+  _globals['_ATTRIBUTESINFO']._serialized_start=1920
+  _globals['_ATTRIBUTESINFO']._serialized_end=2337
+  _globals['_DATASETINFOS']._serialized_start=2340
+  _globals['_DATASETINFOS']._serialized_end=2632
+  _globals['_DATASETINFOS_DATASETINFO']._serialized_start=2467
+  _globals['_DATASETINFOS_DATASETINFO']._serialized_end=2632
+  _globals['_GENOMESEQUENCE']._serialized_start=2634
+  _globals['_GENOMESEQUENCE']._serialized_end=2747
+  _globals['_ASSEMBLYREGION']._serialized_start=2749
+  _globals['_ASSEMBLYREGION']._serialized_end=2863
+  _globals['_GENOMEASSEMBLYSEQUENCEREGION']._serialized_start=2865
+  _globals['_GENOMEASSEMBLYSEQUENCEREGION']._serialized_end=2979
+  _globals['_DATASETS']._serialized_start=2982
+  _globals['_DATASETS']._serialized_end=3154
+  _globals['_DATASETS_DATASETSENTRY']._serialized_start=3075
+  _globals['_DATASETS_DATASETSENTRY']._serialized_end=3154
+  _globals['_GENOMEUUID']._serialized_start=3156
+  _globals['_GENOMEUUID']._serialized_end=3189
+  _globals['_GENOMEUUIDLOOKUPRESULT']._serialized_start=3191
+  _globals['_GENOMEUUIDLOOKUPRESULT']._serialized_end=3260
+  _globals['_ORGANISMSGROUP']._serialized_start=3263
+  _globals['_ORGANISMSGROUP']._serialized_end=3406
+  _globals['_ORGANISMSGROUPCOUNT']._serialized_start=3408
+  _globals['_ORGANISMSGROUPCOUNT']._serialized_end=3519
+  _globals['_GENOMEUUIDREQUEST']._serialized_start=3521
+  _globals['_GENOMEUUIDREQUEST']._serialized_end=3633
+  _globals['_GENOMEUUIDSREQUEST']._serialized_start=3635
+  _globals['_GENOMEUUIDSREQUEST']._serialized_end=3748
+  _globals['_GENOMEBYKEYWORDREQUEST']._serialized_start=3750
+  _globals['_GENOMEBYKEYWORDREQUEST']._serialized_end=3870
+  _globals['_GENOMESUGGESTIONREQUEST']._serialized_start=3872
+  _globals['_GENOMESUGGESTIONREQUEST']._serialized_end=3953
+  _globals['_GENOMENAMEREQUEST']._serialized_start=3956
+  _globals['_GENOMENAMEREQUEST']._serialized_end=4088
+  _globals['_ASSEMBLYIDREQUEST']._serialized_start=4090
+  _globals['_ASSEMBLYIDREQUEST']._serialized_end=4157
+  _globals['_ASSEMBLYACCESSIONIDREQUEST']._serialized_start=4159
+  _globals['_ASSEMBLYACCESSIONIDREQUEST']._serialized_end=4240
+  _globals['_ORGANISMIDREQUEST']._serialized_start=4242
+  _globals['_ORGANISMIDREQUEST']._serialized_end=4299
+  _globals['_RELEASEREQUEST']._serialized_start=4301
+  _globals['_RELEASEREQUEST']._serialized_end=4422
+  _globals['_GENOMESEQUENCEREQUEST']._serialized_start=4424
+  _globals['_GENOMESEQUENCEREQUEST']._serialized_end=4533
+  _globals['_ASSEMBLYREGIONREQUEST']._serialized_start=4535
+  _globals['_ASSEMBLYREGIONREQUEST']._serialized_end=4644
+  _globals['_GENOMEASSEMBLYSEQUENCEREGIONREQUEST']._serialized_start=4646
+  _globals['_GENOMEASSEMBLYSEQUENCEREGIONREQUEST']._serialized_end=4734
+  _globals['_DATASETSREQUEST']._serialized_start=4736
+  _globals['_DATASETSREQUEST']._serialized_end=4799
+  _globals['_GENOMEDATATYPEREQUEST']._serialized_start=4801
+  _globals['_GENOMEDATATYPEREQUEST']._serialized_end=4867
+  _globals['_GENOMEINFOREQUEST']._serialized_start=4869
+  _globals['_GENOMEINFOREQUEST']._serialized_end=4954
+  _globals['_GENOMEUUIDLOOKUP']._serialized_start=4956
+  _globals['_GENOMEUUIDLOOKUP']._serialized_end=5064
+  _globals['_ORGANISMSGROUPREQUEST']._serialized_start=5066
+  _globals['_ORGANISMSGROUPREQUEST']._serialized_end=5114
+  _globals['_GENOMETAGREQUEST']._serialized_start=5116
+  _globals['_GENOMETAGREQUEST']._serialized_end=5154
+  _globals['_CACHESTATISTICS']._serialized_start=5157
+  _globals['_CACHESTATISTICS']._serialized_end=5367
+  _globals['_CACHELIST']._serialized_start=5369
+  _globals['_CACHELIST']._serialized_end=5431
+  _globals['_LISTCACHESREQUEST']._serialized_start=5433
+  _globals['_LISTCACHESREQUEST']._serialized_end=5452
+  _globals['_INVALIDATECACHEREQUEST']._serialized_start=5454
+  _globals['_INVALIDATECACHEREQUEST']._serialized_end=5563
+  _globals['_INVALIDATECACHERESULT']._serialized_start=5565
+  _globals['_INVALIDATECACHERESULT']._serialized_end=5609
+  _globals['_REBUILDCACHESREQUEST']._serialized_start=5611
+  _globals['_REBUILDCACHESREQUEST']._serialized_end=5655
+  _globals['_REBUILDCACHESRESULT']._serialized_start=5657
+  _globals['_REBUILDCACHESRESULT']._serialized_end=5697
+  _globals['_ENSEMBLMETADATA']._serialized_start=5700
+  _globals['_ENSEMBLMETADATA']._serialized_end=7859
+  _globals['_ENSEMBLMETADATAADMIN']._serialized_start=7862
+  _globals['_ENSEMBLMETADATAADMIN']._serialized_end=8168
 # @@protoc_insertion_point(module_scope)
@@ -0,0 +1,68 @@
+# See the NOTICE file distributed with this work for additional information
+#   regarding copyright ownership.
+#   Licensed under the Apache License, Version 2.0 (the "License");
+#   you may not use this file except in compliance with the License.
+#   You may obtain a copy of the License at
+#       http://www.apache.org/licenses/LICENSE-2.0
+#   Unless required by applicable law or agreed to in writing, software
+#   distributed under the License is distributed on an "AS IS" BASIS,
+#   WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+#   See the License for the specific language governing permissions and
+#   limitations under the License.
+import contextvars
+from contextlib import ExitStack
+
+import grpc
+
+from ensembl.production.metadata.grpc.adaptors.replicas import unit_of_work
+
+
+def _stream_in_unit_of_work(behavior, request, context):
+    """
+    Iterate the responses of a response-streaming RPC within a unit of work. The unit lives in its own
+    context, entered for each response only, as the iteration is resumed by the gRPC server between responses.
+    """
+    unit_context = contextvars.copy_context()
+    stack = ExitStack()
+    unit_context.run(stack.enter_context, unit_of_work())
+    try:
+        responses = unit_context.run(behavior, request, context)
+        while True:
+            try:
+                response = unit_context.run(next, responses)
+            except StopIteration:
+                return
+            yield response
+    finally:
+        unit_context.run(stack.close)
+
+
+class UnitOfWorkInterceptor(grpc.ServerInterceptor):
+    """
+    Run each unary-request RPC within a unit of work, so that all its adaptor calls share one session per DB.
+    """
+
+    def intercept_service(self, continuation, handler_call_details):
+        handler = continuation(handler_call_details)
+        if handler is None:
+            return None
+        if handler.unary_unary is not None:
+            behavior = handler.unary_unary
+
+            def unary_unary(request, context):
+                with unit_of_work():
+                    return behavior(request, context)
+
+            return grpc.unary_unary_rpc_method_handler(
+                unary_unary,
+                request_deserializer=handler.request_deserializer,
+                response_serializer=handler.response_serializer,
+            )
+        if handler.unary_stream is not None:
+            behavior = handler.unary_stream
+            return grpc.unary_stream_rpc_method_handler(
+                lambda request, context: _stream_in_unit_of_work(behavior, request, context),
+                request_deserializer=handler.request_deserializer,
+                response_serializer=handler.response_serializer,
+            )
+        return handler
@@ -0,0 +1,97 @@
+# See the NOTICE file distributed with this work for additional information
+#   regarding copyright ownership.
+#   Licensed under the Apache License, Version 2.0 (the "License");
+#   you may not use this file except in compliance with the License.
+#   You may obtain a copy of the License at
+#       http://www.apache.org/licenses/LICENSE-2.0
+#   Unless required by applicable law or agreed to in writing, software
+#   distributed under the License is distributed on an "AS IS" BASIS,
+#   WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+#   See the License for the specific language governing permissions and
+#   limitations under the License.
+"""
+Keyset pagination of the streaming list RPCs.
+
+A request is paged when its page_size or page_token is set. Its page token holds the sort key of the last
+message of the previous page (e.g. a release_id), the next page being read past that key rather than by
+skipping the previous pages (OFFSET), and a fingerprint of the request, so that it is only accepted for the
+same query.
+"""
+import base64
+import hashlib
+import itertools
+import json
+
+from ensembl.production.metadata.grpc.config import MetadataConfig as cfg
+
+# Trailing metadata key of the token of the next page, absent on the last page
+NEXT_PAGE_TOKEN_KEY = "next-page-token"
+# Request fields of the paged requests, not part of the query
+PAGE_FIELDS = ("page_size", "page_token")
+
+
+def is_paged(request):
+    return bool(request.page_size or request.page_token)
+
+
+def _fingerprint(request):
+    """Digest of the type and query fields of a request, the page fields excluded."""
+    query = type(request)()
+    query.CopyFrom(request)
+    for field in PAGE_FIELDS:
+        query.ClearField(field)
+    digest = hashlib.sha1(request.DESCRIPTOR.full_name.encode())
+    digest.update(query.SerializeToString(deterministic=True))
+    return digest.hexdigest()[:16]
+
+
+def encode_page_token(request, key):
+    """Token of the page following the message of sort key key (JSON serialisable) in the results."""
+    return base64.urlsafe_b64encode(json.dumps([_fingerprint(request), key]).encode()).decode()
+
+
+def read_page(request, key_type):
+    """
+    Size and position of the page asked for by a paged request.
+
+    Args:
+        request (Message): The paged request.
+        key_type (type): Type of the sort keys of its results.
+
+    Returns:
+        tuple: Number of messages of the page, and sort key of the last message of the previous page (None for
+            the first page).
+
+    Raises:
+        ValueError: If the page size is negative, or the page token was not returned for this query.
+    """
+    if request.page_size < 0:
+        raise ValueError(f"Invalid page size: {request.page_size}")
+    size = min(request.page_size or cfg.page_default_size, cfg.page_max_size)
+    if not request.page_token:
+        return size, None
+    try:
+        fingerprint, key = json.loads(base64.urlsafe_b64decode(request.page_token.encode()))
+    except (ValueError, TypeError):
+        raise ValueError("Malformed page token")
+    if fingerprint != _fingerprint(request) or not isinstance(key, key_type):
+        raise ValueError("Page token of another query")
+    return size, key
+
+
+def page_of(rows, size, key_of):
+    """
+    Take a page from rows, in sort order.
+
+    Args:
+        rows (Iterable): Rows from the start of the page, at least one more than size if more follow.
+        size (int): Number of rows of the page.
+        key_of (Callable): Sort key of a row, as passed to encode_page_token.
+
+    Returns:
+        tuple: The rows of the page, and the sort key of its last row (None if it is the last page).
+    """
+    rows = list(itertools.islice(rows, size + 1))
+    if len(rows) <= size:
+        return rows, None
+    return rows[:size], key_of(rows[size - 1])
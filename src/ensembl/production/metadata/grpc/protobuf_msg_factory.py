@@ -230,26 +230,48 @@ def create_genome_uuid(data=None):
     return genome_uuid
 
 
-def create_genome(data=None, attributes=None, count=0, alternative_names=[]):
+def create_genome_uuid_lookup_result(data=None):
     if data is None:
-        return ensembl_metadata_pb2.Genome()
+        return ensembl_metadata_pb2.GenomeUUIDLookupResult()
+
+    return ensembl_metadata_pb2.GenomeUUIDLookupResult(
+        correlation_id=data["correlation_id"],
+        genome_uuid=data["genome_uuid"]
+    )
+
 
-    assembly = create_assembly(data)
-    taxon = create_taxon(data, alternative_names)
-    organism = create_organism(data)
-    attributes_info = create_attributes_info(attributes)
-    release = create_release(data)
+def in_read_mask(read_mask, path):
+    """Whether a read mask selects a field (or part of it), all fields being selected by an empty mask."""
+    if read_mask is None or not read_mask.paths:
+        return True
+    return any(
+        path == masked or path.startswith(masked + ".") or masked.startswith(path + ".")
+        for masked in read_mask.paths
+    )
 
+
+def create_genome(data=None, attributes=None, count=0, alternative_names=[], read_mask=None):
+    if data is None:
+        return ensembl_metadata_pb2.Genome()
+
+    # Only the sub-messages selected by the read mask are built
+    sub_messages = {
+        "assembly": lambda: create_assembly(data),
+        "taxon": lambda: create_taxon(data, alternative_names),
+        "organism": lambda: create_organism(data),
+        "attributes_info": lambda: create_attributes_info(attributes),
+        "release": lambda: create_release(data),
+    }
     genome = ensembl_metadata_pb2.Genome(
         genome_uuid=data.Genome.genome_uuid,
         created=str(data.Genome.created),
-        assembly=assembly,
-        taxon=taxon,
-        organism=organism,
-        attributes_info=attributes_info,
-        release=release,
-        related_assemblies_count=count
+        related_assemblies_count=count,
+        **{name: create() for name, create in sub_messages.items() if in_read_mask(read_mask, name)}
     )
+    if read_mask is not None and read_mask.paths:
+        masked_genome = ensembl_metadata_pb2.Genome()
+        read_mask.MergeMessage(genome, masked_genome)
+        return masked_genome
     return genome
 
 
@@ -0,0 +1,75 @@
+#  See the NOTICE file distributed with this work for additional information
+#  regarding copyright ownership.
+#  Licensed under the Apache License, Version 2.0 (the "License");
+#  you may not use this file except in compliance with the License.
+#  You may obtain a copy of the License at
+#      http://www.apache.org/licenses/LICENSE-2.0
+#  Unless required by applicable law or agreed to in writing, software
+#  distributed under the License is distributed on an "AS IS" BASIS,
+#  WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+#  See the License for the specific language governing permissions and
+#  limitations under the License.
+import logging
+import threading
+
+import sqlalchemy as db
+
+logger = logging.getLogger(__name__)
+
+
+class ReleaseWatcher:
+    """
+    Poll the release fingerprint of the metadata DB and notify listeners when it changes, so that in-memory
+    indexes and response caches are rebuilt after a release is created or updated.
+
+    Args:
+        db_conn (BaseAdaptor): Adaptor used to compute the release fingerprint.
+        interval (int): Seconds between two polls, 0 disables polling.
+        listeners (List[Callable[[str], None]]): Called with the new fingerprint, in order, on every change.
+    """
+
+    def __init__(self, db_conn, interval, listeners=()):
+        self.db_conn = db_conn
+        self.interval = interval
+        self.listeners = list(listeners)
+        self.fingerprint = None
+        self._stop = threading.Event()
+        self._thread = None
+
+    def check(self):
+        """
+        Compare the current fingerprint with the last one seen and notify the listeners if it changed.
+
+        Returns:
+            bool: Whether the release state changed.
+        """
+        fingerprint = self.db_conn.fetch_release_fingerprint()
+        if self.fingerprint is None or fingerprint == self.fingerprint:
+            self.fingerprint = fingerprint
+            return False
+        logger.info("Release state of the metadata DB changed, rebuilding indexes and caches")
+        self.fingerprint = fingerprint
+        for listener in self.listeners:
+            try:
+                listener(fingerprint)
+            except db.exc.SQLAlchemyError as e:
+                logger.warning("Release change listener %s failed: %s", listener, e)
+        return True
+
+    def _run(self):
+        while not self._stop.wait(self.interval):
+            try:
+                self.check()
+            except db.exc.SQLAlchemyError as e:
+                logger.warning("Release state check failed: %s", e)
+
+    def start(self):
+        if self.interval > 0:
+            self.check()
+            self._thread = threading.Thread(target=self._run, name="release-watcher", daemon=True)
+            self._thread.start()
+
+    def stop(self):
+        self._stop.set()
+        if self._thread is not None:
+            self._thread.join()
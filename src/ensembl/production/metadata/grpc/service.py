@@ -12,19 +12,84 @@
 from concurrent import futures
 import grpc
 import logging
+import signal
 
 from ensembl.production.metadata.grpc import ensembl_metadata_pb2_grpc
+from ensembl.production.metadata.grpc.admin import EnsemblMetadataAdminServicer
+from ensembl.production.metadata.grpc.cache_snapshot import CacheSnapshotter
+from ensembl.production.metadata.grpc.cache_warmup import AccessLog, AccessLogSaver, prewarm, rebuild
+from ensembl.production.metadata.grpc.config import MetadataConfig as cfg
+from ensembl.production.metadata.grpc.interceptors import UnitOfWorkInterceptor
+from ensembl.production.metadata.grpc.release_watcher import ReleaseWatcher
 from ensembl.production.metadata.grpc.servicer import EnsemblMetadataServicer
 
+# Seconds given to in-flight RPCs to complete when the server is asked to stop
+SHUTDOWN_GRACE = 10
+
 
 def serve():
-    server = grpc.server(futures.ThreadPoolExecutor(max_workers=10))
+    # Each RPC shares one session per DB between its adaptor calls
+    server = grpc.server(futures.ThreadPoolExecutor(max_workers=10), interceptors=[UnitOfWorkInterceptor()])
+    servicer = EnsemblMetadataServicer()
     ensembl_metadata_pb2_grpc.add_EnsemblMetadataServicer_to_server(
-        EnsemblMetadataServicer(), server
+        servicer, server
     )
+
+    snapshotter = None
+    if cfg.cache_snapshot_path:
+        snapshotter = CacheSnapshotter(
+            servicer.caches, servicer.db, cfg.cache_snapshot_path, cfg.cache_snapshot_interval
+        )
+        snapshotter.load()
+        snapshotter.start()
+
+    access_log_saver = None
+    access_log = None
+    if cfg.access_log_path and len(servicer.caches):
+        access_log = AccessLog(cfg.access_log_sample_rate)
+        access_log_saver = AccessLogSaver(access_log, cfg.access_log_path, cfg.cache_snapshot_interval)
+        access_log_saver.load()
+    if cfg.cache_prewarm_top_n > 0 and len(servicer.caches):
+        # Warm the caches before the server accepts requests
+        prewarm(servicer, access_log, cfg.cache_prewarm_top_n)
+    if access_log_saver is not None:
+        servicer.caches.access_log = access_log
+        access_log_saver.start()
+
+    # Rebuild the in-memory indexes and the caches when a release is created or updated
+    release_listeners = [lambda fingerprint: rebuild(servicer, access_log, cfg.cache_prewarm_top_n)]
+    if snapshotter is not None:
+        release_listeners.append(snapshotter.release_changed)
+    watcher = ReleaseWatcher(servicer.db, cfg.release_poll_interval, release_listeners)
+    watcher.start()
+
+    admin_server = None
+    if cfg.admin_port:
+        # Admin RPCs are kept off the public port
+        admin_server = grpc.server(futures.ThreadPoolExecutor(max_workers=1))
+        ensembl_metadata_pb2_grpc.add_EnsemblMetadataAdminServicer_to_server(
+            EnsemblMetadataAdminServicer(servicer, access_log, cfg.cache_prewarm_top_n), admin_server
+        )
+        admin_server.add_insecure_port(f"{cfg.admin_host}:{cfg.admin_port}")
+        admin_server.start()
+
+    def stop(grace):
+        if admin_server is not None:
+            admin_server.stop(grace)
+        return server.stop(grace)
+
     server.add_insecure_port("[::]:50051")
     server.start()
-    server.wait_for_termination()
+    signal.signal(signal.SIGTERM, lambda signum, frame: stop(SHUTDOWN_GRACE))
+    try:
+        server.wait_for_termination()
+    except KeyboardInterrupt:
+        stop(SHUTDOWN_GRACE).wait()
+    watcher.stop()
+    if snapshotter is not None:
+        snapshotter.stop()
+    if access_log_saver is not None:
+        access_log_saver.stop()
 
 
 if __name__ == "__main__":
@@ -9,17 +9,71 @@
 #  WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
 #  See the License for the specific language governing permissions and
 #  limitations under the License.
-from ensembl.production.metadata.grpc import ensembl_metadata_pb2_grpc
+import grpc
+
+from ensembl.production.metadata.grpc import ensembl_metadata_pb2, ensembl_metadata_pb2_grpc
+from ensembl.production.metadata.grpc.cache import build_caches
+from ensembl.production.metadata.grpc.config import MetadataConfig as cfg
+from ensembl.production.metadata.grpc.pagination import NEXT_PAGE_TOKEN_KEY, encode_page_token, is_paged, \
+    read_page
 
 import ensembl.production.metadata.grpc.utils as utils
 
+# Share of the cache memory budget given to each cached RPC
+CACHE_BUDGETS = {
+    "GetGenomeByUUID": 0.20,
+    "GetGenomeByName": 0.10,
+    "GetGenomeUUID": 0.05,
+    "GetGenomeUUIDByTag": 0.05,
+    "GetGenomesByKeyword": 0.10,
+    "GetSpeciesInformation": 0.05,
+    "GetTopLevelStatisticsByUUID": 0.10,
+    "GetDatasetsListByUUID": 0.20,
+    "GetDatasetInformation": 0.10,
+    "GetOrganismsGroupCount": 0.05,
+}
+
 
 class EnsemblMetadataServicer(ensembl_metadata_pb2_grpc.EnsemblMetadataServicer):
     def __init__(self):
         self.db = utils.connect_to_db()
+        self.caches = build_caches(
+            ensembl_metadata_pb2.DESCRIPTOR.services_by_name["EnsemblMetadata"],
+            CACHE_BUDGETS,
+            cfg.cache_max_bytes,
+            ensembl_metadata_pb2
+        )
+
+    @staticmethod
+    def _read_mask(request, context):
+        """The read mask of a Genome request, aborting the call if it names fields Genome does not have."""
+        if not request.read_mask.IsValidForDescriptor(ensembl_metadata_pb2.Genome.DESCRIPTOR):
+            context.abort(
+                grpc.StatusCode.INVALID_ARGUMENT,
+                f"Invalid Genome read mask: {', '.join(request.read_mask.paths)}"
+            )
+        return request.read_mask
+
+    @staticmethod
+    def _page(request, context, key_type, fetch_page):
+        """
+        Serve a paged list request. fetch_page(size, after) returns the messages of the page and the sort key
+        of its last message if more follow, sent as the next page token in the trailing metadata.
+        """
+        try:
+            size, after = read_page(request, key_type)
+            messages, next_key = fetch_page(size, after)
+        except ValueError as e:
+            context.abort(grpc.StatusCode.INVALID_ARGUMENT, str(e))
+        if next_key is not None:
+            context.set_trailing_metadata(((NEXT_PAGE_TOKEN_KEY, encode_page_token(request, next_key)),))
+        return iter(messages)
 
     def GetSpeciesInformation(self, request, context):
-        return utils.get_species_information(self.db, request.genome_uuid)
+        return self.caches.fetch(
+            "GetSpeciesInformation", request,
+            lambda: utils.get_species_information(self.db, request.genome_uuid)
+        )
 
     def GetAssemblyInformation(self, request, context):
         return utils.get_assembly_information(self.db, request.assembly_uuid)
@@ -36,25 +90,74 @@ class EnsemblMetadataServicer(ensembl_metadata_pb2_grpc.EnsemblMetadataServicer)
         return utils.get_top_level_statistics(self.db, request.organism_uuid, request.group)
 
     def GetTopLevelStatisticsByUUID(self, request, context):
-        return utils.get_top_level_statistics_by_uuid(self.db, request.genome_uuid)
+        return self.caches.fetch(
+            "GetTopLevelStatisticsByUUID", request,
+            lambda: utils.get_top_level_statistics_by_uuid(self.db, request.genome_uuid)
+        )
 
     def GetGenomeUUID(self, request, context):
-        return utils.get_genome_uuid(self.db, request.ensembl_name, request.assembly_name, request.use_default)
+        return self.caches.fetch(
+            "GetGenomeUUID", request,
+            lambda: utils.get_genome_uuid(
+                self.db, request.ensembl_name, request.assembly_name, request.use_default
+            )
+        )
+
+    def LookupGenomeUUIDs(self, request_iterator, context):
+        return utils.genome_uuid_lookup_iterator(self.db, request_iterator)
 
     def GetGenomeByUUID(self, request, context):
-        return utils.get_genome_by_uuid(self.db, request.genome_uuid, request.release_version)
+        read_mask = self._read_mask(request, context)
+        return self.caches.fetch(
+            "GetGenomeByUUID", request,
+            lambda: utils.get_genome_by_uuid(self.db, request.genome_uuid, request.release_version, read_mask)
+        )
+
+    def GetGenomesByUUIDs(self, request, context):
+        read_mask = self._read_mask(request, context)
+        return utils.get_genomes_by_uuids_iterator(
+            self.db, list(request.genome_uuid), request.release_version, read_mask
+        )
 
     def GetGenomesByKeyword(self, request, context):
-        return utils.get_genomes_by_keyword_iterator(
-            self.db, request.keyword, request.release_version
+        if is_paged(request):
+            # Pages are not cached
+            return self._page(
+                request, context, str,
+                lambda size, after: utils.get_genomes_by_keyword_page(
+                    self.db, request.keyword, request.release_version, request.fuzzy, size, after
+                )
+            )
+        return self.caches.fetch(
+            "GetGenomesByKeyword", request,
+            lambda: utils.get_genomes_by_keyword_iterator(
+                self.db, request.keyword, request.release_version, request.fuzzy
+            )
+        )
+
+    def SuggestGenomes(self, request, context):
+        # Not cached, the prefix index answers faster than a cache lookup would and keys would rarely repeat
+        return utils.get_genome_suggestions_iterator(
+            self.db, request.prefix, request.limit, request.release_version
         )
 
     def GetGenomeByName(self, request, context):
-        return utils.get_genome_by_name(
-            self.db, request.ensembl_name, request.site_name, request.release_version
+        read_mask = self._read_mask(request, context)
+        return self.caches.fetch(
+            "GetGenomeByName", request,
+            lambda: utils.get_genome_by_name(
+                self.db, request.ensembl_name, request.site_name, request.release_version, read_mask
+            )
         )
 
     def GetRelease(self, request, context):
+        if is_paged(request):
+            return self._page(
+                request, context, int,
+                lambda size, after: utils.release_page(
+                    self.db, request.site_name, request.release_version, request.current_only, size, after
+                )
+            )
         return utils.release_iterator(
             self.db, request.site_name, request.release_version, request.current_only
         )
@@ -63,11 +166,25 @@ class EnsemblMetadataServicer(ensembl_metadata_pb2_grpc.EnsemblMetadataServicer)
         return utils.release_by_uuid_iterator(self.db, request.genome_uuid)
 
     def GetGenomeSequence(self, request, context):
+        if is_paged(request):
+            return self._page(
+                request, context, int,
+                lambda size, after: utils.genome_sequence_page(
+                    self.db, request.genome_uuid, request.chromosomal_only, size, after
+                )
+            )
         return utils.genome_sequence_iterator(
             self.db, request.genome_uuid, request.chromosomal_only
         )
 
     def GetAssemblyRegion(self, request, context):
+        if is_paged(request):
+            return self._page(
+                request, context, int,
+                lambda size, after: utils.assembly_region_page(
+                    self.db, request.genome_uuid, request.chromosomal_only, size, after
+                )
+            )
         return utils.assembly_region_iterator(
             self.db, request.genome_uuid, request.chromosomal_only
         )
@@ -78,19 +195,31 @@ class EnsemblMetadataServicer(ensembl_metadata_pb2_grpc.EnsemblMetadataServicer)
         )
 
     def GetDatasetsListByUUID(self, request, context):
-        return utils.get_datasets_list_by_uuid(
-            self.db, request.genome_uuid, request.release_version
+        return self.caches.fetch(
+            "GetDatasetsListByUUID", request,
+            lambda: utils.get_datasets_list_by_uuid(
+                self.db, request.genome_uuid, request.release_version
+            )
         )
 
     def GetDatasetInformation(self, request, context):
-        return utils.get_dataset_by_genome_and_dataset_type(
-            self.db, request.genome_uuid, request.dataset_type
+        return self.caches.fetch(
+            "GetDatasetInformation", request,
+            lambda: utils.get_dataset_by_genome_and_dataset_type(
+                self.db, request.genome_uuid, request.dataset_type
+            )
         )
 
     def GetOrganismsGroupCount(self, request, context):
-        return utils.get_organisms_group_count(
-            self.db, request.release_version
+        return self.caches.fetch(
+            "GetOrganismsGroupCount", request,
+            lambda: utils.get_organisms_group_count(
+                self.db, request.release_version
+            )
         )
 
     def GetGenomeUUIDByTag(self, request, context):
-        return utils.get_genome_uuid_by_tag(self.db, request.genome_tag)
+        return self.caches.fetch(
+            "GetGenomeUUIDByTag", request,
+            lambda: utils.get_genome_uuid_by_tag(self.db, request.genome_tag)
+        )
@@ -9,9 +9,9 @@
 #  WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
 #  See the License for the specific language governing permissions and
 #  limitations under the License.
-import itertools
 from ensembl.production.metadata.grpc import ensembl_metadata_pb2
 from ensembl.production.metadata.grpc.config import MetadataConfig as cfg
+from ensembl.production.metadata.grpc.pagination import page_of
 from ensembl.production.metadata.grpc.adaptors.genome import GenomeAdaptor
 from ensembl.production.metadata.grpc.adaptors.release import ReleaseAdaptor
 import ensembl.production.metadata.grpc.protobuf_msg_factory as msg_factory
@@ -20,7 +20,9 @@ import ensembl.production.metadata.grpc.protobuf_msg_factory as msg_factory
 def connect_to_db():
     conn = GenomeAdaptor(
         metadata_uri=cfg.metadata_uri,
-        taxonomy_uri=cfg.taxon_uri
+        taxonomy_uri=cfg.taxon_uri,
+        metadata_replica_uris=cfg.metadata_replica_uris,
+        taxonomy_replica_uris=cfg.taxon_replica_uris
     )
     return conn
 
@@ -28,8 +30,13 @@ def connect_to_db():
 def get_alternative_names(db_conn, taxon_id):
     """ Get alternative names for a given taxon ID """
     taxon_ifo = db_conn.fetch_taxonomy_names(taxon_id)
-    alternative_names = taxon_ifo[taxon_id].get('synonym')
-    genbank_common_name = taxon_ifo[taxon_id].get('genbank_common_name')
+    return alternative_names_of(taxon_ifo[taxon_id])
+
+
+def alternative_names_of(taxon_names):
+    """ Alternative names of a taxon, from its names as returned by fetch_taxonomy_names """
+    alternative_names = list(taxon_names.get('synonym'))
+    genbank_common_name = taxon_names.get('genbank_common_name')
 
     if genbank_common_name is not None:
         alternative_names.append(genbank_common_name)
@@ -47,7 +54,8 @@ def get_top_level_statistics(db_conn, organism_uuid, group):
     stats_results = db_conn.fetch_genome_datasets(
         organism_uuid=organism_uuid,
         dataset_name="all",
-        dataset_attributes=True
+        dataset_attributes=True,
+        lean=True
     )
 
     if len(stats_results) > 0:
@@ -67,7 +75,8 @@ def get_top_level_statistics_by_uuid(db_conn, genome_uuid):
     stats_results = db_conn.fetch_genome_datasets(
         genome_uuid=genome_uuid,
         dataset_name="all",
-        dataset_attributes=True
+        dataset_attributes=True,
+        lean=True
     )
 
     statistics = []
@@ -91,7 +100,8 @@ def get_assembly_information(db_conn, assembly_uuid):
         return msg_factory.create_assembly_info()
 
     assembly_results = db_conn.fetch_sequences(
-        assembly_uuid=assembly_uuid
+        assembly_uuid=assembly_uuid,
+        lean=True
     )
     if len(assembly_results) > 0:
         return msg_factory.create_assembly_info(assembly_results[0])
@@ -99,26 +109,36 @@ def get_assembly_information(db_conn, assembly_uuid):
     return msg_factory.create_assembly_info()
 
 
-def create_genome_with_attributes_and_count(db_conn, genome, release_version):
-    # we fetch attributes related to that genome
-    attrib_data_results = db_conn.fetch_genome_datasets(
-        genome_uuid=genome.Genome.genome_uuid,
-        release_version=release_version,
-        dataset_name="all",
-        dataset_attributes=True
-    )
-    # fetch related assemblies count
-    related_assemblies_count = db_conn.fetch_related_assemblies_count(
-        organism_uuid=genome.Organism.organism_uuid
-    )
+def create_genome_with_attributes_and_count(db_conn, genome, release_version, read_mask=None):
+    # Only what the read mask selects is fetched (everything if it is empty)
+    attrib_data_results = None
+    if msg_factory.in_read_mask(read_mask, "attributes_info"):
+        # we fetch attributes related to that genome
+        attrib_data_results = db_conn.fetch_genome_datasets(
+            genome_uuid=genome.Genome.genome_uuid,
+            release_version=release_version,
+            dataset_name="all",
+            dataset_attributes=True,
+            lean=True
+        )
+    related_assemblies_count = 0
+    if msg_factory.in_read_mask(read_mask, "related_assemblies_count"):
+        # fetch related assemblies count
+        related_assemblies_count = db_conn.fetch_related_assemblies_count(
+            organism_uuid=genome.Organism.organism_uuid,
+            release_version=release_version
+        )
 
-    alternative_names = get_alternative_names(db_conn, genome.Organism.taxonomy_id)
+    alternative_names = []
+    if msg_factory.in_read_mask(read_mask, "taxon.alternative_names"):
+        alternative_names = get_alternative_names(db_conn, genome.Organism.taxonomy_id)
 
     return msg_factory.create_genome(
         data=genome,
         attributes=attrib_data_results,
         count=related_assemblies_count,
-        alternative_names=alternative_names
+        alternative_names=alternative_names,
+        read_mask=read_mask
     )
 
 
@@ -128,7 +148,11 @@ def get_genomes_from_assembly_accession_iterator(db_conn, assembly_accession, re
 
     genome_results = db_conn.fetch_genomes(
         assembly_accession=assembly_accession,
-        allow_unreleased=cfg.allow_unreleased
+        allow_unreleased=cfg.allow_unreleased,
+        lean=True,
+        # the genomes are streamed as they are fetched, in no particular order
+        order_by=None,
+        stream=True
     )
     for genome in genome_results:
         yield msg_factory.create_genome(data=genome)
@@ -141,7 +165,8 @@ def get_species_information(db_conn, genome_uuid):
 
     species_results = db_conn.fetch_genomes(
         genome_uuid=genome_uuid,
-        allow_unreleased=cfg.allow_unreleased
+        allow_unreleased=cfg.allow_unreleased,
+        lean=True
     )
     if len(species_results) == 1:
         tax_id = species_results[0].Organism.taxonomy_id
@@ -158,7 +183,8 @@ def get_sub_species_info(db_conn, organism_uuid, group):
     sub_species_results = db_conn.fetch_genomes(
         organism_uuid=organism_uuid,
         group=group,
-        allow_unreleased=cfg.allow_unreleased
+        allow_unreleased=cfg.allow_unreleased,
+        lean=True
     )
 
     species_name = []
@@ -183,34 +209,31 @@ def get_genome_uuid(db_conn, ensembl_name, assembly_name, use_default=False):
     if ensembl_name is None or assembly_name is None:
         return msg_factory.create_genome_uuid()
 
-    genome_uuid_result = db_conn.fetch_genomes(
+    genome_uuid = db_conn.fetch_genome_uuid(
         ensembl_name=ensembl_name,
         assembly_name=assembly_name,
         use_default_assembly=use_default,
         allow_unreleased=cfg.allow_unreleased
     )
+    if genome_uuid is not None:
+        return msg_factory.create_genome_uuid({"genome_uuid": genome_uuid})
+    return msg_factory.create_genome_uuid()
 
-    if len(genome_uuid_result) == 1:
-        return msg_factory.create_genome_uuid(
-            {"genome_uuid": genome_uuid_result[0].Genome.genome_uuid}
-        )
-    # PATCH: This is a special case, see EA-1112 for more details
-    elif len(genome_uuid_result) == 0:
-        # Try looking using only assembly_default (no ensembl_name is needed)
-        using_default_assembly_only_result = db_conn.fetch_genomes(
-            assembly_name=assembly_name,
-            use_default_assembly=True,
+
+def genome_uuid_lookup_iterator(db_conn, lookups):
+    # Each lookup is answered as soon as it arrives, from the in-memory alias index
+    for lookup in lookups:
+        genome_uuid = db_conn.fetch_genome_uuid(
+            lookup.ensembl_name, lookup.assembly_name, lookup.use_default,
             allow_unreleased=cfg.allow_unreleased
         )
-        if len(using_default_assembly_only_result) == 1:
-            return msg_factory.create_genome_uuid(
-                {"genome_uuid": using_default_assembly_only_result[0].Genome.genome_uuid}
-            )
-
-    return msg_factory.create_genome_uuid()
+        yield msg_factory.create_genome_uuid_lookup_result({
+            "correlation_id": lookup.correlation_id,
+            "genome_uuid": genome_uuid
+        })
 
 
-def get_genome_by_uuid(db_conn, genome_uuid, release_version):
+def get_genome_by_uuid(db_conn, genome_uuid, release_version, read_mask=None):
     if genome_uuid is None:
         return msg_factory.create_genome()
 
@@ -218,45 +241,117 @@ def get_genome_by_uuid(db_conn, genome_uuid, release_version):
     genome_results = db_conn.fetch_genomes(
         genome_uuid=genome_uuid,
         release_version=release_version,
-        allow_unreleased=cfg.allow_unreleased
+        allow_unreleased=cfg.allow_unreleased,
+        lean=True
     )
 
     if len(genome_results) == 1:
         return create_genome_with_attributes_and_count(
-            db_conn=db_conn, genome=genome_results[0], release_version=release_version
+            db_conn=db_conn, genome=genome_results[0], release_version=release_version, read_mask=read_mask
         )
 
     return msg_factory.create_genome()
 
 
-def get_genomes_by_keyword_iterator(db_conn, keyword, release_version):
+def get_genomes_by_uuids_iterator(db_conn, genome_uuids, release_version, read_mask=None):
+    if not genome_uuids:
+        return
+
+    # The genomes, their attributes and taxonomy names are fetched for the whole batch,
+    # each genome is then built as get_genome_by_uuid would build it
+    genome_results = db_conn.fetch_genomes_by_uuids(
+        genome_uuids=genome_uuids,
+        release_version=release_version,
+        allow_unreleased=cfg.allow_unreleased
+    )
+    genomes = {
+        genome_uuid: results[0] for genome_uuid, results in genome_results.items() if len(results) == 1
+    }
+    attrib_data_results = {}
+    if msg_factory.in_read_mask(read_mask, "attributes_info"):
+        attrib_data_results = db_conn.fetch_datasets_by_genome(
+            genome_ids=[genome.Genome.genome_id for genome in genomes.values()],
+            dataset_name="all",
+            dataset_attributes=True,
+            release_version=release_version,
+            lean=True
+        )
+    with_counts = msg_factory.in_read_mask(read_mask, "related_assemblies_count")
+    taxonomy_names = {}
+    if msg_factory.in_read_mask(read_mask, "taxon.alternative_names"):
+        taxonomy_names = db_conn.fetch_taxonomy_names(
+            list({genome.Organism.taxonomy_id for genome in genomes.values()})
+        )
+
+    for genome_uuid in genome_uuids:
+        genome = genomes.get(genome_uuid)
+        if genome is None:
+            yield msg_factory.create_genome()
+            continue
+        taxon_names = taxonomy_names.get(genome.Organism.taxonomy_id)
+        yield msg_factory.create_genome(
+            data=genome,
+            attributes=attrib_data_results.get(genome.Genome.genome_id, []),
+            count=db_conn.fetch_related_assemblies_count(
+                organism_uuid=genome.Organism.organism_uuid,
+                release_version=release_version
+            ) if with_counts else 0,
+            alternative_names=alternative_names_of(taxon_names) if taxon_names is not None else [],
+            read_mask=read_mask
+        )
+
+
+def get_genomes_by_keyword_iterator(db_conn, keyword, release_version, fuzzy=False):
     if not keyword:
-        return msg_factory.create_genome()
+        return
 
-    genome_results = db_conn.fetch_genome_by_keyword(
-        keyword=keyword,
-        release_version=release_version
+    # Only the most recent genome of each assembly accession is returned
+    for genome_row in db_conn.fetch_latest_genomes_by_keyword(
+            keyword=keyword,
+            release_version=release_version,
+            fuzzy=fuzzy
+    ):
+        yield msg_factory.create_genome(data=genome_row)
+
+
+def get_genomes_by_keyword_page(db_conn, keyword, release_version, fuzzy, page_size, after_accession):
+    """
+    A page of the genomes of get_genomes_by_keyword_iterator, by assembly accession.
+
+    Returns:
+        tuple: The genomes of the page, and the assembly accession of its last genome (None on the last page).
+    """
+    if not keyword:
+        return [], None
+
+    genome_rows, next_accession = page_of(
+        db_conn.fetch_latest_genomes_by_keyword(
+            keyword=keyword,
+            release_version=release_version,
+            fuzzy=fuzzy,
+            paged=True,
+            after_accession=after_accession
+        ),
+        page_size,
+        lambda genome_row: genome_row.Assembly.accession
     )
+    return [msg_factory.create_genome(data=genome_row) for genome_row in genome_rows], next_accession
 
-    if len(genome_results) > 0:
-        # Create an empty list to store the most recent genomes
-        most_recent_genomes = []
-        # Group `genome_results` based on the `assembly_accession` field
-        for _, genome_release_group in itertools.groupby(genome_results, lambda r: r.Assembly.accession):
-            # Sort the genomes in each group based on the `release_version` field in descending order
-            sorted_genomes = sorted(genome_release_group, key=lambda g: g.EnsemblRelease.version, reverse=True)
-            # Select the most recent genome from the sorted group (first element)
-            most_recent_genome = sorted_genomes[0]
-            # Add the most recent genome to the `most_recent_genomes` list
-            most_recent_genomes.append(most_recent_genome)
-
-        for genome_row in most_recent_genomes:
-            yield msg_factory.create_genome(data=genome_row)
 
-        return msg_factory.create_genome()
+def get_genome_suggestions_iterator(db_conn, prefix, limit, release_version):
+    if not prefix:
+        return
+
+    genome_results = db_conn.fetch_genome_suggestions(
+        prefix=prefix,
+        limit=min(limit or cfg.suggest_default_limit, cfg.suggest_max_limit),
+        release_version=release_version
+    )
+    for genome_row in genome_results:
+        yield msg_factory.create_genome(data=genome_row)
 
 
-def get_genome_by_name(db_conn, ensembl_name, site_name, release_version):
+def get_genome_by_name(db_conn, ensembl_name, site_name, release_version, read_mask=None):
     if ensembl_name is None and site_name is None:
         return msg_factory.create_genome()
 
@@ -264,11 +359,12 @@ def get_genome_by_name(db_conn, ensembl_name, site_name, release_version):
         ensembl_name=ensembl_name,
         site_name=site_name,
         release_version=release_version,
-        allow_unreleased=cfg.allow_unreleased
+        allow_unreleased=cfg.allow_unreleased,
+        lean=True
     )
     if len(genome_results) == 1:
         return create_genome_with_attributes_and_count(
-            db_conn=db_conn, genome=genome_results[0], release_version=release_version
+            db_conn=db_conn, genome=genome_results[0], release_version=release_version, read_mask=read_mask
         )
 
     return msg_factory.create_genome()
@@ -284,7 +380,8 @@ def get_datasets_list_by_uuid(db_conn, genome_uuid, release_version):
         dataset_name="all",
         release_version=release_version,
         allow_unreleased=cfg.allow_unreleased,
-        dataset_attributes=True
+        dataset_attributes=True,
+        lean=True
     )
 
     if len(datasets_results) > 0:
@@ -323,11 +420,26 @@ def genome_sequence_iterator(db_conn, genome_uuid, chromosomal_only):
     assembly_sequence_results = db_conn.fetch_sequences(
         genome_uuid=genome_uuid,
         chromosomal_only=chromosomal_only,
+        lean=True
     )
     for result in assembly_sequence_results:
         yield msg_factory.create_genome_sequence(result)
 
 
+def genome_sequence_page(db_conn, genome_uuid, chromosomal_only, page_size, after_sequence_id):
+    """
+    A page of the sequences of genome_sequence_iterator, by assembly_sequence_id.
+
+    Returns:
+        tuple: The sequences of the page, and the assembly_sequence_id of its last sequence (None on the last
+            page).
+    """
+    sequence_rows, next_sequence_id = _sequence_page(
+        db_conn, genome_uuid, chromosomal_only, page_size, after_sequence_id
+    )
+    return [msg_factory.create_genome_sequence(result) for result in sequence_rows], next_sequence_id
+
+
 def assembly_region_iterator(db_conn, genome_uuid, chromosomal_only):
     if genome_uuid is None:
         return
@@ -335,18 +447,51 @@ def assembly_region_iterator(db_conn, genome_uuid, chromosomal_only):
     assembly_sequence_results = db_conn.fetch_sequences(
         genome_uuid=genome_uuid,
         chromosomal_only=chromosomal_only,
+        lean=True
     )
     for result in assembly_sequence_results:
         yield msg_factory.create_assembly_region(result)
 
 
+def assembly_region_page(db_conn, genome_uuid, chromosomal_only, page_size, after_sequence_id):
+    """
+    A page of the regions of assembly_region_iterator, by assembly_sequence_id.
+
+    Returns:
+        tuple: The regions of the page, and the assembly_sequence_id of its last region (None on the last
+            page).
+    """
+    sequence_rows, next_sequence_id = _sequence_page(
+        db_conn, genome_uuid, chromosomal_only, page_size, after_sequence_id
+    )
+    return [msg_factory.create_assembly_region(result) for result in sequence_rows], next_sequence_id
+
+
+def _sequence_page(db_conn, genome_uuid, chromosomal_only, page_size, after_sequence_id):
+    if genome_uuid is None:
+        return [], None
+
+    # One more sequence than the page size tells whether another page follows
+    assembly_sequence_results = db_conn.fetch_sequences(
+        genome_uuid=genome_uuid,
+        chromosomal_only=chromosomal_only,
+        lean=True,
+        after_sequence_id=after_sequence_id,
+        limit=page_size + 1
+    )
+    return page_of(
+        assembly_sequence_results, page_size, lambda result: result.AssemblySequence.assembly_sequence_id
+    )
+
+
 def genome_assembly_sequence_region(db_conn, genome_uuid, sequence_region_name):
     if genome_uuid is None or sequence_region_name is None:
         return msg_factory.create_genome_assembly_sequence_region()
 
     assembly_sequence_results = db_conn.fetch_sequences(
         genome_uuid=genome_uuid,
-        assembly_sequence_name=sequence_region_name
+        assembly_sequence_name=sequence_region_name,
+        lean=True
     )
     if len(assembly_sequence_results) == 1:
         return msg_factory.create_genome_assembly_sequence_region(assembly_sequence_results[0])
@@ -355,7 +500,7 @@ def genome_assembly_sequence_region(db_conn, genome_uuid, sequence_region_name):
 
 
 def release_iterator(metadata_db, site_name, release_version, current_only):
-    conn = ReleaseAdaptor(metadata_uri=cfg.metadata_uri)
+    conn = ReleaseAdaptor(metadata_uri=cfg.metadata_uri, metadata_replica_uris=cfg.metadata_replica_uris)
 
     # set release_version/site_name to None if it's an empty list
     release_version = release_version or None
@@ -371,11 +516,33 @@ def release_iterator(metadata_db, site_name, release_version, current_only):
         yield msg_factory.create_release(result)
 
 
+def release_page(metadata_db, site_name, release_version, current_only, page_size, after_release_id):
+    """
+    A page of the releases of release_iterator, by release ID.
+
+    Returns:
+        tuple: The releases of the page, and the release ID of its last release (None on the last page).
+    """
+    conn = ReleaseAdaptor(metadata_uri=cfg.metadata_uri, metadata_replica_uris=cfg.metadata_replica_uris)
+
+    release_results = conn.fetch_releases(
+        release_version=release_version or None,
+        current_only=current_only,
+        site_name=site_name or None,
+        after_release_id=after_release_id,
+        limit=page_size + 1
+    )
+    release_rows, next_release_id = page_of(
+        release_results, page_size, lambda result: result.EnsemblRelease.release_id
+    )
+    return [msg_factory.create_release(result) for result in release_rows], next_release_id
+
+
 def release_by_uuid_iterator(metadata_db, genome_uuid):
     if genome_uuid is None:
         return
 
-    conn = ReleaseAdaptor(metadata_uri=cfg.metadata_uri)
+    conn = ReleaseAdaptor(metadata_uri=cfg.metadata_uri, metadata_replica_uris=cfg.metadata_replica_uris)
     release_results = conn.fetch_releases_for_genome(
         genome_uuid=genome_uuid,
     )
@@ -391,7 +558,8 @@ def get_dataset_by_genome_and_dataset_type(db_conn, genome_uuid, requested_datas
     dataset_results = db_conn.fetch_genome_datasets(
         genome_uuid=genome_uuid,
         dataset_type=requested_dataset_type,
-        dataset_attributes=True
+        dataset_attributes=True,
+        lean=True
     )
     return msg_factory.create_dataset_infos(genome_uuid, requested_dataset_type, dataset_results)
 
@@ -405,13 +573,10 @@ def get_genome_uuid_by_tag(db_conn, genome_tag):
     if genome_tag is None:
         return msg_factory.create_genome_uuid()
 
-    genome_uuid_result = db_conn.fetch_genomes(
+    genome_uuid = db_conn.fetch_genome_uuid_by_tag(
         genome_tag=genome_tag,
         allow_unreleased=cfg.allow_unreleased
     )
-
-    if len(genome_uuid_result) == 1:
-        return msg_factory.create_genome_uuid(
-            {"genome_uuid": genome_uuid_result[0].Genome.genome_uuid}
-        )
+    if genome_uuid is not None:
+        return msg_factory.create_genome_uuid({"genome_uuid": genome_uuid})
     return msg_factory.create_genome_uuid()
@@ -18,8 +18,10 @@ import pkg_resources
 from pathlib import Path
 
 from ensembl.database import UnitTestDB
-from ensembl.production.metadata.grpc.adaptors.genome import GenomeAdaptor
+from ensembl.production.metadata.grpc.adaptors.genome import GenomeAdaptor, genomes_statement
 from ensembl.production.metadata.grpc.adaptors.release import ReleaseAdaptor
+from ensembl.production.metadata.grpc.adaptors.replicas import unit_of_work
+from ensembl.production.metadata.grpc.config import MetadataConfig
 
 distribution = pkg_resources.get_distribution("ensembl-metadata-api")
 sample_path = Path(distribution.location) / "ensembl" / "production" / "metadata" / "api" / "sample"
@@ -103,6 +105,22 @@ class TestMetadataDB:
 		# test the direct access.
 		assert test[0].EnsemblRelease.label == 'Scaling Phase 1'
 
+	def test_fetch_releases_by_site_name(self, multi_dbs):
+		conn = ReleaseAdaptor(multi_dbs['ensembl_metadata'].dbc.url)
+		# site names are matched case-insensitively, as by the DB collation
+		test = conn.fetch_releases(site_name='ENSEMBL', current_only=False)
+		assert len(test) > 0
+		assert all(result.EnsemblSite.name == 'Ensembl' for result in test)
+		assert all(result.EnsemblRelease.site_id == result.EnsemblSite.site_id for result in test)
+
+	def test_unknown_names_do_not_reload(self, multi_dbs):
+		conn = ReleaseAdaptor(multi_dbs['ensembl_metadata'].dbc.url)
+		# Past the reload throttle, unknown names given by clients must still not reload the dimension tables
+		conn.dimensions.loaded_at = 0
+		assert conn.fetch_releases(site_name='rhubarb') == []
+		assert conn.dimensions.dataset_type_ids(['rhubarb']) == []
+		assert conn.dimensions.loaded_at == 0
+
 	# currently only have one release, so the testing is not comprehensive
 	def test_fetch_releases_for_genome(self, multi_dbs):
 		conn = ReleaseAdaptor(multi_dbs['ensembl_metadata'].dbc.url)
@@ -132,6 +150,25 @@ class TestMetadataDB:
 		test = conn.fetch_genomes(genome_uuid='a7335667-93e7-11ec-a39d-005056b38ce3')
 		assert test[0].Organism.scientific_name == 'Homo sapiens'
 
+	def test_fetch_genomes_as_of_release(self, multi_dbs):
+		conn = GenomeAdaptor(metadata_uri=multi_dbs['ensembl_metadata'].dbc.url,
+		                     taxonomy_uri=multi_dbs['ncbi_taxonomy'].dbc.url)
+		test = conn.fetch_genomes(release_version=108.0)
+		assert len(test) > 0
+		genome_uuids = [genome.Genome.genome_uuid for genome in test]
+		assert len(genome_uuids) == len(set(genome_uuids))
+		assert all(genome.EnsemblRelease.version <= 108.0 for genome in test)
+		interval = conn.intervals.genome(test[0].Genome.genome_id)
+		assert interval.first <= test[0].EnsemblRelease.version <= interval.last
+
+	def test_fetch_genomes_by_group(self, multi_dbs):
+		conn = GenomeAdaptor(metadata_uri=multi_dbs['ensembl_metadata'].dbc.url,
+		                     taxonomy_uri=multi_dbs['ncbi_taxonomy'].dbc.url)
+		test = conn.fetch_genomes(group='EnsemblVertebrates')
+		# OrganismGroup and EnsemblSite are attached from the in-memory dimension tables
+		assert all(result.OrganismGroup.name == 'EnsemblVertebrates' for result in test)
+		assert all(result.EnsemblSite.site_id == result.EnsemblRelease.site_id for result in test)
+
 	# def test_fetch_genomes_by_group_division(self, multi_dbs):
 	#     conn = GenomeAdaptor(metadata_uri=multi_dbs['ensembl_metadata'].dbc.url,
 	#                          taxonomy_uri=multi_dbs['ncbi_taxonomy'].dbc.url)
@@ -200,6 +237,42 @@ class TestMetadataDB:
 		)
 		assert test[0].Organism.scientific_name == 'Caenorhabditis elegans'
 
+	def test_fetch_genomes_statement_reuse(self, multi_dbs):
+		conn = GenomeAdaptor(metadata_uri=multi_dbs['ensembl_metadata'].dbc.url,
+		                     taxonomy_uri=multi_dbs['ncbi_taxonomy'].dbc.url)
+		first = conn.fetch_genomes(genome_uuid='a7335667-93e7-11ec-a39d-005056b38ce3')
+		misses = genomes_statement.cache_info().misses
+		# Same filters with other values: the statements are reused
+		second = conn.fetch_genomes(genome_uuid='a73351f7-93e7-11ec-a39d-005056b38ce3')
+		assert genomes_statement.cache_info().misses == misses
+		assert first[0].Genome.genome_uuid == 'a7335667-93e7-11ec-a39d-005056b38ce3'
+		assert all(row.Genome.genome_uuid == 'a73351f7-93e7-11ec-a39d-005056b38ce3' for row in second)
+
+	def test_fetch_genomes_from_replicas(self, multi_dbs):
+		metadata_uri = multi_dbs['ensembl_metadata'].dbc.url
+		conn = GenomeAdaptor(metadata_uri=metadata_uri,
+		                     taxonomy_uri=multi_dbs['ncbi_taxonomy'].dbc.url,
+		                     metadata_replica_uris=[metadata_uri, 'mysql+pymysql://nobody@127.0.0.1:1/unreachable'])
+		for _ in range(4):
+			test = conn.fetch_genomes(genome_uuid='a7335667-93e7-11ec-a39d-005056b38ce3')
+			assert test[0].Genome.genome_uuid == 'a7335667-93e7-11ec-a39d-005056b38ce3'
+		# The unreachable replica has been ejected
+		assert conn.metadata_db.healthy_replicas() == [0]
+
+	def test_unit_of_work(self, multi_dbs):
+		conn = GenomeAdaptor(metadata_uri=multi_dbs['ensembl_metadata'].dbc.url,
+		                     taxonomy_uri=multi_dbs['ncbi_taxonomy'].dbc.url)
+		with unit_of_work():
+			with conn.metadata_db.session_scope() as first, conn.metadata_db.session_scope() as second:
+				assert first is second
+			with conn.taxonomy_db.session_scope() as taxonomy:
+				assert taxonomy is not first
+			genomes = conn.fetch_genomes(genome_uuid='a7335667-93e7-11ec-a39d-005056b38ce3')
+			datasets = conn.fetch_genome_datasets(genome_uuid='a7335667-93e7-11ec-a39d-005056b38ce3')
+		# The rows are still loaded once the unit of work is over
+		assert genomes[0].Assembly.name == 'GRCh38.p13'
+		assert datasets[0].Genome.genome_uuid == 'a7335667-93e7-11ec-a39d-005056b38ce3'
+
 	def test_fetch_sequences(self, multi_dbs):
 		conn = GenomeAdaptor(metadata_uri=multi_dbs['ensembl_metadata'].dbc.url,
 		                     taxonomy_uri=multi_dbs['ncbi_taxonomy'].dbc.url)
@@ -210,6 +283,44 @@ class TestMetadataDB:
 		# to please bothI'm using 'sequence_location' for now
 		assert test[0].AssemblySequence.sequence_location == 'SO:0000738'
 
+	def test_fetch_sequences_lean(self, multi_dbs):
+		conn = GenomeAdaptor(metadata_uri=multi_dbs['ensembl_metadata'].dbc.url,
+		                     taxonomy_uri=multi_dbs['ncbi_taxonomy'].dbc.url)
+		assembly_uuid = 'eeaaa2bf-151c-4848-8b85-a05a9993101e'
+		test = conn.fetch_sequences(assembly_uuid=assembly_uuid, lean=True)
+		expected = conn.fetch_sequences(assembly_uuid=assembly_uuid)
+		assert len(test) == len(expected)
+		for lean_row, row in zip(test, expected):
+			# Named tuples of the projected columns, with the same values as the ORM instances
+			for entity in ('Genome', 'Assembly', 'AssemblySequence'):
+				lean_entity = getattr(lean_row, entity)
+				assert lean_entity == tuple(getattr(getattr(row, entity), field) for field in lean_entity._fields)
+
+	def test_fetch_genomes_lean(self, multi_dbs):
+		conn = GenomeAdaptor(metadata_uri=multi_dbs['ensembl_metadata'].dbc.url,
+		                     taxonomy_uri=multi_dbs['ncbi_taxonomy'].dbc.url)
+		test = conn.fetch_genomes(ensembl_name='homo_sapiens', lean=True)
+		expected = conn.fetch_genomes(ensembl_name='homo_sapiens')
+		assert [row.Genome.genome_uuid for row in test] == [row.Genome.genome_uuid for row in expected]
+		assert [row.EnsemblRelease.version for row in test] == [row.EnsemblRelease.version for row in expected]
+		assert test[0].Organism.organism_uuid == expected[0].Organism.organism_uuid
+
+	def test_fetch_genome_datasets_lean(self, multi_dbs):
+		conn = GenomeAdaptor(metadata_uri=multi_dbs['ensembl_metadata'].dbc.url,
+		                     taxonomy_uri=multi_dbs['ncbi_taxonomy'].dbc.url)
+		genome_uuid = 'a7335667-93e7-11ec-a39d-005056b38ce3'
+		test = conn.fetch_genome_datasets(genome_uuid=genome_uuid, dataset_name="all", dataset_attributes=True,
+		                                  lean=True)
+		expected = conn.fetch_genome_datasets(genome_uuid=genome_uuid, dataset_name="all", dataset_attributes=True)
+		assert len(test) == len(expected)
+		for lean_row, row in zip(test, expected):
+			# Detached records of all the columns, with the same values as the ORM instances
+			for entity in ('Genome', 'GenomeDataset', 'Dataset', 'DatasetAttribute'):
+				record = getattr(lean_row, entity)
+				assert record == tuple(getattr(getattr(row, entity), field) for field in record._fields)
+			assert lean_row.DatasetType.name == row.DatasetType.name
+			assert lean_row.Attribute.name == row.Attribute.name
+
 	@pytest.mark.parametrize(
 		"genome_uuid, assembly_accession, chromosomal_only, expected_output",
 		[
@@ -384,6 +495,71 @@ class TestMetadataDB:
 			# All others have only one genome in test DB
 			assert data[5] == 1
 
+	def test_fetch_organisms_group_counts_by_release(self, multi_dbs):
+		conn = GenomeAdaptor(metadata_uri=multi_dbs['ensembl_metadata'].dbc.url,
+		                     taxonomy_uri=multi_dbs['ncbi_taxonomy'].dbc.url)
+		test = conn.fetch_organisms_group_counts(release_version=108)
+		# Only the two human assemblies released in 108 are counted
+		assert test[0].ensembl_name == 'Homo_sapiens'
+		assert test[0].count == 2
+		# Mouse was first released after 108
+		assert 'Mus_musculus' not in [data.ensembl_name for data in test]
+		assert [data.order for data in test] == sorted(data.order for data in test)
+		# Versions between releases share the aggregate of the latest release up to them
+		for release_version in (108.01, 108.02, 108.5):
+			assert conn.fetch_organisms_group_counts(release_version=release_version) == test
+		content = conn.group_counts.content
+		assert len([key for key in content.aggregates if key[1] is not None]) <= len(content.release_versions)
+		assert conn.fetch_organisms_group_counts(release_version=1) == []
+
+	def test_fetch_group_genome_uuids(self, multi_dbs):
+		conn = GenomeAdaptor(metadata_uri=multi_dbs['ensembl_metadata'].dbc.url,
+		                     taxonomy_uri=multi_dbs['ncbi_taxonomy'].dbc.url)
+		test = conn.fetch_group_genome_uuids()
+		# Human GRCh38 is in the popular group
+		assert 'a7335667-93e7-11ec-a39d-005056b38ce3' in test
+		assert len(test) == len(set(test))
+
+	def test_fetch_genome_by_keyword_case_insensitive(self, multi_dbs):
+		conn = GenomeAdaptor(metadata_uri=multi_dbs['ensembl_metadata'].dbc.url,
+		                     taxonomy_uri=multi_dbs['ncbi_taxonomy'].dbc.url)
+		test = conn.fetch_genome_by_keyword(keyword='Homo sapiens')
+		assert len(test) > 0
+		upper = conn.fetch_genome_by_keyword(keyword='HOMO SAPIENS')
+		assert [genome.Genome.genome_uuid for genome in upper] == [genome.Genome.genome_uuid for genome in test]
+		assert all(genome.EnsemblRelease.is_current == 1 for genome in test)
+
+	@pytest.mark.parametrize(
+		"ensembl_name, assembly_name, use_default_assembly, expected_output",
+		[
+			("homo_sapiens", "GRCh38.p13", False, "a7335667-93e7-11ec-a39d-005056b38ce3"),
+			("HOMO_SAPIENS", "grch38.P13", False, "a7335667-93e7-11ec-a39d-005056b38ce3"),
+			# Default assembly only, see EA-1112
+			("random", "GRCh38", False, "a7335667-93e7-11ec-a39d-005056b38ce3"),
+			("random", "random", True, None),
+		]
+	)
+	def test_fetch_genome_uuid_from_aliases(self, multi_dbs, ensembl_name, assembly_name, use_default_assembly,
+	                                        expected_output):
+		conn = GenomeAdaptor(metadata_uri=multi_dbs['ensembl_metadata'].dbc.url,
+		                     taxonomy_uri=multi_dbs['ncbi_taxonomy'].dbc.url)
+		test = conn.fetch_genome_uuid(ensembl_name, assembly_name, use_default_assembly)
+		assert test == expected_output
+		assert conn.fetch_genome_uuid_by_tag("GRCh38") == "a7335667-93e7-11ec-a39d-005056b38ce3"
+
+	def test_fetch_latest_genomes_by_keyword(self, multi_dbs):
+		conn = GenomeAdaptor(metadata_uri=multi_dbs['ensembl_metadata'].dbc.url,
+		                     taxonomy_uri=multi_dbs['ncbi_taxonomy'].dbc.url)
+		all_releases = conn.fetch_genome_by_keyword(keyword='Human', release_version=110.1)
+		test = list(conn.fetch_latest_genomes_by_keyword(keyword='Human', release_version=110.1))
+		accessions = [genome.Assembly.accession for genome in test]
+		assert len(accessions) == len(set(accessions))
+		assert set(accessions) == {genome.Assembly.accession for genome in all_releases}
+		for genome in test:
+			assert genome.EnsemblRelease.version == max(
+				row.EnsemblRelease.version for row in all_releases if row.Assembly.accession == genome.Assembly.accession
+			)
+
 	@pytest.mark.parametrize(
 		"organism_uuid, expected_assemblies_count",
 		[
@@ -403,6 +579,18 @@ class TestMetadataDB:
 		# We should have three assemblies associated with Human (Two for grch37.38 organism + one t2t)
 		assert test == expected_assemblies_count
 
+	def test_fetch_related_assemblies_count_by_release(self, multi_dbs):
+		conn = GenomeAdaptor(
+			metadata_uri=multi_dbs['ensembl_metadata'].dbc.url,
+			taxonomy_uri=multi_dbs['ncbi_taxonomy'].dbc.url
+		)
+		organism_uuid = 'db2a5f09-2db8-429b-a407-c15a4ca2876d'
+		released = conn.fetch_related_assemblies_count(organism_uuid=organism_uuid, release_version=108.0)
+		# Only the genomes released up to that version are counted
+		assert 0 < released <= conn.fetch_related_assemblies_count(organism_uuid=organism_uuid)
+		assert conn.fetch_related_assemblies_count(organism_uuid=organism_uuid, release_version=1.0) == 0
+		assert conn.fetch_related_assemblies_count(organism_uuid='some-random-uuid-f00-b4r') == 0
+
 	@pytest.mark.parametrize(
 		"allow_unreleased, output_count, expected_genome_uuid",
 		[
@@ -423,3 +611,50 @@ class TestMetadataDB:
 		output_to_list = list(test)
 		assert len(output_to_list) == output_count
 		assert output_to_list[0][0]['genome'].Genome.genome_uuid == expected_genome_uuid
+
+	def test_fetch_genomes_stream(self, multi_dbs):
+		conn = GenomeAdaptor(metadata_uri=multi_dbs['ensembl_metadata'].dbc.url,
+		                     taxonomy_uri=multi_dbs['ncbi_taxonomy'].dbc.url)
+		expected = conn.fetch_genomes(allow_unreleased=True)
+		test = conn.fetch_genomes(allow_unreleased=True, stream=True)
+		assert not isinstance(test, list)
+		assert [row.Genome.genome_uuid for row in test] == [row.Genome.genome_uuid for row in expected]
+		unordered = conn.fetch_genomes(allow_unreleased=True, order_by=None, stream=True, lean=True)
+		assert sorted(row.Genome.genome_uuid for row in unordered) == \
+		       sorted(row.Genome.genome_uuid for row in expected)
+		by_id = conn.fetch_genomes(allow_unreleased=True, order_by="genome_id")
+		assert [row.Genome.genome_id for row in by_id] == sorted(row.Genome.genome_id for row in expected)
+		with pytest.raises(ValueError):
+			conn.fetch_genomes(order_by="unknown")
+
+	def test_fetch_genomes_in_chunks(self, multi_dbs, monkeypatch):
+		conn = GenomeAdaptor(metadata_uri=multi_dbs['ensembl_metadata'].dbc.url,
+		                     taxonomy_uri=multi_dbs['ncbi_taxonomy'].dbc.url)
+		genome_uuids = [row.Genome.genome_uuid for row in conn.fetch_genomes(allow_unreleased=True)]
+		expected_genomes = conn.fetch_genomes(genome_uuid=genome_uuids, allow_unreleased=True)
+		expected_datasets = conn.fetch_genome_datasets(genome_uuid=genome_uuids, dataset_name="all")
+		monkeypatch.setattr(MetadataConfig, 'in_chunk_size', 2)
+		# Same rows, in the same order, when the UUIDs are sent two at a time
+		test_genomes = conn.fetch_genomes(genome_uuid=genome_uuids, allow_unreleased=True)
+		assert sorted(row.Genome.genome_uuid for row in test_genomes) == \
+		       sorted(row.Genome.genome_uuid for row in expected_genomes)
+		assert [row.Assembly.ensembl_name for row in test_genomes] == \
+		       [row.Assembly.ensembl_name for row in expected_genomes]
+		test_datasets = conn.fetch_genome_datasets(genome_uuid=genome_uuids, dataset_name="all")
+		assert [row.GenomeDataset.genome_dataset_id for row in test_datasets] == \
+		       [row.GenomeDataset.genome_dataset_id for row in expected_datasets]
+
+	def test_fetch_genomes_info_in_chunks(self, multi_dbs, monkeypatch):
+		conn = GenomeAdaptor(metadata_uri=multi_dbs['ensembl_metadata'].dbc.url,
+		                     taxonomy_uri=multi_dbs['ncbi_taxonomy'].dbc.url)
+		monkeypatch.setattr(MetadataConfig, 'dataset_chunk_size', 2)
+		test = list(conn.fetch_genomes_info(group_type=['division', 'internal']))
+		assert len(test) == 6
+		for genome_info in test:
+			genome = genome_info[0]['genome'].Genome
+			# Same datasets as when they are fetched one genome at a time
+			expected = conn.fetch_genome_datasets(genome_uuid=genome.genome_uuid, dataset_attributes=True)
+			assert [(row.GenomeDataset.genome_dataset_id, row.DatasetAttribute.dataset_attribute_id)
+			        for row in genome_info[0]['datasets']] == \
+			       [(row.GenomeDataset.genome_dataset_id, row.DatasetAttribute.dataset_attribute_id)
+			        for row in expected]
@@ -0,0 +1,332 @@
+#  See the NOTICE file distributed with this work for additional information
+#  regarding copyright ownership.
+#  Licensed under the Apache License, Version 2.0 (the "License");
+#  you may not use this file except in compliance with the License.
+#  You may obtain a copy of the License at
+#      http://www.apache.org/licenses/LICENSE-2.0
+#  Unless required by applicable law or agreed to in writing, software
+#  distributed under the License is distributed on an "AS IS" BASIS,
+#  WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+#  See the License for the specific language governing permissions and
+#  limitations under the License.
+"""
+Unit tests for cache.py
+"""
+import json
+
+import pytest
+
+from ensembl.production.metadata.grpc import ensembl_metadata_pb2
+from ensembl.production.metadata.grpc.cache import FrequencySketch, MessageCache, build_caches
+from ensembl.production.metadata.grpc.cache_snapshot import dump_caches, load_caches
+from ensembl.production.metadata.grpc.cache_warmup import AccessLog, prewarm
+from ensembl.production.metadata.grpc.release_watcher import ReleaseWatcher
+
+
+def make_genome(genome_uuid):
+	return ensembl_metadata_pb2.Genome(genome_uuid=genome_uuid)
+
+
+def cache_size(genome):
+	"""Size accounted for a genome cached under its UUID."""
+	return MessageCache.entry_size((genome.genome_uuid,), genome)
+
+
+class TestFrequencySketch:
+
+	def test_frequency(self):
+		sketch = FrequencySketch(width=64)
+		for _ in range(3):
+			sketch.increment("hot")
+		sketch.increment("cold")
+		assert sketch.frequency("hot") >= 3
+		assert sketch.frequency("hot") > sketch.frequency("cold")
+
+	def test_ageing(self):
+		sketch = FrequencySketch(width=64, sample_size=10)
+		for _ in range(9):
+			sketch.increment("hot")
+		assert sketch.frequency("hot") == 9
+		sketch.increment("hot")
+		# the 10th increment halves every counter
+		assert sketch.frequency("hot") == 5
+
+
+class TestMessageCache:
+
+	def test_hit_and_miss(self):
+		cache = MessageCache("GetGenomeByUUID", max_bytes=1024, key_fields=("genome_uuid", "release_version"))
+		request = ensembl_metadata_pb2.GenomeUUIDRequest(genome_uuid="uuid-1")
+		key = cache.key_for(request)
+		assert key == ("uuid-1", 0.0)
+		assert cache.get(key) is None
+		assert cache.put(key, make_genome("uuid-1"))
+		assert cache.get(key) == make_genome("uuid-1")
+		stats = cache.stats()
+		assert stats["hits"] == 1
+		assert stats["misses"] == 1
+		assert stats["hit_ratio"] == 0.5
+		assert stats["size_bytes"] == cache.entry_size(key, make_genome("uuid-1"))
+		assert stats["size_bytes"] > make_genome("uuid-1").ByteSize()
+
+	def test_read_mask_key(self):
+		service = ensembl_metadata_pb2.DESCRIPTOR.services_by_name["EnsemblMetadata"]
+		cache = build_caches(service, {"GetGenomeByUUID": 1.0}, 1024, ensembl_metadata_pb2).get("GetGenomeByUUID")
+		request = ensembl_metadata_pb2.GenomeUUIDRequest(genome_uuid="uuid-1")
+		request.read_mask.paths.extend(["taxon", "assembly.name", "assembly"])
+		key = cache.key_for(request)
+		# Masks selecting the same fields share the key
+		assert key == ("uuid-1", 0.0, ("assembly", "taxon"))
+		assert cache.request_for(key).read_mask.paths == ["assembly", "taxon"]
+		assert cache.key_for(cache.request_for(key)) == key
+		assert cache.key_for(ensembl_metadata_pb2.GenomeUUIDRequest(genome_uuid="uuid-1")) == ("uuid-1", 0.0, ())
+
+	def test_byte_budget(self):
+		genome = make_genome("uuid-1")
+		cache = MessageCache("GetGenomeByUUID", max_bytes=cache_size(genome) * 3)
+		too_big = ensembl_metadata_pb2.Genome(genome_uuid="x" * cache.max_bytes)
+		assert not cache.put(("too-big",), too_big)
+		for i in range(3):
+			cache.put((f"uuid-{i}",), make_genome(f"uuid-{i}"))
+		assert len(cache) == 3
+		assert cache.size_bytes <= cache.max_bytes
+
+	def test_empty_responses(self):
+		# Responses to unknown UUIDs serialise to 0 bytes, but still take up memory
+		cache = MessageCache("GetGenomeByUUID", max_bytes=1000)
+		for i in range(1000):
+			cache.put((f"uuid-{i}",), ensembl_metadata_pb2.Genome())
+		assert 0 < len(cache) <= 1000 // MessageCache.ENTRY_OVERHEAD_BYTES
+		assert 0 < cache.size_bytes <= cache.max_bytes
+
+	def test_rejected_update_keeps_entry(self):
+		genome = make_genome("uuid-0")
+		cache = MessageCache("GetGenomeByUUID", max_bytes=cache_size(genome) * 2)
+		for key in (("uuid-0",), ("uuid-1",)):
+			cache.put(key, make_genome(key[0]))
+			for _ in range(5):
+				cache.get(key)
+		# A bigger value for uuid-1 would need uuid-0 to be evicted, which is requested as often
+		assert not cache.put(("uuid-1",), ensembl_metadata_pb2.Genome(genome_uuid="uuid-1" * 4))
+		assert cache.get(("uuid-1",)) == make_genome("uuid-1")
+		assert cache.size_bytes == cache_size(genome) * 2
+
+	def test_admission_protects_hot_entries(self):
+		genome = make_genome("uuid-0")
+		cache = MessageCache("GetGenomeByUUID", max_bytes=cache_size(genome) * 2)
+		for key in (("uuid-0",), ("uuid-1",)):
+			cache.put(key, make_genome(key[0]))
+			for _ in range(5):
+				cache.get(key)
+		# A one-off lookup must not evict the frequently requested entries
+		assert cache.get(("uuid-2",)) is None
+		assert not cache.put(("uuid-2",), make_genome("uuid-2"))
+		assert ("uuid-0",) in cache and ("uuid-1",) in cache
+		# but keys requested more often than the LRU entry get in
+		for _ in range(10):
+			cache.get(("uuid-2",))
+		assert cache.put(("uuid-2",), make_genome("uuid-2"))
+		assert ("uuid-0",) not in cache
+		assert cache.stats()["evicted"] == 1
+
+	def test_streaming_get_or_load(self):
+		cache = MessageCache("GetGenomesByKeyword", max_bytes=1024, key_fields=("keyword",), streaming=True)
+		calls = []
+
+		def loader():
+			calls.append(1)
+			yield make_genome("uuid-1")
+			yield make_genome("uuid-2")
+
+		for _ in range(2):
+			value = cache.get_or_load(("human",), loader)
+			assert value == (make_genome("uuid-1"), make_genome("uuid-2"))
+		assert len(calls) == 1
+
+	@pytest.mark.parametrize("drop", [
+		lambda cache: cache.clear(),
+		lambda cache: cache.invalidate(genome_uuid="uuid-2"),
+	])
+	def test_get_or_load_outdated(self, drop):
+		cache = MessageCache("GetGenomeByUUID", max_bytes=1024, key_fields=("genome_uuid",))
+
+		def loader():
+			# The caches are cleared (e.g. on a release change) or invalidated while the response is loaded
+			drop(cache)
+			return make_genome("uuid-1")
+
+		assert cache.get_or_load(("uuid-1",), loader) == make_genome("uuid-1")
+		assert ("uuid-1",) not in cache
+		assert cache.get_or_load(("uuid-1",), lambda: make_genome("uuid-1")) == make_genome("uuid-1")
+		assert ("uuid-1",) in cache
+
+
+def test_build_caches():
+	service = ensembl_metadata_pb2.DESCRIPTOR.services_by_name["EnsemblMetadata"]
+	caches = build_caches(
+		service, {"GetGenomeByUUID": 0.5, "GetGenomesByKeyword": 0.5}, 2048, ensembl_metadata_pb2
+	)
+	genome_cache = caches.get("GetGenomeByUUID")
+	assert genome_cache.max_bytes == 1024
+	assert genome_cache.key_fields == ("genome_uuid", "release_version", "read_mask")
+	assert genome_cache.message_class is ensembl_metadata_pb2.Genome
+	assert not genome_cache.streaming
+	assert caches.get("GetGenomesByKeyword").streaming
+
+	request = ensembl_metadata_pb2.GenomeByKeywordRequest(keyword="Human")
+	responses = caches.fetch("GetGenomesByKeyword", request, lambda: iter([make_genome("uuid-1")]))
+	assert list(responses) == [make_genome("uuid-1")]
+	caches = build_caches(service, {"GetGenomeByUUID": 1.0}, 0, ensembl_metadata_pb2)
+	assert caches.get("GetGenomeByUUID") is None
+
+
+class TestCacheSnapshot:
+	budgets = {"GetGenomeByUUID": 0.5, "GetGenomesByKeyword": 0.5}
+
+	def build(self):
+		service = ensembl_metadata_pb2.DESCRIPTOR.services_by_name["EnsemblMetadata"]
+		return build_caches(service, self.budgets, 4096, ensembl_metadata_pb2)
+
+	def test_round_trip(self, tmp_path):
+		path = str(tmp_path / "cache.jsonl")
+		caches = self.build()
+		caches.get("GetGenomeByUUID").put(("uuid-1", 108.0, ()), make_genome("uuid-1"))
+		caches.get("GetGenomesByKeyword").put(("human", 0.0, False), (make_genome("uuid-1"), make_genome("uuid-2")))
+		assert dump_caches(caches, path, "fingerprint-1") == 2
+
+		restored = self.build()
+		assert load_caches(restored, path, "fingerprint-1") == 2
+		assert restored.get("GetGenomeByUUID").get(("uuid-1", 108.0, ())) == make_genome("uuid-1")
+		assert restored.get("GetGenomesByKeyword").get(("human", 0.0, False)) == (
+			make_genome("uuid-1"), make_genome("uuid-2")
+		)
+
+	def test_fingerprint_mismatch(self, tmp_path):
+		path = str(tmp_path / "cache.jsonl")
+		caches = self.build()
+		caches.get("GetGenomeByUUID").put(("uuid-1", 108.0, ()), make_genome("uuid-1"))
+		dump_caches(caches, path, "fingerprint-1")
+		restored = self.build()
+		assert load_caches(restored, path, "fingerprint-2") == 0
+		assert len(restored.get("GetGenomeByUUID")) == 0
+
+	def test_outdated_keys(self, tmp_path):
+		path = str(tmp_path / "cache.jsonl")
+		caches = self.build()
+		caches.get("GetGenomeByUUID").put(("uuid-1", 108.0, ()), make_genome("uuid-1"))
+		caches.get("GetGenomesByKeyword").put(("human", 0.0, False), (make_genome("uuid-1"),))
+		dump_caches(caches, path, "fingerprint-1")
+		# File written before the fuzzy field was added to GenomeByKeywordRequest
+		header, *records = open(path, encoding="utf-8").read().splitlines()
+		header = json.loads(header)
+		header["key_fields"]["GetGenomesByKeyword"] = ["keyword", "release_version"]
+		open(path, "w", encoding="utf-8").write("\n".join([json.dumps(header)] + records) + "\n")
+		restored = self.build()
+		assert load_caches(restored, path, "fingerprint-1") == 1
+		assert restored.get("GetGenomeByUUID").get(("uuid-1", 108.0, ())) == make_genome("uuid-1")
+		assert len(restored.get("GetGenomesByKeyword")) == 0
+
+	def test_unsupported_version(self, tmp_path):
+		path = tmp_path / "cache.jsonl"
+		path.write_text('{"format": "ensembl-metadata-service-cache", "version": 1, "fingerprint": "f"}\n')
+		assert load_caches(self.build(), str(path), "f") == 0
+		assert load_caches(self.build(), str(tmp_path / "missing.jsonl"), "f") == 0
+
+
+class TestCacheWarmup:
+
+	def test_access_log(self, tmp_path):
+		access_log = AccessLog(sample_rate=1, max_keys=4)
+		for key, count in ((("uuid-1", 0.0), 3), (("uuid-2", 0.0), 2), (("uuid-3", 0.0), 1)):
+			for _ in range(count):
+				access_log.record("GetGenomeByUUID", key)
+		assert access_log.top("GetGenomeByUUID", 2) == [("uuid-1", 0.0), ("uuid-2", 0.0)]
+		assert access_log.top("GetGenomeUUID", 2) == []
+		# Going over max_keys keeps the most requested half
+		for i in range(4, 6):
+			access_log.record("GetGenomeByUUID", (f"uuid-{i}", 0.0))
+		assert access_log.top("GetGenomeByUUID", 10) == [("uuid-1", 0.0), ("uuid-2", 0.0)]
+
+		path = str(tmp_path / "access_log.json")
+		access_log.dump(path)
+		restored = AccessLog()
+		restored.load(path)
+		assert restored.top("GetGenomeByUUID", 10) == [("uuid-1", 0.0), ("uuid-2", 0.0)]
+
+	def test_prewarm(self):
+		class Servicer:
+			caches = build_caches(
+				ensembl_metadata_pb2.DESCRIPTOR.services_by_name["EnsemblMetadata"],
+				{"GetGenomeByUUID": 1.0}, 4096, ensembl_metadata_pb2
+			)
+
+			class db:
+				@staticmethod
+				def fetch_group_genome_uuids(group_code):
+					return ["uuid-2"]
+
+			def GetGenomeByUUID(self, request, context):
+				return self.caches.fetch("GetGenomeByUUID", request, lambda: make_genome(request.genome_uuid))
+
+		access_log = AccessLog(sample_rate=1)
+		access_log.record("GetGenomeByUUID", ("uuid-1", 108.0, ("assembly",)))
+		servicer = Servicer()
+		# The access log is attached to the caches once the server started, e.g. when rebuilding the caches
+		servicer.caches.access_log = access_log
+		assert prewarm(servicer, access_log) == 2
+		# Replayed requests are not recorded
+		assert access_log.top("GetGenomeByUUID", 10) == [("uuid-1", 108.0, ("assembly",))]
+		servicer.GetGenomeByUUID(ensembl_metadata_pb2.GenomeUUIDRequest(genome_uuid="uuid-3"), None)
+		assert access_log.top("GetGenomeByUUID", 10)[1] == ("uuid-3", 0.0, ())
+		cache = servicer.caches.get("GetGenomeByUUID")
+		assert ("uuid-1", 108.0, ("assembly",)) in cache
+		assert ("uuid-2", 0.0, ()) in cache
+
+
+class TestCacheInvalidation:
+
+	def build(self):
+		service = ensembl_metadata_pb2.DESCRIPTOR.services_by_name["EnsemblMetadata"]
+		budgets = {"GetGenomeByUUID": 0.5, "GetGenomesByKeyword": 0.25, "GetGenomeUUID": 0.25}
+		caches = build_caches(service, budgets, 8192, ensembl_metadata_pb2)
+		caches.get("GetGenomeByUUID").put(("uuid-1", 0.0, ()), make_genome("uuid-1"))
+		caches.get("GetGenomeByUUID").put(("uuid-1", 108.0, ()), make_genome("uuid-1"))
+		caches.get("GetGenomeByUUID").put(("uuid-2", 0.0, ()), make_genome("uuid-2"))
+		caches.get("GetGenomesByKeyword").put(("human", 0.0, False), (make_genome("uuid-1"), make_genome("uuid-3")))
+		caches.get("GetGenomesByKeyword").put(("mouse", 0.0, False), (make_genome("uuid-4"),))
+		caches.get("GetGenomeUUID").put(("homo_sapiens", "GRCh38", False),
+		                                ensembl_metadata_pb2.GenomeUUID(genome_uuid="uuid-1"))
+		return caches
+
+	def test_invalidate_genome(self):
+		caches = self.build()
+		# Keyed by genome_uuid, or holding the genome in the cached responses
+		assert caches.invalidate(genome_uuid="uuid-1") == 4
+		assert ("uuid-2", 0.0, ()) in caches.get("GetGenomeByUUID")
+		assert ("mouse", 0.0, False) in caches.get("GetGenomesByKeyword")
+
+	def test_invalidate_release(self):
+		caches = self.build()
+		assert caches.invalidate(["GetGenomeByUUID"], genome_uuid="uuid-1", release_version=108.0) == 1
+		assert ("uuid-1", 0.0, ()) in caches.get("GetGenomeByUUID")
+		# Caches not keyed by release version are dropped entirely
+		assert caches.invalidate(release_version=108.0) == 1
+		assert len(caches.get("GetGenomeUUID")) == 0
+		assert len(caches.get("GetGenomesByKeyword")) == 2
+
+
+def test_release_watcher():
+	class Adaptor:
+		fingerprint = "f1"
+
+		def fetch_release_fingerprint(self):
+			return self.fingerprint
+
+	adaptor = Adaptor()
+	changes = []
+	watcher = ReleaseWatcher(adaptor, 0, [changes.append])
+	assert not watcher.check()
+	assert not watcher.check()
+	adaptor.fingerprint = "f2"
+	assert watcher.check()
+	assert changes == ["f2"]
@@ -0,0 +1,66 @@
+# See the NOTICE file distributed with this work for additional information
+#   regarding copyright ownership.
+#   Licensed under the Apache License, Version 2.0 (the "License");
+#   you may not use this file except in compliance with the License.
+#   You may obtain a copy of the License at
+#       http://www.apache.org/licenses/LICENSE-2.0
+#   Unless required by applicable law or agreed to in writing, software
+#   distributed under the License is distributed on an "AS IS" BASIS,
+#   WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+#   See the License for the specific language governing permissions and
+#   limitations under the License.
+"""
+Unit tests for pagination.py
+"""
+import pytest
+
+from ensembl.production.metadata.grpc import ensembl_metadata_pb2
+from ensembl.production.metadata.grpc.config import MetadataConfig as cfg
+from ensembl.production.metadata.grpc.pagination import encode_page_token, is_paged, page_of, read_page
+
+
+def test_is_paged():
+	assert not is_paged(ensembl_metadata_pb2.ReleaseRequest(current_only=True))
+	assert is_paged(ensembl_metadata_pb2.ReleaseRequest(page_size=10))
+	assert is_paged(ensembl_metadata_pb2.ReleaseRequest(page_token="token"))
+
+
+def test_read_page():
+	assert read_page(ensembl_metadata_pb2.ReleaseRequest(page_size=10), int) == (10, None)
+	request = ensembl_metadata_pb2.ReleaseRequest(page_size=cfg.page_max_size + 1)
+	assert read_page(request, int) == (cfg.page_max_size, None)
+	request = ensembl_metadata_pb2.ReleaseRequest(site_name=["Ensembl"])
+	request.page_token = encode_page_token(request, 42)
+	# The page size may change from one page to the next
+	assert read_page(request, int) == (cfg.page_default_size, 42)
+
+
+@pytest.mark.parametrize(
+	"request_message",
+	[
+		ensembl_metadata_pb2.ReleaseRequest(page_size=-1),
+		ensembl_metadata_pb2.ReleaseRequest(page_token="rhubarb"),
+		# Token of another query, of another request type, or with a key of another type
+		ensembl_metadata_pb2.ReleaseRequest(
+			site_name=["Ensembl"], page_token=encode_page_token(ensembl_metadata_pb2.ReleaseRequest(), 42)
+		),
+		ensembl_metadata_pb2.AssemblyRegionRequest(
+			genome_uuid="uuid-1",
+			page_token=encode_page_token(ensembl_metadata_pb2.GenomeSequenceRequest(genome_uuid="uuid-1"), 42)
+		),
+		ensembl_metadata_pb2.GenomeSequenceRequest(
+			genome_uuid="uuid-1",
+			page_token=encode_page_token(ensembl_metadata_pb2.GenomeSequenceRequest(genome_uuid="uuid-1"), "42")
+		),
+	]
+)
+def test_read_page_invalid(request_message):
+	with pytest.raises(ValueError):
+		read_page(request_message, int)
+
+
+def test_page_of():
+	assert page_of(iter(range(4)), 3, lambda row: row * 10) == ([0, 1, 2], 20)
+	# Without the extra row, this is the last page
+	assert page_of(iter(range(3)), 3, lambda row: row * 10) == ([0, 1, 2], None)
+	assert page_of(iter([]), 3, lambda row: row * 10) == ([], None)
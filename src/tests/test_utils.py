@@ -19,6 +19,7 @@ import pkg_resources
 import pytest
 from ensembl.database import UnitTestDB
 from google.protobuf import json_format
+from google.protobuf.field_mask_pb2 import FieldMask
 
 from ensembl.production.metadata.grpc import ensembl_metadata_pb2, utils
 
@@ -703,6 +704,34 @@ class TestUtils:
 			))
 		assert json.loads(output) == expected_output
 
+	def test_genome_uuid_lookup_iterator(self, genome_db_conn):
+		lookups = [
+			ensembl_metadata_pb2.GenomeUUIDLookup(correlation_id="1", ensembl_name="homo_sapiens",
+												  assembly_name="GRCh38.p13"),
+			ensembl_metadata_pb2.GenomeUUIDLookup(correlation_id="2", ensembl_name="random_ensembl_name",
+												  assembly_name="random_assembly_name", use_default=True),
+			ensembl_metadata_pb2.GenomeUUIDLookup(correlation_id="3", ensembl_name="homo_sapiens",
+												  assembly_name="GRCh38", use_default=True),
+		]
+		output = [json.loads(json_format.MessageToJson(response)) for response in
+				  utils.genome_uuid_lookup_iterator(genome_db_conn, iter(lookups))]
+		assert output == [
+			{"correlationId": "1", "genomeUuid": "a7335667-93e7-11ec-a39d-005056b38ce3"},
+			{"correlationId": "2"},
+			{"correlationId": "3", "genomeUuid": "a7335667-93e7-11ec-a39d-005056b38ce3"},
+		]
+		# A lookup is answered before the next one is read
+		received = []
+
+		def stream():
+			for lookup in lookups:
+				received.append(lookup.correlation_id)
+				yield lookup
+
+		results = utils.genome_uuid_lookup_iterator(genome_db_conn, stream())
+		assert next(results).correlation_id == "1"
+		assert received == ["1"]
+
 	def test_get_genome_by_uuid(self, genome_db_conn):
 		output = json_format.MessageToJson(
 			utils.get_genome_by_uuid(
@@ -815,6 +844,32 @@ class TestUtils:
 		output = utils.get_genome_by_uuid(genome_db_conn, None, 0)
 		assert output == ensembl_metadata_pb2.Genome()
 
+	def test_get_genomes_by_uuids(self, genome_db_conn):
+		genome_uuids = [
+			"a73351f7-93e7-11ec-a39d-005056b38ce3",
+			"rhubarb",
+			"a7335667-93e7-11ec-a39d-005056b38ce3",
+			"a73351f7-93e7-11ec-a39d-005056b38ce3",
+		]
+		output = list(utils.get_genomes_by_uuids_iterator(genome_db_conn, genome_uuids, 108.0))
+		# One genome per UUID, in the request order, as returned by get_genome_by_uuid
+		expected_output = [
+			utils.get_genome_by_uuid(genome_db_conn, genome_uuid, 108.0) for genome_uuid in genome_uuids
+		]
+		assert output == expected_output
+		assert output[1] == ensembl_metadata_pb2.Genome()
+
+	def test_get_genomes_by_uuids_read_mask(self, genome_db_conn):
+		genome_uuids = ["a73351f7-93e7-11ec-a39d-005056b38ce3", "rhubarb"]
+		read_mask = FieldMask(paths=["assembly.name", "related_assemblies_count"])
+		output = list(utils.get_genomes_by_uuids_iterator(genome_db_conn, genome_uuids, 108.0, read_mask))
+		expected_output = [utils.get_genome_by_uuid(genome_db_conn, genome_uuid, 108.0, read_mask)
+						   for genome_uuid in genome_uuids]
+		assert output == expected_output
+
+	def test_get_genomes_by_uuids_null(self, genome_db_conn):
+		assert list(utils.get_genomes_by_uuids_iterator(genome_db_conn, [], 0)) == []
+
 	def test_get_genomes_by_keyword(self, genome_db_conn):
 		output = [json.loads(json_format.MessageToJson(response)) for response in
 				  utils.get_genomes_by_keyword_iterator(genome_db_conn, "Human", 108.0)]
@@ -987,6 +1042,67 @@ class TestUtils:
 												  1))
 		assert output == []
 
+	@pytest.mark.parametrize("fuzzy", [False, True])
+	def test_get_genomes_by_keyword_page(self, genome_db_conn, fuzzy):
+		# Pages are ordered by assembly accession
+		expected_output = sorted(
+			utils.get_genomes_by_keyword_iterator(genome_db_conn, "Homo sapiens", 0, fuzzy),
+			key=lambda genome: genome.assembly.accession
+		)
+		output = []
+		after_accession = None
+		while True:
+			page, after_accession = utils.get_genomes_by_keyword_page(
+				genome_db_conn, "Homo sapiens", 0, fuzzy, 1, after_accession
+			)
+			output.extend(page)
+			if after_accession is None:
+				break
+			assert page[-1].assembly.accession == after_accession
+		assert len(expected_output) > 1
+		assert output == expected_output
+		# A page resumes at the next accession, whether the last one is still matched or not
+		page, _ = utils.get_genomes_by_keyword_page(
+			genome_db_conn, "Homo sapiens", 0, fuzzy, 1000, "GCA_000000000.0"
+		)
+		assert page == expected_output
+		page, _ = utils.get_genomes_by_keyword_page(
+			genome_db_conn, "Homo sapiens", 0, fuzzy, 1000, "GCA_999999999.9"
+		)
+		assert page == []
+
+	def test_genome_sequence_page(self, genome_db_conn):
+		genome_uuid = "a7335667-93e7-11ec-a39d-005056b38ce3"
+		first_page, after_sequence_id = utils.genome_sequence_page(genome_db_conn, genome_uuid, False, 2, None)
+		assert len(first_page) == 2
+		next_page, _ = utils.genome_sequence_page(genome_db_conn, genome_uuid, False, 1000, after_sequence_id)
+		expected_output = list(utils.genome_sequence_iterator(genome_db_conn, genome_uuid, False))
+		# Pages are in assembly_sequence_id order
+		assert sorted(message.name for message in first_page + next_page) == \
+			sorted(message.name for message in expected_output)
+
+	@pytest.mark.parametrize("keyword", ["homo sapien", "GRCh38.p14", "HOMO SAPIENS"])
+	def test_get_genomes_by_keyword_fuzzy(self, genome_db_conn, keyword):
+		output = list(utils.get_genomes_by_keyword_iterator(genome_db_conn, keyword, 0, fuzzy=True))
+		assert output[0].genome_uuid == "a7335667-93e7-11ec-a39d-005056b38ce3"
+		assert not list(utils.get_genomes_by_keyword_iterator(genome_db_conn, "bigfoot", 0, fuzzy=True))
+
+	def test_get_genome_suggestions(self, genome_db_conn):
+		output = list(utils.get_genome_suggestions_iterator(genome_db_conn, "homo s", 0, 0))
+		assert len(output) > 0
+		# Human GRCh38 is a member of the popular group
+		assert output[0].genome_uuid == "a7335667-93e7-11ec-a39d-005056b38ce3"
+		assert all(genome.organism.scientific_name == "Homo sapiens" for genome in output)
+		assert len(output) == len({genome.genome_uuid for genome in output})
+
+	def test_get_genome_suggestions_limit(self, genome_db_conn):
+		output = list(utils.get_genome_suggestions_iterator(genome_db_conn, "GCA_", 2, 0))
+		assert len(output) == 2
+
+	def test_get_genome_suggestions_no_matches(self, genome_db_conn):
+		assert list(utils.get_genome_suggestions_iterator(genome_db_conn, "bigfoot", 0, 0)) == []
+		assert list(utils.get_genome_suggestions_iterator(genome_db_conn, "", 0, 0)) == []
+
 	def test_get_genomes_by_name(self, genome_db_conn):
 		output = json_format.MessageToJson(utils.get_genome_by_name(
 			db_conn=genome_db_conn,
@@ -1041,6 +1157,33 @@ class TestUtils:
 		}
 		assert json.loads(output) == expected_output
 
+	def test_get_genomes_by_name_read_mask(self, genome_db_conn):
+		# Only the fields of the mask are returned, the others are not even fetched
+		output = json_format.MessageToJson(utils.get_genome_by_name(
+			db_conn=genome_db_conn,
+			site_name="Ensembl",
+			ensembl_name="Triticum_aestivum",
+			release_version=108.0,
+			read_mask=FieldMask(paths=["assembly.name", "taxon.alternative_names", "related_assemblies_count"])
+		))
+		expected_output = {
+			"assembly": {
+				"name": "IWGSC"
+			},
+			"relatedAssembliesCount": 1,
+			"taxon": {
+				"alternativeNames": [
+					"Canadian hard winter wheat",
+					"Triticum aestivum subsp. aestivum",
+					"Triticum vulgare",
+					"bread wheat",
+					"common wheat",
+					"wheat"
+				]
+			}
+		}
+		assert json.loads(output) == expected_output
+
 	def test_get_genomes_by_name_release_unspecified(self, genome_db_conn):
 		# We are expecting the same result as test_get_genomes_by_name() above
 		# because no release is specified get_genome_by_name() -> fetch_genomes